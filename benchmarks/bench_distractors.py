@@ -0,0 +1,73 @@
+"""
+Time numeric distractor generation and check option quality.
+
+Compares the vectorized error-model engine with the previous per-question loop
+(fixed multipliers 0.9 / 1.1 / 1.2, two decimals) on a mix of whole-number,
+decimal, small and negative answers.
+
+Usage:
+    pip install -e . && python benchmarks/bench_distractors.py
+"""
+
+import time
+
+import numpy as np
+
+from educhain.utils.distractors import generate_numeric_distractors, numeric_distractors
+
+
+def make_answers(n, seed=0):
+    rng = np.random.default_rng(seed)
+    answers = rng.uniform(-500, 5000, n)
+    answers[::2] = np.round(answers[::2])                 # whole-number answers
+    answers[1::5] = rng.integers(0, 10, len(answers[1::5]))  # small counts
+    answers[3::7] = np.round(rng.uniform(0, 1, len(answers[3::7])), 2)  # probabilities
+    return answers
+
+
+def multiplier_loop(answers):
+    options = []
+    for answer in answers:
+        correct = f"{answer:.2f}"
+        options.append((correct, [f"{answer * var:.2f}" for var in (0.9, 1.1, 1.2)]))
+    return options
+
+
+def best_of(function, *args, repeats=5):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def collision_rate(option_sets):
+    bad = sum(1 for correct, wrong in option_sets if len(set(wrong) | {correct}) < len(wrong) + 1)
+    return bad / len(option_sets)
+
+
+def check_answer_formatting():
+    """The correct option must read like the baseline "%.2f" unless the answer really is whole."""
+    expected = {123456.7: "123456.70", 2500.02: "2500.02", 99.999: "100.00", 360.0: "360", 3 - 1e-12: "3"}
+    formatted = [answer for answer, _ in generate_numeric_distractors(list(expected), seed=0)]
+    assert formatted == list(expected.values()), formatted
+    distractors, _ = numeric_distractors([float("inf"), float("nan"), 5.0], seed=0)
+    assert np.isnan(distractors[:2]).all() and np.isfinite(distractors[2]).all()
+    # Rows topped up outside the vectorized pass keep the non-negative rule too
+    for seed in range(50):
+        for _, wrong in generate_numeric_distractors([0.001, 0, 1e-5], seed=seed):
+            assert not any(option.startswith("-") for option in wrong), wrong
+
+
+if __name__ == "__main__":
+    check_answer_formatting()
+    for n in (1_000, 100_000):
+        answers = make_answers(n)
+        numeric_time, _ = best_of(numeric_distractors, answers)
+        formatted_time, vectorized = best_of(generate_numeric_distractors, answers)
+        loop_time, looped = best_of(multiplier_loop, answers)
+        print(f"{n:>7} answers")
+        print(f"  multiplier loop        {loop_time * 1e3:8.2f} ms   collisions {collision_rate(looped):.1%}")
+        print(f"  vectorized (numbers)   {numeric_time * 1e3:8.2f} ms")
+        print(f"  vectorized (formatted) {formatted_time * 1e3:8.2f} ms   collisions {collision_rate(vectorized):.1%}")
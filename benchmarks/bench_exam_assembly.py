@@ -0,0 +1,61 @@
+"""
+Time exam assembly from a 100k-question bank.
+
+Builds a synthetic bank shaped like ``bulk_generate_questions`` output (20 topics x 10
+subtopics, skewed difficulty, four question types), then assembles exams under topic,
+subtopic, difficulty-mix, question-type and no-repeat constraints.
+
+Usage:
+    pip install -e . && python benchmarks/bench_exam_assembly.py
+"""
+
+import time
+
+import numpy as np
+
+from educhain.utils.exam_assembly import QuestionBank
+
+
+def make_records(n, seed=0):
+    rng = np.random.default_rng(seed)
+    topics = rng.integers(0, 20, n)
+    subtopics = rng.integers(0, 10, n)
+    difficulties = rng.choice(["easy", "medium", "hard"], n, p=[0.5, 0.4, 0.1])
+    kinds = rng.choice(["Multiple Choice", "Short Answer", "True/False", "Fill in the Blank"], n, p=[0.5, 0.2, 0.2, 0.1])
+    return [
+        {
+            "question": f"Question {i}",
+            "difficulty": difficulty,
+            "question_type": kind,
+            "metadata": {"topic": f"Topic {topic}", "subtopic": f"Topic {topic}.{subtopic}"}
+        }
+        for i, (topic, subtopic, difficulty, kind) in enumerate(zip(topics, subtopics, difficulties, kinds))
+    ]
+
+
+if __name__ == "__main__":
+    records = make_records(100_000)
+    start = time.perf_counter()
+    bank = QuestionBank(records)
+    print(f"load {len(bank):,} questions        {time.perf_counter() - start:8.2f} s")
+
+    blueprints = {
+        "no constraints": {},
+        "topics + difficulty": {
+            "topic_counts": {f"Topic {i}": 5 for i in range(8)},
+            "difficulty_mix": {"easy": 0.3, "medium": 0.4, "hard": 0.3}
+        },
+        "full blueprint": {
+            "topic_counts": {f"Topic {i}": 5 for i in range(8)},
+            "subtopic_counts": {"Topic 1.1": 3, "Topic 9.2": 4},
+            "difficulty_mix": {"easy": 0.3, "medium": 0.4, "hard": 0.3},
+            "question_types": {"Multiple Choice": 0.5, "True/False": 0.2, "Short Answer": 0.3},
+            "no_repeat_exams": 5
+        }
+    }
+    for name, blueprint in blueprints.items():
+        times = []
+        for seed in range(10):
+            exam = bank.assemble(50, seed=seed, **blueprint)
+            times.append(exam.elapsed_seconds)
+        print(f"  {name:<22} {np.median(times) * 1e3:8.1f} ms   unmet: {exam.unmet or 'none'}")
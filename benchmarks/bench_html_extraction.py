@@ -0,0 +1,121 @@
+"""
+Compare HTML extractors on a synthetic fixture corpus.
+
+Each fixture page mimics a real article layout: a navigation bar with many links,
+a cookie banner, inline scripts and styles, a sidebar, a footer and the article
+body itself. Reports mean extraction time and prompt tokens per page.
+
+Usage:
+    pip install -e . && python benchmarks/bench_html_extraction.py
+"""
+
+import random
+import time
+
+from educhain.utils.html_extractors import FullTextExtractor, MainContentExtractor
+
+WORDS = (
+    "photosynthesis energy light chlorophyll plant cell glucose oxygen carbon dioxide "
+    "reaction process leaf water sunlight molecule enzyme membrane structure function "
+    "experiment result measure rate temperature factor limiting study evidence theory"
+).split()
+
+
+def _sentence(rng, n_words=18):
+    words = [rng.choice(WORDS) for _ in range(n_words)]
+    return " ".join(words).capitalize() + ", " + " ".join(rng.choice(WORDS) for _ in range(6)) + "."
+
+
+def _paragraph(rng, n_sentences=5):
+    return " ".join(_sentence(rng) for _ in range(n_sentences))
+
+
+def _boilerplate(rng):
+    nav_links = "".join(f'<li><a href="/section/{i}">Section {rng.choice(WORDS)} {i}</a></li>' for i in range(60))
+    script = "<script>window.dataLayer=window.dataLayer||[];" + "function track(e){console.log(e)}" * 40 + "</script>"
+    style = "<style>" + ".btn{color:#333;padding:4px 8px;margin:0 2px}" * 60 + "</style>"
+    cookie = ('<div class="cookie-consent">We use cookies to improve your experience. By continuing to browse '
+              'you agree to our use of cookies. <a href="/privacy">Privacy policy</a> <button>Accept all</button></div>')
+    sidebar = "".join(f'<div class="related-item"><a href="/post/{i}">{_sentence(rng, 8)}</a></div>' for i in range(15))
+    footer = "<footer>" + "".join(f'<a href="/f/{i}">Footer link {i}</a> ' for i in range(40)) + "<p>Copyright 2024 Example Media. All rights reserved.</p></footer>"
+    return nav_links, script, style, cookie, sidebar, footer
+
+
+def semantic_page(rng, n_paragraphs):
+    nav, script, style, cookie, sidebar, footer = _boilerplate(rng)
+    body = "".join(f"<h2>{_sentence(rng, 5)}</h2><p>{_paragraph(rng)}</p>" for _ in range(n_paragraphs))
+    return (f"<html><head>{style}{script}</head><body>{cookie}<header><nav><ul>{nav}</ul></nav></header>"
+            f"<main><article><h1>{_sentence(rng, 7)}</h1>{body}</article></main>"
+            f'<aside class="sidebar">{sidebar}</aside>{footer}{script}</body></html>')
+
+
+def div_soup_page(rng, n_paragraphs):
+    nav, script, style, cookie, sidebar, footer = _boilerplate(rng)
+    body = "".join(f"<p>{_paragraph(rng)}</p>" for _ in range(n_paragraphs))
+    return (f"<html><head>{style}</head><body>{cookie}<div id=\"top-menu\"><ul>{nav}</ul></div>"
+            f'<div class="wrapper"><div class="post-body"><h1>{_sentence(rng, 7)}</h1>{body}</div>'
+            f'<div class="widget-area">{sidebar}</div></div><div class="site-footer">{footer}</div>{script}</body></html>')
+
+
+PAGE_SIZES = {"short": 5, "medium": 20, "long": 80}
+
+
+def build_corpus(seed=0):
+    """Return a list of (size_label, html) pairs."""
+    rng = random.Random(seed)
+    corpus = []
+    for label, n_paragraphs in PAGE_SIZES.items():
+        for _ in range(4):
+            corpus.append((label, semantic_page(rng, n_paragraphs)))
+            corpus.append((label, div_soup_page(rng, n_paragraphs)))
+    return corpus
+
+
+def _token_counter():
+    try:
+        import tiktoken
+        encoding = tiktoken.get_encoding("cl100k_base")
+        return (lambda text: len(encoding.encode(text))), "tiktoken cl100k_base"
+    except Exception:
+        return (lambda text: len(text) // 4), "chars / 4 estimate"
+
+
+def run(extractor, pages, repeats=3):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        outputs = [extractor.extract(page) for page in pages]
+    elapsed = (time.perf_counter() - start) / (repeats * len(pages))
+    return elapsed, outputs
+
+
+if __name__ == "__main__":
+    corpus = build_corpus()
+    labels = [label for label, _ in corpus]
+    pages = [page for _, page in corpus]
+    count_tokens, token_method = _token_counter()
+    total_kb = sum(len(page) for page in pages) / 1024
+    print(f"Corpus: {len(pages)} pages, {total_kb:.0f} KB of HTML; tokens counted with {token_method}\n")
+
+    extractors = [
+        ("FullTextExtractor(html.parser)", FullTextExtractor()),
+        ("MainContentExtractor(html.parser)", MainContentExtractor(parser="html.parser")),
+    ]
+    try:
+        import lxml  # noqa: F401
+        extractors.append(("MainContentExtractor(lxml)", MainContentExtractor(parser="lxml")))
+    except ImportError:
+        print("lxml not installed; skipping the lxml backend\n")
+
+    header = f"{'extractor':<36}{'ms/page':>10}" + "".join(f"{label + ' tok':>14}" for label in PAGE_SIZES)
+    print(header)
+    baseline = None
+    for name, extractor in extractors:
+        elapsed, outputs = run(extractor, pages)
+        tokens = {
+            label: sum(count_tokens(text) for l, text in zip(labels, outputs) if l == label) / labels.count(label)
+            for label in PAGE_SIZES
+        }
+        if baseline is None:
+            baseline = tokens
+        cells = "".join(f"{tokens[label]:>8.0f} ({1 - tokens[label] / baseline[label]:>3.0%})" for label in PAGE_SIZES)
+        print(f"{name:<36}{elapsed * 1000:>10.2f}{cells}")
@@ -0,0 +1,76 @@
+"""
+Time the spaced-repetition scheduler at 10M card-states.
+
+Enrolls 100k learners in a 100-card deck, then measures bulk review ingestion,
+single reviews and next-card selection, against a baseline that scans the learner's
+cards for the earliest due date (a per-learner linear scan, which is the best case for
+scanning: a global scan over all states is far slower).
+
+Usage:
+    pip install -e . && python benchmarks/bench_spaced_repetition.py
+"""
+
+import time
+
+import numpy as np
+
+from educhain.utils.spaced_repetition import SpacedRepetitionScheduler
+
+LEARNERS = 100_000
+DECK_SIZE = 100
+START = 1_700_000_000
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def scan_next_card(scheduler, enrollment, now):
+    base = int(scheduler._base[enrollment])
+    due = scheduler.due[base:base + DECK_SIZE]
+    card = int(np.argmin(due))
+    return card if due[card] <= now else None
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    scheduler = SpacedRepetitionScheduler(capacity=LEARNERS * DECK_SIZE)
+
+    elapsed, _ = timed(scheduler.enroll_many, range(LEARNERS), DECK_SIZE, deck_id="deck", start=START)
+    print(f"{scheduler.num_states:,} card-states, {scheduler.nbytes / 1e6:.0f} MB "
+          f"({scheduler.nbytes / scheduler.num_states:.1f} bytes/state)")
+    print(f"  enroll {LEARNERS:,} learners     {elapsed:8.2f} s")
+
+    n = 1_000_000
+    learners = rng.integers(0, LEARNERS, n)
+    cards = rng.integers(0, DECK_SIZE, n)
+    qualities = rng.integers(0, 6, n)
+    times = START + rng.integers(0, 30 * 86400, n)
+    elapsed, _ = timed(scheduler.review_many, learners, None, cards, qualities, times)
+    print(f"  review_many {n:,} reviews   {elapsed:8.2f} s   ({n / elapsed:,.0f} reviews/s)")
+
+    now = START + 60 * 86400
+    sample = rng.integers(0, LEARNERS, 10_000)
+    elapsed, _ = timed(lambda: [scheduler.next_cards(int(e), k=1, now=now) for e in sample])
+    print(f"  next_cards k=1               {elapsed / len(sample) * 1e6:8.1f} us")
+    elapsed, _ = timed(lambda: [scheduler.next_cards(int(e), k=10, now=now) for e in sample])
+    print(f"  next_cards k=10              {elapsed / len(sample) * 1e6:8.1f} us")
+    elapsed, _ = timed(lambda: [scan_next_card(scheduler, int(e), now) for e in sample])
+    print(f"  per-learner scan (baseline)  {elapsed / len(sample) * 1e6:8.1f} us")
+    elapsed, _ = timed(lambda: [np.argmin(scheduler.due[:scheduler.num_states]) for _ in range(10)])
+    print(f"  global scan (baseline)       {elapsed / 10 * 1e6:8.1f} us")
+
+    def review_loop():
+        for e in sample:
+            card = scheduler.next_cards(int(e), k=1, now=now)
+            if card:
+                scheduler.review(int(e), None, card[0], 4, reviewed_at=now)
+    elapsed, _ = timed(review_loop)
+    print(f"  next + review                {elapsed / len(sample) * 1e6:8.1f} us")
+
+    for e in sample[:100]:
+        base = int(scheduler._base[e])
+        heap, due = scheduler.heap[base:base + DECK_SIZE], scheduler.due[base:base + DECK_SIZE]
+        assert all(due[heap[(i - 1) // 2]] <= due[heap[i]] for i in range(1, DECK_SIZE))
@@ -0,0 +1,124 @@
+"""
+Charts per second for visual-question rendering.
+
+Renders a fixed mix of bar, line, pie, scatter and table GraphInstructions with:
+  - the previous stateful pyplot path (plt.figure / plt.savefig / plt.close)
+  - render_graph, the headless object-oriented Agg renderer, in-process
+  - render_graphs, the same renderer in a process pool
+Tables are compared against the dataframe_image export they used to go through.
+
+Also compares the storage needed for a bank whose questions reuse some charts:
+inline base64 PNGs at 10x8 inches versus a ChartAssetStore of SVG files.
+
+Usage:
+    pip install -e . && python benchmarks/bench_visual_rendering.py [num_charts]
+"""
+
+import base64
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from educhain.utils.table_renderer import render_table_html
+from educhain.utils.visual_renderer import ChartAssetStore, render_graph, render_graphs
+
+CHART_TYPES = ("bar", "line", "pie", "scatter", "table")
+
+
+def make_instruction(chart_type, rng):
+    labels = [f"Item {i}" for i in range(6)]
+    if chart_type == "bar":
+        return {"type": "bar", "x_labels": labels, "y_values": [rng.randint(5, 50) for _ in labels],
+                "y_label": "Count", "title": "Items sold"}
+    if chart_type == "line":
+        return {"type": "line", "x_labels": labels, "y_values": [[rng.randint(0, 30) for _ in labels] for _ in range(2)],
+                "labels": ["2023", "2024"], "y_label": "Sales", "title": "Monthly sales"}
+    if chart_type == "pie":
+        return {"type": "pie", "labels": labels[:4], "sizes": [rng.randint(10, 40) for _ in range(4)], "title": "Market share"}
+    if chart_type == "scatter":
+        return {"type": "scatter", "x_values": [rng.random() * 10 for _ in range(40)],
+                "y_values": [rng.random() * 10 for _ in range(40)], "y_label": "Score", "title": "Study time vs score"}
+    return {"type": "table", "title": "Results",
+            "data": [{"Student": f"S{i}", "Math": rng.randint(40, 100), "Science": rng.randint(40, 100)} for i in range(8)]}
+
+
+def legacy_pyplot(instruction):
+    """The rendering steps generate_visual_questions used before the headless renderer."""
+    if instruction["type"] == "table":
+        import pandas as pd
+        import dataframe_image as dfi
+        buffer = io.BytesIO()
+        dfi.export(pd.DataFrame(instruction["data"]), buffer, table_conversion="matplotlib")
+        return buffer.getvalue()
+
+    plt.figure(figsize=(10, 8))
+    buffer = io.BytesIO()
+    if instruction["type"] == "bar":
+        plt.bar(instruction["x_labels"], instruction["y_values"], color="skyblue")
+    elif instruction["type"] == "line":
+        for i, y_vals in enumerate(instruction["y_values"]):
+            plt.plot(instruction["x_labels"], y_vals, marker="o", linestyle="-", label=instruction["labels"][i])
+        plt.legend()
+    elif instruction["type"] == "pie":
+        plt.pie(instruction["sizes"], labels=instruction["labels"], autopct="%1.1f%%", startangle=90, colors=plt.cm.Paired.colors)
+    elif instruction["type"] == "scatter":
+        plt.scatter(instruction["x_values"], instruction["y_values"], color="r", alpha=0.7)
+    plt.title(instruction["title"], fontsize=14)
+    plt.tight_layout()
+    plt.savefig(buffer, format="png")
+    plt.close()
+    return buffer.getvalue()
+
+
+def timed(label, function, count):
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40}{count / elapsed:>10.1f} charts/s")
+
+
+if __name__ == "__main__":
+    num_charts = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    rng = random.Random(0)
+    instructions = [make_instruction(CHART_TYPES[i % len(CHART_TYPES)], rng) for i in range(num_charts)]
+    charts = [i for i in instructions if i["type"] != "table"]
+    tables = [i for i in instructions if i["type"] == "table"]
+    workers = os.cpu_count() or 1
+    print(f"{len(charts)} charts + {len(tables)} tables, {workers} CPU(s)\n")
+
+    # Warm up font caches so the first timed run is not penalised
+    render_graph(instructions[0])
+    legacy_pyplot(instructions[0])
+
+    print("Charts (bar, line, pie, scatter)")
+    timed("  pyplot, serial", lambda: [legacy_pyplot(i) for i in charts], len(charts))
+    timed("  render_graph, serial", lambda: [render_graph(i, use_cache=False) for i in charts], len(charts))
+    timed(f"  render_graphs, {workers} processes", lambda: render_graphs(charts, max_workers=workers), len(charts))
+
+    print("\nTables")
+    try:
+        import dataframe_image  # noqa: F401
+        timed("  dataframe_image (matplotlib), serial", lambda: [legacy_pyplot(i) for i in tables], len(tables))
+    except ImportError:
+        print("  dataframe_image not installed; skipping the previous table path")
+    timed("  native png, serial", lambda: [render_graph(i, use_cache=False) for i in tables], len(tables))
+    timed("  native svg, serial", lambda: [render_graph(i, format="svg", use_cache=False) for i in tables], len(tables))
+    timed("  html, serial", lambda: [render_table_html(i["data"], i["title"]) for i in tables], len(tables))
+
+    print("\nStorage for a 40-question bank where every chart is used twice")
+    bank = [i for i in instructions if i["type"] != "table"][:20] * 2
+    inline = sum(len(base64.b64encode(render_graph(i))) for i in bank)
+    with tempfile.TemporaryDirectory() as root:
+        store = ChartAssetStore(root, format="svg")
+        store.put_many(bank, max_workers=1)
+        stored = sum(path.stat().st_size for path in Path(root).rglob("*.svg"))
+    print(f"  inline base64 png (10x8 in)         {inline / 1024:>10.0f} KB")
+    print(f"  ChartAssetStore svg (6x4.5 in)      {stored / 1024:>10.0f} KB  ({inline / stored:.0f}x smaller)")
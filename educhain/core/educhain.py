@@ -2,6 +2,8 @@
 from educhain.core.config import LLMConfig
 from educhain.engines.qna_engine import QnAEngine
 from educhain.engines.content_engine import ContentEngine
+from educhain.engines.pipeline import ContentPipeline
+from educhain.engines.adaptive_quiz import AdaptiveQuizEngine
 
 class Educhain:
     def __init__(self, config: Optional[LLMConfig] = None):
@@ -21,6 +23,14 @@ def get_qna_engine(self) -> QnAEngine:
     def get_content_engine(self) -> ContentEngine:
         return self.content_engine
 
+    def get_content_pipeline(self) -> ContentPipeline:
+        """Lesson plan -> study guide -> flashcards (+ quiz) pipeline sharing this client's engines."""
+        return ContentPipeline.standard(self)
+
+    def get_adaptive_quiz(self, bank: Optional[Any] = None, **kwargs) -> AdaptiveQuizEngine:
+        """Adaptive quiz engine using this client's QnAEngine; ``bank`` is a QuestionBank or bulk CSV/JSON path."""
+        return AdaptiveQuizEngine.from_client(self, bank=bank, **kwargs)
+
     def get_config(self) -> LLMConfig:
         return self.llm_config
 
@@ -1,2 +1,5 @@
 from .qna_engine import QnAEngine
-from .content_engine import ContentEngine
\ No newline at end of file
+from .content_engine import ContentEngine
+from .pedagogy_registry import Pedagogy, register_pedagogy, unregister_pedagogy, get_pedagogy, list_pedagogies
+from .pipeline import ContentPipeline, StageContext, summarize_output
+from .adaptive_quiz import AdaptiveQuizEngine, QuizSession
@@ -0,0 +1,412 @@
+# educhain/engines/adaptive_quiz.py
+
+import concurrent.futures
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+
+from educhain.core.config import LLMConfig
+from educhain.engines.qna_engine import QnAEngine, QuestionType
+from educhain.models.quiz_models import QuizQuestion, QuizResponse, AnswerFeedback, QuizReport
+from educhain.utils.exam_assembly import QuestionBank
+
+DIFFICULTY_LEVELS = ("easy", "medium", "hard")
+RECENT_QUESTIONS_IN_PROMPT = 10
+
+
+def to_quiz_question(
+    question: Any,
+    difficulty: str,
+    source: str = "generated",
+    bank_index: Optional[int] = None
+) -> QuizQuestion:
+    """QuizQuestion from a generated question model or a bank record (bulk CSV/JSON row)."""
+    record = question.dict() if hasattr(question, "dict") else dict(question)
+    options = record.get("options") or []
+    answer = record.get("answer")
+
+    if options and isinstance(options[0], dict):  # bulk MCQs: [{"text": ..., "correct": "true"}, ...]
+        texts = [str(option.get("text", "")) for option in options]
+        if answer is None:
+            answer = next((text for text, option in zip(texts, options)
+                           if str(option.get("correct")).lower() == "true"), "")
+        options = texts
+    if not options and (isinstance(answer, bool) or str(answer).strip().lower() in ("true", "false")):
+        answer = str(answer).strip().capitalize()
+        options = ["True", "False"]
+
+    answer = "" if answer is None else str(answer)
+    options = [str(option) for option in options]
+    # Some models answer with the option letter instead of the option text
+    if options and answer not in options and len(answer) == 1 and answer.isalpha() \
+            and ord(answer.upper()) - 65 < len(options):
+        answer = options[ord(answer.upper()) - 65]
+
+    return QuizQuestion(
+        question=str(record.get("question", "")),
+        options=options,
+        answer=answer,
+        explanation=record.get("explanation"),
+        difficulty=difficulty,
+        source=source,
+        bank_index=bank_index
+    )
+
+
+class QuizSession:
+    """In-memory state of one learner's adaptive quiz."""
+
+    def __init__(
+        self,
+        session_id: str,
+        topic: str,
+        num_questions: int,
+        level: int,
+        custom_instructions: Optional[str] = None,
+        bank_topics: Optional[List[str]] = None
+    ):
+        self.session_id = session_id
+        self.topic = topic
+        self.num_questions = num_questions
+        self.level = level
+        self.custom_instructions = custom_instructions
+        self.bank_topics = bank_topics
+        self.current: Optional[QuizQuestion] = None
+        self.error: Optional[str] = None
+        self.history: List[QuizResponse] = []
+        # Next question per difficulty level, fetched while the learner answers
+        self.prefetched: Dict[str, concurrent.futures.Future] = {}
+        self.bank_used: List[int] = []
+        self.waits: List[float] = []
+        self.started_at = time.time()
+        self.lock = threading.Lock()
+
+    @property
+    def score(self) -> int:
+        return sum(entry.correct for entry in self.history)
+
+    @property
+    def answered(self) -> int:
+        return len(self.history)
+
+    @property
+    def finished(self) -> bool:
+        return self.current is None
+
+
+class AdaptiveQuizEngine:
+    """
+    Adaptive quizzes with near-zero waits between questions.
+
+    A correct answer moves the learner one difficulty level up, an incorrect one a level
+    down. As soon as a question is shown, the next question for both outcomes is fetched in
+    the background, so answering only picks the branch that is already ready (or nearly so);
+    the other branch is discarded.
+    Questions come from a QuestionBank first (e.g. ``bulk_generate_questions`` output) and
+    are generated by the LLM only when the bank has nothing suitable left.
+
+    Example:
+        quiz = AdaptiveQuizEngine.from_client(client, bank="questions_20250101_120000.csv")
+        session = quiz.start_session("Photosynthesis", num_questions=10)
+        session.current.show()
+        feedback = quiz.submit_answer(session, "B")
+        ...
+        quiz.end_session(session).show()
+    """
+
+    def __init__(
+        self,
+        qna_engine: Optional[QnAEngine] = None,
+        llm_config: Optional[LLMConfig] = None,
+        bank: Optional[Union[QuestionBank, str]] = None,
+        question_type: QuestionType = "Multiple Choice",
+        difficulty_levels: Sequence[str] = DIFFICULTY_LEVELS,
+        max_workers: int = 8
+    ):
+        """
+        Args:
+            qna_engine: Engine used to generate questions the bank cannot supply
+            llm_config: Config for a new QnAEngine when ``qna_engine`` is not given
+            bank: QuestionBank, or a path to a bulk-generated CSV/JSON file
+            question_type: Type of question served (bank questions are filtered to it)
+            difficulty_levels: Ordered levels, easiest first; they should match the bank's difficulties
+            max_workers: Concurrent background generations across all sessions
+        """
+        self.qna_engine = qna_engine or QnAEngine(llm_config)
+        if isinstance(bank, str):
+            bank = QuestionBank.from_json(bank) if bank.lower().endswith(".json") else QuestionBank.from_csv(bank)
+        self.bank = bank
+        self.question_type = question_type
+        self.levels = [str(level).strip().lower() for level in difficulty_levels]
+        self.sessions: Dict[str, QuizSession] = {}
+        self._executor = ContextThreadPoolExecutor(max_workers=max_workers)
+        self._bank_lock = threading.Lock()
+        self._rng = np.random.default_rng()
+
+    @classmethod
+    def from_client(cls, client: Any, bank: Optional[Union[QuestionBank, str]] = None, **kwargs) -> "AdaptiveQuizEngine":
+        """Quiz engine sharing the QnAEngine of an Educhain client."""
+        return cls(qna_engine=client.qna_engine, bank=bank, **kwargs)
+
+    def start_session(
+        self,
+        topic: str,
+        num_questions: int = 5,
+        difficulty: str = "medium",
+        custom_instructions: Optional[str] = None,
+        bank_topics: Optional[List[str]] = None,
+        session_id: Optional[str] = None
+    ) -> QuizSession:
+        """
+        Start a quiz and fetch its first question (``session.current``).
+
+        Args:
+            topic: Quiz topic, used for generated questions
+            num_questions: Questions in the quiz
+            difficulty: Starting difficulty level
+            custom_instructions: Extra instructions for generated questions
+            bank_topics: Bank topics to draw from; defaults to ``topic`` if the bank has it,
+                otherwise the whole bank
+            session_id: Id to store the session under; a random one by default
+        """
+        difficulty = str(difficulty).strip().lower()
+        if difficulty not in self.levels:
+            raise ValueError(f"Unknown difficulty '{difficulty}'. Available levels: {self.levels}")
+        if bank_topics is None and self.bank is not None and topic in self.bank.topics():
+            bank_topics = [topic]
+
+        session = QuizSession(
+            session_id or uuid.uuid4().hex, topic, num_questions,
+            self.levels.index(difficulty), custom_instructions, bank_topics
+        )
+        start = time.perf_counter()
+        try:
+            session.current = self._next_question(session, difficulty, None)
+        except ValueError as e:
+            raise ValueError(f"Could not get a question for '{topic}': {e}") from None
+        session.waits.append(time.perf_counter() - start)
+        self.sessions[session.session_id] = session
+        self._prefetch(session)
+        return session
+
+    def get_session(self, session_id: str) -> QuizSession:
+        try:
+            return self.sessions[session_id]
+        except KeyError:
+            raise ValueError(f"Unknown quiz session '{session_id}'") from None
+
+    def submit_answer(
+        self,
+        session: Union[QuizSession, str],
+        response: Any,
+        correct: Optional[bool] = None
+    ) -> AnswerFeedback:
+        """
+        Record an answer to the current question and move on to the next one.
+
+        Args:
+            session: The session or its id
+            response: The learner's answer (option text, letter or number for multiple choice)
+            correct: Override the automatic check, e.g. for free-text answers graded elsewhere
+
+        Returns:
+            AnswerFeedback with the next question (None once the quiz is over). If no question
+            could be obtained, ``error`` says why and the session stops early. Either way a
+            session without a next question is dropped from memory; ``report`` and
+            ``end_session`` still accept the session object.
+        """
+        session = self.get_session(session) if isinstance(session, str) else session
+        with session.lock:
+            question = session.current
+            if question is None:
+                raise ValueError(f"This quiz session stopped early: {session.error}" if session.error
+                                 else "This quiz session is finished")
+            correct = question.is_correct(response) if correct is None else bool(correct)
+            session.history.append(QuizResponse(
+                number=session.answered + 1,
+                question=question,
+                response=str(response),
+                correct=correct,
+                wait_seconds=session.waits[-1]
+            ))
+            session.level = self._step(session.level, correct)
+
+            start = time.perf_counter()
+            next_question = None
+            if session.answered < session.num_questions:
+                try:
+                    next_question = self._next_question(session, self.levels[session.level], correct)
+                    session.level = self.levels.index(next_question.difficulty)
+                except ValueError as e:
+                    session.error = str(e)
+            wait = time.perf_counter() - start
+
+            session.current = next_question
+            self._cancel_prefetch(session)
+            if next_question is not None:
+                session.waits.append(wait)
+                self._prefetch(session)
+            else:
+                self.sessions.pop(session.session_id, None)
+
+            return AnswerFeedback(
+                correct=correct,
+                correct_answer=question.answer,
+                explanation=question.explanation,
+                score=session.score,
+                answered=session.answered,
+                next_question=next_question,
+                wait_seconds=wait,
+                error=session.error
+            )
+
+    def end_session(self, session: Union[QuizSession, str]) -> QuizReport:
+        """Stop a session, drop it from memory and return its report."""
+        session = self.get_session(session) if isinstance(session, str) else session
+        with session.lock:
+            self._cancel_prefetch(session)
+            session.current = None
+        self.sessions.pop(session.session_id, None)
+        return self.report(session)
+
+    def report(self, session: Union[QuizSession, str]) -> QuizReport:
+        session = self.get_session(session) if isinstance(session, str) else session
+        sources: Dict[str, int] = {}
+        for entry in session.history:
+            sources[entry.question.source] = sources.get(entry.question.source, 0) + 1
+        waits = session.waits[1:session.answered] or [0.0]  # the first wait is the initial load
+        return QuizReport(
+            session_id=session.session_id,
+            topic=session.topic,
+            score=session.score,
+            answered=session.answered,
+            final_difficulty=self.levels[session.level],
+            history=list(session.history),
+            sources=sources,
+            average_wait_seconds=sum(waits) / len(waits),
+            max_wait_seconds=max(waits),
+            elapsed_seconds=time.time() - session.started_at
+        )
+
+    def close(self) -> None:
+        """End every session and stop background generation."""
+        for session_id in list(self.sessions):
+            self.end_session(session_id)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _step(self, level: int, correct: bool) -> int:
+        return min(level + 1, len(self.levels) - 1) if correct else max(level - 1, 0)
+
+    # Question supply
+    def _prefetch(self, session: QuizSession) -> None:
+        """Start fetching the next question for both outcomes of the current one."""
+        if session.answered + 1 >= session.num_questions:
+            return
+        for correct in (True, False):
+            difficulty = self.levels[self._step(session.level, correct)]
+            if difficulty not in session.prefetched:
+                session.prefetched[difficulty] = self._fetch(session, difficulty, correct)
+
+    def _cancel_prefetch(self, session: QuizSession) -> None:
+        """Drop the prefetched questions, releasing the bank questions they reserved."""
+        for future in session.prefetched.values():
+            future.cancel()
+            if future.done() and not future.cancelled() and future.exception() is None:
+                index = future.result().bank_index
+                if index is not None:
+                    session.bank_used.remove(index)
+        session.prefetched.clear()
+
+    def _next_question(self, session: QuizSession, difficulty: str, correct: Optional[bool]) -> QuizQuestion:
+        """
+        The prefetched question for ``difficulty`` if there is one, otherwise fetch it now.
+
+        If generation fails, a bank question at the nearest other level is served instead;
+        raises ValueError when there is none.
+        """
+        future = session.prefetched.pop(difficulty, None)
+        # Drop the branch not taken: its bank question goes back to the pool, and a question
+        # generated for it was prompted with this answer's outcome, not a later one
+        self._cancel_prefetch(session)
+        if future is not None:
+            try:
+                question = future.result()
+                if not self._is_repeat(session, question):
+                    return question
+            except Exception as e:
+                print(f"Error prefetching a {difficulty} question: {e}")
+        try:
+            return self._fetch(session, difficulty, correct).result()
+        except Exception as e:
+            print(f"Error generating a {difficulty} question: {e}")
+            error = e
+
+        target = self.levels.index(difficulty)
+        for level in sorted(range(len(self.levels)), key=lambda level: abs(level - target))[1:]:
+            index = self._take_from_bank(session, self.levels[level])
+            if index is not None:
+                return to_quiz_question(self.bank.records[index], self.levels[level], "bank", index)
+        raise ValueError(f"No {difficulty} question left in the bank and generation failed: {error}")
+
+    def _fetch(self, session: QuizSession, difficulty: str, correct: Optional[bool]) -> concurrent.futures.Future:
+        """A bank question (already resolved) or a background LLM generation."""
+        index = self._take_from_bank(session, difficulty)
+        if index is not None:
+            future = concurrent.futures.Future()
+            future.set_result(to_quiz_question(self.bank.records[index], difficulty, "bank", index))
+            return future
+        # Build the prompt context now: the session moves on while the generation runs
+        instructions = self._generation_instructions(session, difficulty, correct)
+        return self._executor.submit(self._generate, session.topic, difficulty, instructions)
+
+    def _take_from_bank(self, session: QuizSession, difficulty: str) -> Optional[int]:
+        if self.bank is None:
+            return None
+        with self._bank_lock:
+            picks = self.bank.sample(
+                1,
+                topics=session.bank_topics,
+                difficulty=difficulty,
+                question_types=[self.question_type] if self.question_type else None,
+                exclude=session.bank_used,
+                rng=self._rng
+            )
+        if not picks:
+            return None
+        session.bank_used.append(picks[0])
+        return picks[0]
+
+    def _generate(self, topic: str, difficulty: str, instructions: str) -> QuizQuestion:
+        result = self.qna_engine.generate_questions(
+            topic, num=1, question_type=self.question_type, custom_instructions=instructions
+        )
+        if not result or not getattr(result, "questions", None):
+            raise ValueError("The model returned no question")
+        return to_quiz_question(result.questions[0], difficulty)
+
+    def _generation_instructions(self, session: QuizSession, difficulty: str, correct: Optional[bool]) -> str:
+        parts = [f"Difficulty level: {difficulty}."]
+        if session.current is not None and correct is not None:
+            if correct:
+                parts.append("The learner answered this question correctly, so ask a more challenging one "
+                             f"on a different aspect: {session.current.question}")
+            else:
+                parts.append("The learner answered this question incorrectly, so ask an easier one that "
+                             f"builds toward it: {session.current.question}")
+        asked = [entry.question.question for entry in session.history][-RECENT_QUESTIONS_IN_PROMPT:]
+        if session.current is not None:
+            asked.append(session.current.question)
+        if asked:
+            parts.append("Do not repeat any of these questions:\n" + "\n".join(f"- {question}" for question in asked))
+        if session.custom_instructions:
+            parts.append(session.custom_instructions)
+        return "\n\n".join(parts)
+
+    @staticmethod
+    def _is_repeat(session: QuizSession, question: QuizQuestion) -> bool:
+        text = question.question.strip().lower()
+        return any(entry.question.question.strip().lower() == text for entry in session.history)
@@ -1,24 +1,26 @@
-from typing import Optional, Type, Any
-from pydantic import BaseModel
+import asyncio
+import time
+from typing import Optional, Type, Any, Dict, List, Tuple, Union
+from pydantic import BaseModel, create_model
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.runnables.config import ContextThreadPoolExecutor
 from educhain.core.config import LLMConfig
 
 from educhain.models.content_models import StudyGuide, CareerConnections
+from educhain.models.content_models import (
+    MainTopic, SubTopic, CaseStudy,
+    LessonPlanOutline, LessonPlanClosing,
+    StudyGuideOutline, KeyConceptExplanations, PracticeExerciseList, StudyGuideClosing
+)
 import json
 from educhain.models.content_models import LessonPlan
-from educhain.models.content_models import FlashcardSet
-from educhain.models.pedagogy_models import (
-    BloomsTaxonomyContent, 
-    SocraticQuestioningContent, 
-    ProjectBasedLearningContent,
-    FlippedClassroomContent,
-    InquiryBasedLearningContent,
-    ConstructivistContent,
-    GamificationContent,
-    PeerLearningContent
-) 
+from educhain.models.content_models import FlashcardSet, Flashcard, FlashcardDeckOutline
+from educhain.utils.chunking import allocate_quotas, normalize_text, dedupe_by_embedding
+from educhain.models.pedagogy_models import PedagogyResult, PedagogyBundle
+from educhain.utils.content_paths import parse_section_path, resolve_section, set_section, section_context
+from educhain.engines.pedagogy_registry import Pedagogy, get_pedagogy, list_pedagogies
 
 
 class ContentEngine:
@@ -50,8 +52,28 @@ def generate_lesson_plan(
         response_model: Optional[Type[Any]] = None,
         llm: Optional[Any] = None,
         output_format: Optional[str] = None,
+        sectioned: bool = False,
+        max_workers: Optional[int] = None,
         **kwargs
     ) -> Any:
+        """
+        Generate a LessonPlan for a topic.
+
+        With ``sectioned=True`` a short outline call comes first, then every subtopic (and the
+        closing sections) is generated by its own concurrent call, at most ``max_workers`` at
+        a time, and the pieces are assembled into the same LessonPlan. This is faster than
+        one large completion and cannot be truncated by ``max_tokens`` as a whole; a section
+        that fails falls back on its own instead of failing the plan (if the outline itself
+        fails, the single-completion path is used). Sectioned mode builds
+        a LessonPlan, so it does not take a custom ``prompt_template`` or ``response_model``.
+        """
+        if sectioned:
+            self._check_sectioned(prompt_template, response_model, LessonPlan)
+            try:
+                return self._generate_lesson_plan_sectioned(topic, grade_level, custom_instructions, llm, max_workers)
+            except Exception as e:
+                print(f"Error generating lesson plan outline: {e}. Falling back to a single completion.")
+
         if response_model is None:
             response_model = LessonPlan
 
@@ -137,8 +159,25 @@ def generate_study_guide(
         response_model: Optional[Type[Any]] = None,
         llm: Optional[Any] = None,
         output_format: Optional[str] = None,
+        sectioned: bool = False,
+        max_workers: Optional[int] = None,
         **kwargs
     ) -> Any:
+        """
+        Generate a StudyGuide for a topic.
+
+        With ``sectioned=True`` an outline call picks the overview, concepts and case study
+        titles, then key concept explanations, practice exercises, each case study and the
+        closing sections are generated concurrently and assembled into the same StudyGuide
+        (see generate_lesson_plan).
+        """
+        if sectioned:
+            self._check_sectioned(prompt_template, response_model, StudyGuide)
+            try:
+                return self._generate_study_guide_sectioned(topic, difficulty_level, custom_instructions, llm, max_workers)
+            except Exception as e:
+                print(f"Error generating study guide outline: {e}. Falling back to a single completion.")
+
         if response_model is None:
             response_model = StudyGuide
 
@@ -267,6 +306,325 @@ def generate_study_guide(
                 }]
             )
         
+    # Sectioned generation
+    @staticmethod
+    def _check_sectioned(prompt_template: Optional[str], response_model: Optional[Type[Any]], default_model: Type[Any]):
+        if prompt_template is not None or response_model not in (None, default_model):
+            raise ValueError(f"sectioned=True assembles a {default_model.__name__} and does not support a custom prompt_template or response_model")
+
+    def _invoke_structured(self, model: Type[Any], template: str, variables: dict, llm: Optional[Any] = None) -> Any:
+        """Run one prompt and parse it into ``model``; raises if the output does not parse."""
+        parser = PydanticOutputParser(pydantic_object=model)
+        prompt = PromptTemplate(
+            input_variables=list(variables),
+            template=template + "\n\n{custom_instructions}\n\nThe response should be in JSON format.\n{format_instructions}",
+            partial_variables={"format_instructions": parser.get_format_instructions()}
+        )
+        result = (prompt | (llm if llm is not None else self.llm)).invoke(variables)
+        return parser.parse(result.content)
+
+    @staticmethod
+    def _run_sections(jobs: List[Tuple[str, Any, Any]], max_workers: Optional[int]) -> List[Any]:
+        """Run (label, function, fallback) jobs concurrently; a failed section yields its fallback."""
+        def run(job):
+            label, function, fallback = job
+            try:
+                return function()
+            except Exception as e:
+                print(f"Error generating {label}: {e}")
+                return fallback
+
+        if not jobs:
+            return []
+        # ContextThreadPoolExecutor carries callbacks (e.g. token counting) into the workers
+        with ContextThreadPoolExecutor(max_workers=max_workers or len(jobs)) as executor:
+            return list(executor.map(run, jobs))
+
+    def _generate_lesson_plan_sectioned(
+        self,
+        topic: str,
+        grade_level: Optional[str],
+        custom_instructions: Optional[str],
+        llm: Optional[Any],
+        max_workers: Optional[int]
+    ) -> LessonPlan:
+        context = {
+            "topic": topic,
+            "grade_level": grade_level or "General",
+            "custom_instructions": f"Additional Instructions:\n{custom_instructions}" if custom_instructions else ""
+        }
+
+        outline = self._invoke_structured(LessonPlanOutline, """
+            Outline a highly engaging lesson plan on: {topic}
+            Grade level: {grade_level}
+
+            Provide only the title, subject area, learning objectives (at least 3, tailored to different
+            learning levels), a lesson introduction with a hook, and 2-3 main topics, each with the
+            titles of 2-3 subtopics. The subtopics will be developed separately.
+            """, context, llm)
+
+        subtopic_template = """
+            You are writing one subtopic of the lesson plan "{plan_title}" on {topic} (grade level: {grade_level}).
+            Main topics and subtopics of the whole plan:
+            {plan_outline}
+
+            Develop only the subtopic "{subtopic}" of the main topic "{main_topic}" with:
+            - Key Concepts (definitions, examples, illustrations, multimedia)
+            - Discussion Questions (to encourage critical thinking and engagement)
+            - Hands-on Activities or Project-Based Learning (interactive, real-world tasks)
+            - Reflective Questions (to evaluate understanding)
+            - Assessment Ideas (quiz, project, or written task to assess mastery)
+            Address different levels of Bloom's Taxonomy and diverse learning styles.
+            """
+        plan_outline = "\n".join(
+            f"- {main_topic.title}: {'; '.join(main_topic.subtopics)}" for main_topic in outline.main_topics
+        )
+        base = {**context, "plan_title": outline.title, "plan_outline": plan_outline}
+
+        jobs = []
+        for main_topic in outline.main_topics:
+            for subtopic in main_topic.subtopics:
+                variables = {**base, "main_topic": main_topic.title, "subtopic": subtopic}
+                jobs.append((
+                    f"subtopic '{subtopic}'",
+                    lambda variables=variables: self._invoke_structured(SubTopic, subtopic_template, variables, llm),
+                    SubTopic(title=subtopic, key_concepts=[], discussion_questions=[], hands_on_activities=[],
+                             reflective_questions=[], assessment_ideas=[])
+                ))
+        jobs.append((
+            "closing sections",
+            lambda: self._invoke_structured(LessonPlanClosing, """
+                For the lesson plan "{plan_title}" on {topic} (grade level: {grade_level}), covering:
+                {plan_outline}
+
+                Write learning adaptations for different grade levels, real-world applications (including
+                careers and future learning paths), and ethical considerations and societal impact.
+                """, base, llm),
+            LessonPlanClosing()
+        ))
+
+        *subtopics, closing = self._run_sections(jobs, max_workers)
+
+        main_topics = []
+        position = 0
+        for main_topic in outline.main_topics:
+            count = len(main_topic.subtopics)
+            main_topics.append(MainTopic(title=main_topic.title, subtopics=subtopics[position:position + count]))
+            position += count
+
+        return LessonPlan(
+            title=outline.title,
+            subject=outline.subject,
+            learning_objectives=outline.learning_objectives,
+            lesson_introduction=outline.lesson_introduction,
+            main_topics=main_topics,
+            **closing.dict()
+        )
+
+    def _generate_study_guide_sectioned(
+        self,
+        topic: str,
+        difficulty_level: Optional[str],
+        custom_instructions: Optional[str],
+        llm: Optional[Any],
+        max_workers: Optional[int],
+        concepts_per_call: int = 4
+    ) -> StudyGuide:
+        context = {
+            "topic": topic,
+            "difficulty_level": difficulty_level or "Intermediate",
+            "custom_instructions": f"Additional Instructions:\n{custom_instructions}" if custom_instructions else ""
+        }
+
+        outline = self._invoke_structured(StudyGuideOutline, """
+            Outline a comprehensive study guide on: {topic}
+            Difficulty Level: {difficulty_level}
+
+            Provide the difficulty level, estimated study time, prerequisites, 3-5 specific and measurable
+            learning objectives, a comprehensive overview, the names of 5-8 key concepts, and titles for
+            1-3 recent, relevant real-world case studies. Concepts and case studies will be developed separately.
+            """, context, llm)
+
+        base = {**context, "overview": outline.overview, "concepts": ", ".join(outline.key_concepts)}
+        jobs = []
+
+        concepts = outline.key_concepts
+        for start in range(0, len(concepts), concepts_per_call):
+            chunk = concepts[start:start + concepts_per_call]
+            variables = {**base, "chunk": "\n".join(f"- {concept}" for concept in chunk)}
+            jobs.append((
+                f"key concepts {', '.join(chunk)}",
+                lambda variables=variables: self._invoke_structured(KeyConceptExplanations, """
+                    For a {difficulty_level} study guide on {topic} (overview: {overview}),
+                    write a detailed explanation of each of these key concepts, keyed by concept name:
+                    {chunk}
+                    """, variables, llm).key_concepts,
+                {}
+            ))
+
+        jobs.append((
+            "practice exercises",
+            lambda: self._invoke_structured(PracticeExerciseList, """
+                Write 3-5 hands-on practice exercises with step-by-step solutions for a {difficulty_level}
+                study guide on {topic}, covering these concepts: {concepts}
+                """, base, llm).practice_exercises,
+            []
+        ))
+
+        for title in outline.case_studies:
+            variables = {**base, "case_title": title}
+            jobs.append((
+                f"case study '{title}'",
+                lambda variables=variables: self._invoke_structured(CaseStudy, """
+                    Write the real-world case study "{case_title}" for a {difficulty_level} study guide on {topic}.
+                    Describe the scenario, the specific challenge, how it was addressed, the outcome, the lessons
+                    learned (including both successes and mistakes) and related concepts from: {concepts}
+                    """, variables, llm),
+                None
+            ))
+
+        jobs.append((
+            "closing sections",
+            lambda: self._invoke_structured(StudyGuideClosing, """
+                For a {difficulty_level} study guide on {topic} covering {concepts}, provide important dates
+                and events (if applicable), study tips specific to the topic, additional resources for deeper
+                learning, and a brief summary of key takeaways.
+                """, base, llm),
+            StudyGuideClosing()
+        ))
+
+        results = self._run_sections(jobs, max_workers)
+        num_chunks = len(jobs) - 2 - len(outline.case_studies)
+        explanations, (exercises,), case_studies, closing = (
+            results[:num_chunks], results[num_chunks:num_chunks + 1], results[num_chunks + 1:-1], results[-1]
+        )
+
+        key_concepts = {}
+        for chunk in explanations:
+            key_concepts.update(chunk)
+
+        return StudyGuide(
+            topic=topic,
+            difficulty_level=outline.difficulty_level or context["difficulty_level"],
+            estimated_study_time=outline.estimated_study_time,
+            prerequisites=outline.prerequisites,
+            learning_objectives=outline.learning_objectives,
+            overview=outline.overview,
+            key_concepts=key_concepts,
+            practice_exercises=[exercise.dict() for exercise in exercises] or None,
+            case_studies=[case for case in case_studies if case is not None] or None,
+            **closing.dict()
+        )
+
+    # Partial regeneration
+    def regenerate_section(
+        self,
+        content: BaseModel,
+        path: str,
+        instructions: Optional[str] = None,
+        llm: Optional[Any] = None,
+        include_current: bool = True
+    ) -> BaseModel:
+        """
+        Regenerate one addressed section of generated content and patch it into a copy.
+
+        Only the section is generated. The rest of the document is passed as compact context
+        (top-level text fields and sibling section titles), so a revision costs a fraction
+        of regenerating the whole object.
+
+        Args:
+            content: A LessonPlan, StudyGuide, FlashcardSet or other generated model
+            path: Section to replace, e.g. "main_topics[1].subtopics[0]", "case_studies[2]",
+                "flashcards[4]", "key_concepts['Osmosis']" or "summary"
+            instructions: What to change, e.g. "Use a simpler hands-on activity"
+            llm: Model to use instead of the engine's
+            include_current: Show the model the current (rejected) version of the section
+
+        Returns:
+            A copy of ``content`` with the section replaced
+        """
+        steps = parse_section_path(path)
+        current, section_type, _ = resolve_section(content, steps)
+        new_value = self._generate_section(content, path, steps, current, section_type, instructions, llm, include_current)
+
+        updated = content.copy(deep=True)
+        set_section(updated, steps, new_value)
+        return updated
+
+    def regenerate_sections(
+        self,
+        content: BaseModel,
+        paths: List[str],
+        instructions: Optional[Union[str, Dict[str, str]]] = None,
+        llm: Optional[Any] = None,
+        include_current: bool = True,
+        max_workers: Optional[int] = None
+    ) -> BaseModel:
+        """
+        Regenerate several sections concurrently (see regenerate_section) and patch them all
+        into one copy. ``instructions`` may be shared or a {path: instructions} dict.
+        Sections that fail to regenerate are left unchanged.
+        """
+        resolved = []
+        for path in dict.fromkeys(paths):
+            steps = parse_section_path(path)
+            current, section_type, _ = resolve_section(content, steps)
+            section_instructions = instructions.get(path) if isinstance(instructions, dict) else instructions
+            resolved.append((path, steps, current, section_type, section_instructions))
+
+        jobs = [
+            (
+                f"section {path}",
+                lambda job=(path, steps, current, section_type, section_instructions):
+                    self._generate_section(content, *job, llm, include_current),
+                current
+            )
+            for path, steps, current, section_type, section_instructions in resolved
+        ]
+        results = self._run_sections(jobs, max_workers)
+
+        updated = content.copy(deep=True)
+        for (path, steps, *_), new_value in zip(resolved, results):
+            set_section(updated, steps, new_value)
+        return updated
+
+    def _generate_section(
+        self,
+        content: BaseModel,
+        path: str,
+        steps: List[Union[str, int]],
+        current: Any,
+        section_type: Any,
+        instructions: Optional[str],
+        llm: Optional[Any],
+        include_current: bool
+    ) -> Any:
+        wrap = not (isinstance(section_type, type) and issubclass(section_type, BaseModel))
+        model = create_model("SectionValue", value=(section_type, ...)) if wrap else section_type
+
+        if include_current:
+            current_json = json.dumps(current.dict() if isinstance(current, BaseModel) else current, default=str)
+            current_text = f"Current version of this section (to be replaced):\n{current_json}"
+        else:
+            current_text = ""
+
+        section = self._invoke_structured(model, """
+            You are revising one section of an existing {content_type}.
+            The rest of the document, for context:
+            {context}
+
+            Rewrite only the section at "{path}" so it fits the surrounding content and does not
+            repeat its sibling sections.
+            {current}
+            """, {
+                "content_type": type(content).__name__,
+                "context": section_context(content, steps),
+                "path": path,
+                "current": current_text,
+                "custom_instructions": f"Additional Instructions:\n{instructions}" if instructions else ""
+            }, llm)
+        return section.value if wrap else section
+
     # Career Connections
     def generate_career_connections(
         self,
@@ -482,6 +840,139 @@ def generate_flashcards(
             print(results.content)
             return FlashcardSet(title=topic, flashcards=[])
     
+    def generate_flashcard_deck(
+        self,
+        topic: str,
+        num: int = 100,
+        cards_per_chunk: int = 20,
+        custom_instructions: Optional[str] = None,
+        llm: Optional[Any] = None,
+        embeddings: Optional[Any] = None,
+        similarity_threshold: float = 0.92,
+        max_topup_rounds: int = 3,
+        max_workers: Optional[int] = None
+    ) -> FlashcardSet:
+        """
+        Generate a large flashcard deck in concurrent chunks.
+
+        The topic is first split into subtopics, then chunks of at most ``cards_per_chunk``
+        cards are generated concurrently. Duplicates are removed by normalized front text
+        and, when ``embeddings`` (any LangChain Embeddings, e.g. OpenAIEmbeddings()) is
+        given, by cosine similarity of the fronts. Any shortfall is topped up with
+        further rounds that are shown the fronts already in the deck.
+
+        Args:
+            topic: Topic of the deck
+            num: Number of cards wanted
+            cards_per_chunk: Cards requested per LLM call
+            custom_instructions: Additional instructions for every chunk
+            llm: Model to use instead of the engine's
+            embeddings: Embeddings model for semantic de-duplication (optional)
+            similarity_threshold: Fronts at least this similar count as duplicates
+            max_topup_rounds: Extra rounds used to replace duplicates and failed chunks
+            max_workers: Maximum concurrent LLM calls
+
+        Returns:
+            FlashcardSet with up to ``num`` distinct cards
+        """
+        context = {
+            "topic": topic,
+            "custom_instructions": f"Additional Instructions:\n{custom_instructions}" if custom_instructions else ""
+        }
+        num_subtopics = max(1, -(-num // cards_per_chunk))
+
+        try:
+            subtopics = self._invoke_structured(FlashcardDeckOutline, """
+                Split the topic "{topic}" into {num_subtopics} distinct, non-overlapping subtopics that together
+                cover it completely. Each will get its own set of flashcards.
+                """, {**context, "num_subtopics": num_subtopics}, llm).subtopics
+        except Exception as e:
+            print(f"Error generating deck outline: {e}. Using the topic as a single subtopic.")
+            subtopics = []
+        subtopics = list(dict.fromkeys(subtopic.strip() for subtopic in subtopics if subtopic.strip())) or [topic]
+
+        chunk_template = """
+            Generate {count} flashcards on "{subtopic}", part of the topic "{topic}".
+            Other parts of the topic ({other_subtopics}) are covered by other cards, so stay within "{subtopic}".
+            Cover key concepts, terminology and important facts; every card must test something different.
+            {avoid}
+            For each card give a front (question or key term), a back (answer or definition) and an optional explanation.
+            """
+
+        deck: List[Tuple[str, Flashcard]] = []
+        embedding_cache: Dict[str, Any] = {}
+        quotas = allocate_quotas(num, [1] * len(subtopics))
+
+        for round_number in range(max_topup_rounds + 1):
+            jobs = []
+            for subtopic, quota in zip(subtopics, quotas):
+                existing = [card.front for card_subtopic, card in deck if card_subtopic == subtopic]
+                avoid = ("Do not repeat any of these existing cards:\n" + "\n".join(f"- {front}" for front in existing[-60:])
+                         if existing else "")
+                for start in range(0, quota, cards_per_chunk):
+                    variables = {
+                        **context,
+                        "count": min(cards_per_chunk, quota - start),
+                        "subtopic": subtopic,
+                        "other_subtopics": "; ".join(other for other in subtopics if other != subtopic) or "none",
+                        "avoid": avoid
+                    }
+                    jobs.append((
+                        f"flashcards for '{subtopic}'",
+                        lambda variables=variables: [
+                            (variables["subtopic"], card)
+                            for card in self._invoke_structured(FlashcardSet, chunk_template, variables, llm).flashcards
+                        ],
+                        []
+                    ))
+
+            for chunk in self._run_sections(jobs, max_workers):
+                deck.extend(chunk)
+            deck = self._dedupe_flashcards(deck, embeddings, similarity_threshold, embedding_cache)
+
+            shortfall = num - len(deck)
+            if shortfall <= 0 or round_number == max_topup_rounds:
+                break
+            # Top up where the most cards are missing
+            counts = [sum(1 for card_subtopic, _ in deck if card_subtopic == subtopic) for subtopic in subtopics]
+            targets = allocate_quotas(num, [1] * len(subtopics))
+            missing = [max(target - count, 0) for target, count in zip(targets, counts)]
+            quotas = allocate_quotas(shortfall, missing if sum(missing) else [1] * len(subtopics))
+
+        if len(deck) < num:
+            print(f"Generated {len(deck)} distinct flashcards out of {num} requested.")
+        return FlashcardSet(title=topic, flashcards=[card for _, card in deck[:num]])
+
+    @staticmethod
+    def _dedupe_flashcards(
+        deck: List[Tuple[str, Flashcard]],
+        embeddings: Optional[Any],
+        threshold: float,
+        embedding_cache: Dict[str, Any]
+    ) -> List[Tuple[str, Flashcard]]:
+        """Drop cards whose front repeats (after normalization) or closely paraphrases an earlier card."""
+        seen = set()
+        unique = []
+        for subtopic, card in deck:
+            key = normalize_text(card.front)
+            if key and key not in seen:
+                seen.add(key)
+                unique.append((subtopic, card))
+
+        if embeddings is None or len(unique) < 2:
+            return unique
+
+        fronts = [card.front for _, card in unique]
+        new_fronts = [front for front in dict.fromkeys(fronts) if front not in embedding_cache]
+        if new_fronts:
+            try:
+                embedding_cache.update(zip(new_fronts, embeddings.embed_documents(new_fronts)))
+            except Exception as e:
+                print(f"Error embedding flashcards, keeping text de-duplication only: {e}")
+                return unique
+        kept = dedupe_by_embedding([embedding_cache[front] for front in fronts], threshold)
+        return [unique[i] for i in kept]
+
     # Pedagogy-Based Content Generation Method
     
     def generate_pedagogy_content(
@@ -505,566 +996,144 @@ def generate_pedagogy_content(
                 - 'constructivist': Constructivist learning
                 - 'gamification': Gamified learning
                 - 'peer_learning': Peer learning activities
+                - any pedagogy added with register_pedagogy
             custom_instructions (str, optional): Additional instructions for content generation
             **kwargs: Pedagogy-specific parameters (see documentation for each pedagogy)
         
         Returns:
             Content object based on the selected pedagogy
         """
-        
-        # Pedagogy configurations
-        pedagogy_configs = {
-            "blooms_taxonomy": {
-                "model": BloomsTaxonomyContent,
-                "prompt_template": """
-                Create comprehensive educational content for the topic "{topic}" using Bloom's Taxonomy framework.
-                Target cognitive level: {target_level}
-                Grade level: {grade_level}
-                
-                Generate detailed, consumable content for each cognitive level. Students should be able to read and learn directly from this content.
-                
-                For each of the six cognitive levels of Bloom's Taxonomy, provide:
-                
-                1. REMEMBER (Knowledge): 
-                   - Detailed content explaining facts, definitions, and basic information about {topic}
-                   - Key concepts students need to memorize
-                   - Foundational knowledge that supports higher-order thinking
-                
-                2. UNDERSTAND (Comprehension): 
-                   - Comprehensive explanations of concepts and principles
-                   - Content that helps students interpret and explain {topic}
-                   - Examples and analogies that clarify understanding
-                
-                3. APPLY (Application): 
-                   - Content showing how to use knowledge in practical situations
-                   - Step-by-step procedures and methods
-                   - Real-world scenarios where students can apply {topic}
-                
-                4. ANALYZE (Analysis): 
-                   - Content that breaks down {topic} into components
-                   - Comparative analysis and relationship explanations
-                   - Critical examination of elements and their interactions
-                
-                5. EVALUATE (Evaluation): 
-                   - Content that presents criteria for making judgments
-                   - Multiple perspectives and evaluation frameworks
-                   - Critical thinking approaches to assess {topic}
-                
-                6. CREATE (Synthesis): 
-                   - Content that guides original work and innovation
-                   - Creative application methods and techniques
-                   - Frameworks for producing new ideas related to {topic}
-                
-                For each level, include:
-                - Rich, detailed content that students can study and learn from
-                - Key concepts and terminology
-                - Learning objectives
-                - Practical activities and exercises
-                - Assessment questions
-                - Real-world applications and examples
-                
-                Make the content comprehensive enough that students can gain deep understanding of {topic} at each cognitive level.
-                
-                {custom_instructions}
-                
-                {format_instructions}
-                """,
-                "input_variables": ["topic", "target_level", "grade_level", "custom_instructions"],
-                "defaults": {"target_level": "All levels", "grade_level": "General"}
-            },
-            
-            "socratic_questioning": {
-                "model": SocraticQuestioningContent,
-                "prompt_template": """
-                Create comprehensive Socratic questioning content for the topic "{topic}".
-                Depth level: {depth_level}
-                Student level: {student_level}
-                
-                Generate detailed content that guides students through self-discovery learning about {topic}.
-                
-                For each question category, provide rich content that students can engage with:
-                
-                1. FOUNDATIONAL QUESTIONS: 
-                   - Content overview explaining the basic concepts students need to understand about {topic}
-                   - Background information and context
-                   - Questions that establish baseline understanding
-                   - Example responses with explanations of why they demonstrate understanding
-                
-                2. ANALYTICAL QUESTIONS:
-                   - Content that presents different perspectives and approaches to {topic}
-                   - Analytical frameworks and tools for examination
-                   - Questions that probe assumptions and evidence
-                   - Detailed explanations of how to think critically about {topic}
-                
-                3. PERSPECTIVE QUESTIONS:
-                   - Content exploring multiple viewpoints on {topic}
-                   - Historical, cultural, and contextual perspectives
-                   - Questions that challenge students to consider different angles
-                   - Rich examples of how {topic} is viewed across different contexts
-                
-                4. IMPLICATION QUESTIONS:
-                   - Content about consequences and future implications of {topic}
-                   - Cause-and-effect relationships and scenarios
-                   - Questions about potential outcomes and impacts
-                   - Detailed exploration of "what if" scenarios related to {topic}
-                
-                5. META-COGNITIVE QUESTIONS:
-                   - Content about learning processes and thinking strategies
-                   - Reflection frameworks and self-assessment tools
-                   - Questions about thinking and learning approaches
-                   - Guidance on how to monitor and improve understanding of {topic}
-                
-                For each category, include:
-                - Comprehensive content overview that students can study
-                - Thought-provoking questions for self-reflection
-                - Follow-up probes for deeper inquiry
-                - Example student responses with detailed explanations
-                - Facilitation notes for deeper understanding
-                
-                Create content rich enough that students can engage in meaningful self-directed inquiry about {topic}.
-                
-                {custom_instructions}
-                
-                {format_instructions}
-                """,
-                "input_variables": ["topic", "depth_level", "student_level", "custom_instructions"],
-                "defaults": {"depth_level": "Intermediate", "student_level": "High School"}
-            },
-            
-            "project_based_learning": {
-                "model": ProjectBasedLearningContent,
-                "prompt_template": """
-                Design a comprehensive project-based learning experience for "{topic}".
-                Project duration: {project_duration}
-                Team size: {team_size}
-                Industry focus: {industry_focus}
-                
-                Create detailed, actionable content that students can use to complete a real-world project about {topic}.
-                
-                Include:
-                
-                1. DRIVING QUESTION: An engaging, open-ended question that guides the entire project
-                2. PROJECT OVERVIEW: Clear description of what students will accomplish
-                3. LEARNING OBJECTIVES: Specific knowledge and skills students will develop
-                
-                4. PROJECT PHASES with rich content for each phase:
-                   - Detailed content description with comprehensive materials students need
-                   - Step-by-step procedures and methodologies
-                   - Technical specifications and requirements
-                   - Research resources and reference materials
-                   - Tools, software, and equipment needed
-                   - Assessment criteria and checkpoints
-                   
-                5. DELIVERABLES: Tangible outcomes with detailed specifications
-                6. REAL-WORLD CONNECTIONS: How the project relates to professional practice
-                
-                For each project phase, provide:
-                - Comprehensive content description that explains what students need to know
-                - Detailed materials including technical information, procedures, and methodologies
-                - Resources needed (tools, software, equipment, references)
-                - Step-by-step activities and processes
-                - Assessment criteria for that phase
-                
-                Ensure the project includes enough detailed content that students can:
-                - Learn the necessary concepts and skills for {topic}
-                - Follow clear procedures and methodologies
-                - Access comprehensive reference materials
-                - Understand technical specifications and requirements
-                - Complete authentic, professional-quality work
-                
-                Make this a complete, self-contained learning experience where students gain deep expertise in {topic} through hands-on project work.
-                
-                {custom_instructions}
-                
-                {format_instructions}
-                """,
-                "input_variables": ["topic", "project_duration", "team_size", "industry_focus", "custom_instructions"],
-                "defaults": {"project_duration": "4-6 weeks", "team_size": "3-4 students", "industry_focus": "General"}
-            },
-            
-            "flipped_classroom": {
-                "model": FlippedClassroomContent,
-                "prompt_template": """
-                Design a comprehensive flipped classroom experience for "{topic}".
-                Class duration: {class_duration}
-                Prep time available: {prep_time}
-                Technology level: {technology_level}
-                
-                Create complete, consumable content for all phases of flipped learning:
-                
-                1. PRE-CLASS PREPARATION with complete content:
-                   - Full content that students can study independently about {topic}
-                   - Comprehensive explanations, examples, and illustrations
-                   - Interactive elements and self-check opportunities
-                   - Key points and takeaways for each content piece
-                   - Pre-class assessment questions with detailed explanations
-                
-                2. IN-CLASS ACTIVITIES with detailed instructions:
-                   - Step-by-step activity instructions that build on pre-class content
-                   - Detailed materials and resources for each activity
-                   - Problem-solving scenarios and case studies related to {topic}
-                   - Collaborative exercises with specific roles and processes
-                   - Application tasks that reinforce and extend learning
-                
-                3. POST-CLASS REINFORCEMENT with complete materials:
-                   - Extended practice activities with full instructions
-                   - Reflection prompts and self-assessment tools
-                   - Application projects with detailed requirements
-                   - Additional resources for deeper exploration of {topic}
-                
-                For PRE-CLASS CONTENT, provide:
-                - Complete educational content that thoroughly covers {topic}
-                - Full explanations, definitions, and concepts
-                - Examples, analogies, and visual aids
-                - Key points students must remember
-                - Self-check questions and activities
-                
-                For IN-CLASS ACTIVITIES, provide:
-                - Detailed step-by-step instructions for each activity
-                - Complete materials and resources needed
-                - Specific procedures and methodologies
-                - Assessment methods for each activity
-                
-                Ensure that all content is comprehensive enough that students can:
-                - Learn {topic} thoroughly from pre-class materials
-                - Engage meaningfully in active learning during class
-                - Apply and extend their knowledge through post-class activities
-                - Achieve mastery of {topic} through the complete flipped experience
-                
-                {custom_instructions}
-                
-                {format_instructions}
-                """,
-                "input_variables": ["topic", "class_duration", "prep_time", "technology_level", "custom_instructions"],
-                "defaults": {"class_duration": "50 minutes", "prep_time": "30-45 minutes", "technology_level": "Moderate"}
-            },
-            
-            "inquiry_based_learning": {
-                "model": InquiryBasedLearningContent,
-                "prompt_template": """
-                Design an inquiry-based learning experience for "{topic}".
-                Inquiry type: {inquiry_type}
-                Investigation scope: {investigation_scope}
-                Student autonomy level: {student_autonomy}
-                
-                Create a comprehensive IBL framework including:
-                
-                1. ESSENTIAL QUESTIONS: Open-ended questions that drive inquiry
-                2. INVESTIGATION PHASES:
-                   - Question formulation
-                   - Research and data collection
-                   - Analysis and interpretation
-                   - Conclusion and communication
-                
-                3. INQUIRY ACTIVITIES:
-                - Guided investigations for skill building
-                - Open investigations for independent exploration
-                - Collaborative inquiry projects
-                - Real-world problem investigations
-                
-                4. RESEARCH METHODS:
-                - Primary research techniques
-                - Secondary research strategies
-                - Data collection methods
-                - Analysis approaches
-                
-                5. SCAFFOLD SUPPORT:
-                - Question stems and frameworks
-                - Research organizers
-                - Thinking protocols
-                - Reflection prompts
-                
-                6. PRESENTATION FORMATS:
-                - Research presentations
-                - Scientific posters
-                - Digital storytelling
-                - Peer teaching sessions
-                
-                Balance student autonomy with appropriate guidance to ensure productive inquiry.
-                
-                {custom_instructions}
-                
-                {format_instructions}
-                """,
-                "input_variables": ["topic", "inquiry_type", "investigation_scope", "student_autonomy", "custom_instructions"],
-                "defaults": {"inquiry_type": "Guided", "investigation_scope": "Moderate", "student_autonomy": "Balanced"}
-            },
-            
-            "constructivist": {
-                "model": ConstructivistContent,
-                "prompt_template": """
-                Design a constructivist learning experience for "{topic}".
-                Prior knowledge level: {prior_knowledge_level}
-                Social interaction focus: {social_interaction_focus}
-                Reflection emphasis: {reflection_emphasis}
-                
-                Create a constructivist framework that includes:
-                
-                1. PRIOR KNOWLEDGE ACTIVATION:
-                - Activities to surface existing understanding
-                - Misconception identification
-                - Knowledge mapping exercises
-                
-                2. EXPERIENTIAL LEARNING:
-                - Hands-on activities and experiments
-                - Real-world problem scenarios
-                - Exploration and discovery tasks
-                
-                3. SOCIAL CONSTRUCTION:
-                - Collaborative learning activities
-                - Peer discussion and debate
-                - Knowledge sharing protocols
-                - Community of practice development
-                
-                4. REFLECTIVE PRACTICES:
-                - Metacognitive questioning
-                - Learning journals and portfolios
-                - Self-assessment strategies
-                - Peer feedback systems
-                
-                5. KNOWLEDGE BUILDING TOOLS:
-                - Concept mapping
-                - Knowledge construction frameworks
-                - Collaborative annotation
-                - Iterative design processes
-                
-                6. AUTHENTIC ASSESSMENT:
-                - Performance-based evaluation
-                - Portfolio assessment
-                - Self and peer evaluation
-                - Real-world application demonstrations
-                
-                Emphasize active knowledge construction, multiple perspectives, and continuous reflection.
-                
-                {custom_instructions}
-                
-                {format_instructions}
-                """,
-                "input_variables": ["topic", "prior_knowledge_level", "social_interaction_focus", "reflection_emphasis", "custom_instructions"],
-                "defaults": {"prior_knowledge_level": "Mixed", "social_interaction_focus": "High", "reflection_emphasis": "Strong"}
-            },
-            
-            "gamification": {
-                "model": GamificationContent,
-                "prompt_template": """
-                Design a gamified learning experience for "{topic}".
-                Preferred game mechanics: {game_mechanics}
-                Competition level: {competition_level}
-                Technology platform: {technology_platform}
-                
-                Create a comprehensive gamification design including:
-                
-                1. GAME MECHANICS:
-                - Points and scoring systems
-                - Levels and progression paths
-                - Badges and achievements
-                - Leaderboards and rankings
-                - Challenges and quests
-                
-                2. GAME DYNAMICS:
-                - Competition and collaboration balance
-                - Narrative and storytelling elements
-                - Player agency and choice
-                - Feedback loops
-                - Social interaction features
-                
-                3. LEARNING INTEGRATION:
-                - Curriculum-aligned objectives
-                - Assessment through gameplay
-                - Knowledge application scenarios
-                - Skill development pathways
-                
-                4. PLAYER MOTIVATION:
-                - Intrinsic motivation strategies
-                - Extrinsic reward systems
-                - Personalization options
-                - Social recognition features
-                
-                5. GAME PROGRESSION:
-                - Onboarding and tutorial design
-                - Difficulty scaling
-                - Mastery indicators
-                - Unlock systems
-                
-                6. PLATFORM CONSIDERATIONS:
-                - Technology requirements
-                - Accessibility features
-                - Multi-device compatibility
-                - Data analytics integration
-                
-                Balance fun and learning while maintaining educational rigor.
-                
-                {custom_instructions}
-                
-                {format_instructions}
-                """,
-                "input_variables": ["topic", "game_mechanics", "competition_level", "technology_platform", "custom_instructions"],
-                "defaults": {"game_mechanics": "Points, badges, levels", "competition_level": "Moderate", "technology_platform": "Web-based"}
-            },
-            
-            "peer_learning": {
-                "model": PeerLearningContent,
-                "prompt_template": """
-                Design a peer learning experience for "{topic}".
-                Group size: {group_size}
-                Collaboration type: {collaboration_type}
-                Skill diversity level: {skill_diversity}
-                
-                Create a comprehensive peer learning framework including:
-                
-                1. PEER LEARNING STRUCTURES:
-                - Think-Pair-Share activities
-                - Jigsaw method implementation
-                - Peer tutoring arrangements
-                - Reciprocal teaching protocols
-                - Collaborative problem-solving
-                
-                2. GROUP FORMATION STRATEGIES:
-                - Skill-based grouping
-                - Interest-based partnerships
-                - Random group formation
-                - Self-selected teams
-                - Rotating group structures
-                
-                3. COLLABORATION ACTIVITIES:
-                - Knowledge sharing sessions
-                - Peer review processes
-                - Joint problem-solving tasks
-                - Teaching role rotations
-                - Debate and discussion formats
-                
-                4. COMMUNICATION PROTOCOLS:
-                - Active listening guidelines
-                - Constructive feedback frameworks
-                - Conflict resolution strategies
-                - Digital collaboration tools
-                - Discussion facilitation techniques
-                
-                5. ACCOUNTABILITY MEASURES:
-                - Individual responsibility within groups
-                - Peer assessment rubrics
-                - Group reflection processes
-                - Progress monitoring systems
-                - Quality assurance checkpoints
-                
-                6. INSTRUCTOR FACILITATION:
-                - Monitoring and intervention strategies
-                - Guidance provision techniques
-                - Process observation methods
-                - Support for struggling groups
-                - Enhancement of successful collaboration
-                
-                Ensure equitable participation and mutual learning benefits for all students.
-                
-                {custom_instructions}
-                
-                {format_instructions}
-                """,
-                "input_variables": ["topic", "group_size", "collaboration_type", "skill_diversity", "custom_instructions"],
-                "defaults": {"group_size": "3-4 students", "collaboration_type": "Mixed", "skill_diversity": "Moderate"}
-            }
-        }
-        
-        # Validate pedagogy
-        if pedagogy not in pedagogy_configs:
-            available = list(pedagogy_configs.keys())
-            raise ValueError(f"Unknown pedagogy '{pedagogy}'. Available options: {available}")
-        
-        config = pedagogy_configs[pedagogy]
-        
-        # Set up parser and format instructions
-        parser = PydanticOutputParser(pydantic_object=config["model"])
-        format_instructions = parser.get_format_instructions()
-        
-        # Prepare prompt variables with defaults
-        prompt_vars = {"topic": topic, "custom_instructions": custom_instructions or ""}
-        
-        # Apply defaults and user-provided values
-        for var in config["input_variables"]:
-            if var not in ["topic", "custom_instructions"]:
-                default_value = config["defaults"].get(var, "")
-                prompt_vars[var] = kwargs.get(var, default_value)
-        
-        # Create prompt template
-        prompt = PromptTemplate(
-            input_variables=config["input_variables"],
-            template=config["prompt_template"],
-            partial_variables={"format_instructions": format_instructions}
-        )
-        
-        # Generate content
-        chain = prompt | self.llm
+
+        pedagogy_config = get_pedagogy(pedagogy)
+
+        # Template and parser are compiled once per pedagogy; only the variables change per call
+        prompt_vars = pedagogy_config.prompt_variables(topic, custom_instructions, **kwargs)
+        chain = pedagogy_config.prompt | self.llm
         result = chain.invoke(prompt_vars)
-        
+
         try:
-            return parser.parse(result.content)
+            return pedagogy_config.parser.parse(result.content)
         except Exception as e:
             print(f"Error parsing {pedagogy} content: {e}")
-            return config["model"](topic=topic)
-    
+            return pedagogy_config.model(topic=topic)
+
+    def generate_pedagogy_bundle(
+        self,
+        topic: str,
+        pedagogies: Optional[List[str]] = None,
+        custom_instructions: Optional[str] = None,
+        pedagogy_params: Optional[Dict[str, Dict[str, Any]]] = None,
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> PedagogyBundle:
+        """
+        Generate content for one topic with several pedagogies concurrently.
+
+        Args:
+            topic (str): The subject or topic for the content
+            pedagogies (List[str], optional): Pedagogies to run; defaults to every registered pedagogy
+            custom_instructions (str, optional): Additional instructions applied to every pedagogy
+            pedagogy_params (Dict[str, Dict], optional): Per-pedagogy parameters, e.g.
+                {"gamification": {"competition_level": "Low"}}
+            max_workers (int, optional): Maximum concurrent LLM calls; defaults to one per pedagogy
+            **kwargs: Parameters shared by all pedagogies (each uses only the ones it accepts)
+
+        Returns:
+            PedagogyBundle with a typed result, error (if any) and timing per pedagogy
+        """
+        jobs = self._pedagogy_jobs(topic, pedagogies, custom_instructions, pedagogy_params, kwargs)
+        start = time.perf_counter()
+
+        with ContextThreadPoolExecutor(max_workers=max_workers or len(jobs) or 1) as executor:
+            results = list(executor.map(lambda job: self._run_pedagogy(topic, *job), jobs))
+
+        return PedagogyBundle(
+            topic=topic,
+            results={result.pedagogy: result for result in results},
+            elapsed_seconds=time.perf_counter() - start
+        )
+
+    async def agenerate_pedagogy_bundle(
+        self,
+        topic: str,
+        pedagogies: Optional[List[str]] = None,
+        custom_instructions: Optional[str] = None,
+        pedagogy_params: Optional[Dict[str, Dict[str, Any]]] = None,
+        max_concurrency: Optional[int] = None,
+        **kwargs
+    ) -> PedagogyBundle:
+        """Async version of generate_pedagogy_bundle, using the model's native async calls."""
+        jobs = self._pedagogy_jobs(topic, pedagogies, custom_instructions, pedagogy_params, kwargs)
+        semaphore = asyncio.Semaphore(max_concurrency or len(jobs) or 1)
+        start = time.perf_counter()
+
+        async def run(pedagogy_config, prompt_vars):
+            async with semaphore:
+                job_start = time.perf_counter()
+                try:
+                    result = await (pedagogy_config.prompt | self.llm).ainvoke(prompt_vars)
+                except Exception as e:
+                    return PedagogyResult(
+                        pedagogy=pedagogy_config.name,
+                        error=f"{type(e).__name__}: {e}",
+                        elapsed_seconds=time.perf_counter() - job_start
+                    )
+                return self._pedagogy_result(topic, pedagogy_config, result.content, job_start)
+
+        results = await asyncio.gather(*(run(*job) for job in jobs))
+        return PedagogyBundle(
+            topic=topic,
+            results={result.pedagogy: result for result in results},
+            elapsed_seconds=time.perf_counter() - start
+        )
+
+    def _pedagogy_jobs(
+        self,
+        topic: str,
+        pedagogies: Optional[List[str]],
+        custom_instructions: Optional[str],
+        pedagogy_params: Optional[Dict[str, Dict[str, Any]]],
+        shared_params: Dict[str, Any]
+    ) -> List[Tuple[Pedagogy, Dict[str, Any]]]:
+        """Resolve pedagogies (failing fast on unknown names) and their prompt variables."""
+        jobs = []
+        for name in dict.fromkeys(pedagogies or list_pedagogies()):
+            # compile() up front so worker threads never race to build the same template
+            pedagogy_config = get_pedagogy(name).compile()
+            params = {**shared_params, **(pedagogy_params or {}).get(name, {})}
+            jobs.append((pedagogy_config, pedagogy_config.prompt_variables(topic, custom_instructions, **params)))
+        return jobs
+
+    def _run_pedagogy(self, topic: str, pedagogy_config: Pedagogy, prompt_vars: Dict[str, Any]) -> PedagogyResult:
+        start = time.perf_counter()
+        try:
+            result = (pedagogy_config.prompt | self.llm).invoke(prompt_vars)
+        except Exception as e:
+            return PedagogyResult(
+                pedagogy=pedagogy_config.name,
+                error=f"{type(e).__name__}: {e}",
+                elapsed_seconds=time.perf_counter() - start
+            )
+        return self._pedagogy_result(topic, pedagogy_config, result.content, start)
+
+    @staticmethod
+    def _pedagogy_result(topic: str, pedagogy_config: Pedagogy, raw_output: str, start: float) -> PedagogyResult:
+        try:
+            content, error = pedagogy_config.parser.parse(raw_output), None
+        except Exception as e:
+            error = f"Error parsing {pedagogy_config.name} content: {e}"
+            try:
+                content = pedagogy_config.model(topic=topic)
+            except Exception:
+                # Custom models may have other required fields; keep the error, not an empty model
+                content = None
+        return PedagogyResult(
+            pedagogy=pedagogy_config.name,
+            content=content,
+            error=error,
+            elapsed_seconds=time.perf_counter() - start
+        )
+
     def get_available_pedagogies(self) -> dict:
         """Get information about all available pedagogy methods and their parameters."""
-        return {
-            "blooms_taxonomy": {
-                "description": "Structures learning through six cognitive levels - Remember, Understand, Apply, Analyze, Evaluate, and Create.",
-                "parameters": {
-                    "target_level": "Cognitive level to focus on (default: 'All levels')",
-                    "grade_level": "Target grade level (default: 'General')"
-                }
-            },
-            "socratic_questioning": {
-                "description": "Guides learning through strategic questioning that promotes critical thinking and self-discovery.",
-                "parameters": {
-                    "depth_level": "Depth of inquiry (default: 'Intermediate')",
-                    "student_level": "Student level (default: 'High School')"
-                }
-            },
-            "project_based_learning": {
-                "description": "Engages students in complex, real-world projects that develop deep understanding and practical skills.",
-                "parameters": {
-                    "project_duration": "Project duration (default: '4-6 weeks')",
-                    "team_size": "Team size (default: '3-4 students')",
-                    "industry_focus": "Industry focus (default: 'General')"
-                }
-            },
-            "flipped_classroom": {
-                "description": "Students learn foundational content at home and engage in active learning during class time.",
-                "parameters": {
-                    "class_duration": "Class duration (default: '50 minutes')",
-                    "prep_time": "Preparation time (default: '30-45 minutes')",
-                    "technology_level": "Technology level (default: 'Moderate')"
-                }
-            },
-            "inquiry_based_learning": {
-                "description": "Students develop understanding through questioning, investigation, and discovery.",
-                "parameters": {
-                    "inquiry_type": "Type of inquiry (default: 'Guided')",
-                    "investigation_scope": "Investigation scope (default: 'Moderate')",
-                    "student_autonomy": "Student autonomy level (default: 'Balanced')"
-                }
-            },
-            "constructivist": {
-                "description": "Students actively build understanding through experience, reflection, and social interaction.",
-                "parameters": {
-                    "prior_knowledge_level": "Prior knowledge level (default: 'Mixed')",
-                    "social_interaction_focus": "Social interaction focus (default: 'High')",
-                    "reflection_emphasis": "Reflection emphasis (default: 'Strong')"
-                }
-            },
-            "gamification": {
-                "description": "Applies game design elements to increase engagement, motivation, and learning outcomes.",
-                "parameters": {
-                    "game_mechanics": "Game mechanics (default: 'Points, badges, levels')",
-                    "competition_level": "Competition level (default: 'Moderate')",
-                    "technology_platform": "Technology platform (default: 'Web-based')"
-                }
-            },
-            "peer_learning": {
-                "description": "Students learn from and with each other through structured collaborative activities.",
-                "parameters": {
-                    "group_size": "Group size (default: '3-4 students')",
-                    "collaboration_type": "Collaboration type (default: 'Mixed')",
-                    "skill_diversity": "Skill diversity level (default: 'Moderate')"
-                }
-            }
-        }
+        return {name: get_pedagogy(name).describe() for name in list_pedagogies()}
@@ -0,0 +1,284 @@
+# educhain/engines/pipeline.py
+
+import concurrent.futures
+import contextvars
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from langchain_community.callbacks.manager import get_openai_callback
+
+from educhain.core.config import LLMConfig
+from educhain.engines.content_engine import ContentEngine
+from educhain.engines.qna_engine import QnAEngine
+from educhain.models.pipeline_models import StageResult, PipelineResult
+from educhain.utils.content_paths import section_label
+
+SUMMARY_TEXT_LIMIT = 160
+
+
+def _clip(text: Any, limit: int = SUMMARY_TEXT_LIMIT) -> str:
+    text = " ".join(str(text).split())
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+def summarize_output(output: Any, limit: int = 2000) -> str:
+    """
+    Compact text summary of a stage output for downstream prompts: titles, objectives and
+    key concepts rather than the full generated object.
+    """
+    lines = []
+    if hasattr(output, "main_topics"):  # LessonPlan
+        lines.append(f"Lesson plan: {output.title}")
+        lines += [f"Objective: {_clip(objective)}" for objective in output.learning_objectives]
+        for main_topic in output.main_topics:
+            for subtopic in main_topic.subtopics:
+                concepts = "; ".join(_clip(element.content, 80) for element in subtopic.key_concepts[:3])
+                lines.append(f"- {main_topic.title} / {subtopic.title}: {concepts}")
+    elif hasattr(output, "key_concepts") and isinstance(output.key_concepts, dict):  # StudyGuide
+        lines.append(f"Study guide: {output.topic} ({output.difficulty_level or 'any level'})")
+        lines += [f"Objective: {_clip(objective)}" for objective in output.learning_objectives]
+        lines += [f"- {name}: {_clip(explanation)}" for name, explanation in output.key_concepts.items()]
+    elif hasattr(output, "flashcards"):  # FlashcardSet
+        lines.append(f"Flashcards already written ({len(output.flashcards)}):")
+        lines += [f"- {_clip(card.front, 100)}" for card in output.flashcards]
+    elif hasattr(output, "questions"):  # question lists
+        lines.append(f"Questions already written ({len(output.questions)}):")
+        lines += [f"- {_clip(getattr(question, 'question', question), 100)}" for question in output.questions]
+    else:
+        lines.append(section_label(output, limit))
+
+    summary = "\n".join(lines)
+    return summary if len(summary) <= limit else summary[:limit - 3] + "..."
+
+
+class StageContext:
+    """What a stage function receives: the topic, run parameters and its upstream results."""
+
+    def __init__(self, topic: str, params: Dict[str, Any], outputs: Dict[str, Any], summaries: Dict[str, str]):
+        self.topic = topic
+        self.params = params
+        self.outputs = outputs
+        self.summaries = summaries
+
+    def instructions(self, extra: Optional[str] = None) -> Optional[str]:
+        """custom_instructions for the stage: upstream summaries, the run's own instructions and ``extra``."""
+        parts = []
+        if self.summaries:
+            parts.append(
+                "Existing material for this topic. Stay consistent with it and build on it "
+                "instead of re-deriving the background:\n"
+                + "\n\n".join(self.summaries.values())
+            )
+        if self.params.get("custom_instructions"):
+            parts.append(self.params["custom_instructions"])
+        if extra:
+            parts.append(extra)
+        return "\n\n".join(parts) or None
+
+
+class PipelineStage:
+    def __init__(
+        self,
+        name: str,
+        run: Callable[[StageContext], Any],
+        depends_on: Iterable[str] = (),
+        summarize: Optional[Callable[[Any], str]] = None
+    ):
+        self.name = name
+        self.run = run
+        self.depends_on = list(depends_on)
+        self.summarize = summarize or summarize_output
+
+
+class ContentPipeline:
+    """
+    Runs dependent content-generation stages as a DAG.
+
+    Stages whose dependencies are met run concurrently, and each stage receives compact
+    summaries of its upstream outputs (see StageContext.instructions) instead of
+    regenerating that background. Timing and token usage are recorded per stage.
+
+    Example:
+        pipeline = ContentPipeline.standard(client)
+        result = pipeline.run("Photosynthesis", grade_level="Grade 8", num_flashcards=30)
+        result.show()
+        guide = result["study_guide"]
+    """
+
+    def __init__(
+        self,
+        content_engine: Optional[ContentEngine] = None,
+        qna_engine: Optional[QnAEngine] = None,
+        llm_config: Optional[LLMConfig] = None
+    ):
+        self.content_engine = content_engine or ContentEngine(llm_config)
+        self.qna_engine = qna_engine or QnAEngine(llm_config)
+        self.stages: Dict[str, PipelineStage] = {}
+
+    @classmethod
+    def from_client(cls, client: Any) -> "ContentPipeline":
+        """Pipeline sharing the engines of an Educhain client."""
+        return cls(content_engine=client.content_engine, qna_engine=client.qna_engine)
+
+    @classmethod
+    def standard(cls, client: Optional[Any] = None, llm_config: Optional[LLMConfig] = None) -> "ContentPipeline":
+        """
+        lesson_plan -> study_guide -> flashcards, with quiz running alongside the study guide.
+
+        Run parameters: grade_level, difficulty_level, sectioned, num_flashcards (20),
+        num_questions (10), question_type ("Multiple Choice"), custom_instructions.
+        """
+        pipeline = cls.from_client(client) if client is not None else cls(llm_config=llm_config)
+        content, qna = pipeline.content_engine, pipeline.qna_engine
+
+        pipeline.add_stage("lesson_plan", lambda ctx: content.generate_lesson_plan(
+            ctx.topic,
+            grade_level=ctx.params.get("grade_level"),
+            custom_instructions=ctx.instructions(),
+            sectioned=ctx.params.get("sectioned", False)
+        ))
+        pipeline.add_stage("study_guide", lambda ctx: content.generate_study_guide(
+            ctx.topic,
+            difficulty_level=ctx.params.get("difficulty_level"),
+            custom_instructions=ctx.instructions(),
+            sectioned=ctx.params.get("sectioned", False)
+        ), depends_on=["lesson_plan"])
+        pipeline.add_stage("flashcards", lambda ctx: content.generate_flashcards(
+            ctx.topic,
+            num=ctx.params.get("num_flashcards", 20),
+            custom_instructions=ctx.instructions("Focus the cards on the key concepts above.")
+        ), depends_on=["study_guide"])
+        pipeline.add_stage("quiz", lambda ctx: qna.generate_questions(
+            ctx.topic,
+            num=ctx.params.get("num_questions", 10),
+            question_type=ctx.params.get("question_type", "Multiple Choice"),
+            custom_instructions=ctx.instructions("Assess the lesson plan's learning objectives.")
+        ), depends_on=["lesson_plan"])
+        return pipeline
+
+    def add_stage(
+        self,
+        name: str,
+        run: Callable[[StageContext], Any],
+        depends_on: Iterable[str] = (),
+        summarize: Optional[Callable[[Any], str]] = None
+    ) -> "ContentPipeline":
+        """
+        Add a stage. ``run`` receives a StageContext and returns the stage output;
+        ``summarize`` turns that output into the text passed downstream (defaults to
+        summarize_output). Dependencies must already be added, which keeps the graph acyclic.
+        """
+        if name in self.stages:
+            raise ValueError(f"Stage '{name}' already exists")
+        missing = [dependency for dependency in depends_on if dependency not in self.stages]
+        if missing:
+            raise ValueError(f"Stage '{name}' depends on unknown stages: {missing}")
+        self.stages[name] = PipelineStage(name, run, depends_on, summarize)
+        return self
+
+    def remove_stage(self, name: str) -> "ContentPipeline":
+        """Remove a stage and every stage that depends on it, directly or indirectly."""
+        removed = {name}
+        for stage in self.stages.values():
+            if removed.intersection(stage.depends_on):
+                removed.add(stage.name)
+        for stage_name in removed:
+            self.stages.pop(stage_name, None)
+        return self
+
+    def run(
+        self,
+        topic: str,
+        stages: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+        **params
+    ) -> PipelineResult:
+        """
+        Run the pipeline for a topic.
+
+        Args:
+            topic: The learning topic
+            stages: Only run these stages (plus their dependencies); defaults to all
+            max_workers: Maximum concurrent stages; defaults to the number of stages
+            **params: Run parameters available to every stage as ``ctx.params``
+
+        Returns:
+            PipelineResult with every stage's output, summary, error, timing and token usage.
+            A failed stage does not stop independent stages; its dependents are skipped.
+        """
+        selected = self._with_dependencies(stages) if stages else list(self.stages)
+        results: Dict[str, StageResult] = {}
+        start = time.perf_counter()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or len(selected) or 1) as executor:
+            running = {}
+            waiting = list(selected)
+            while waiting or running:
+                for name in list(waiting):
+                    stage = self.stages[name]
+                    if not all(dependency in results for dependency in stage.depends_on):
+                        continue
+                    waiting.remove(name)
+                    failed = [dependency for dependency in stage.depends_on if not results[dependency].ok]
+                    if failed:
+                        results[name] = StageResult(
+                            name=name, depends_on=stage.depends_on, skipped=True,
+                            error=f"Skipped because {', '.join(failed)} failed"
+                        )
+                        continue
+                    context = StageContext(
+                        topic, params,
+                        {dependency: results[dependency].output for dependency in stage.depends_on},
+                        {dependency: results[dependency].summary for dependency in stage.depends_on}
+                    )
+                    # Each stage runs in its own context so token counting stays per stage
+                    future = executor.submit(contextvars.copy_context().run, self._run_stage, stage, context)
+                    running[future] = name
+
+                if not running:
+                    continue
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
+
+        return PipelineResult(
+            topic=topic,
+            stages={name: results[name] for name in selected},
+            elapsed_seconds=time.perf_counter() - start
+        )
+
+    def _with_dependencies(self, names: List[str]) -> List[str]:
+        unknown = [name for name in names if name not in self.stages]
+        if unknown:
+            raise ValueError(f"Unknown stages: {unknown}. Available stages: {list(self.stages)}")
+        needed = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name not in needed:
+                needed.add(name)
+                pending.extend(self.stages[name].depends_on)
+        return [name for name in self.stages if name in needed]
+
+    @staticmethod
+    def _run_stage(stage: PipelineStage, context: StageContext) -> StageResult:
+        start = time.perf_counter()
+        output, summary, error = None, None, None
+        with get_openai_callback() as cb:
+            try:
+                output = stage.run(context)
+                summary = stage.summarize(output)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+        return StageResult(
+            name=stage.name,
+            output=output,
+            summary=summary,
+            error=error,
+            depends_on=stage.depends_on,
+            elapsed_seconds=time.perf_counter() - start,
+            prompt_tokens=cb.prompt_tokens,
+            completion_tokens=cb.completion_tokens,
+            total_tokens=cb.total_tokens,
+            total_cost=cb.total_cost
+        )
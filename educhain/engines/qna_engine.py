@@ -17,8 +17,6 @@
 from langchain_classic.chains.retrieval_qa.base import RetrievalQA
 from langchain_community.vectorstores import Chroma
 from langchain_community.callbacks.manager import get_openai_callback
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api.formatters import TextFormatter
 import re
 from langchain_core.messages import SystemMessage
 from langchain_core.messages import HumanMessage
@@ -29,21 +27,25 @@
     VisualMCQList, VisualMCQ, BulkMCQ, BulkMCQList, ShortAnswerQuestion, TrueFalseQuestion, FillInBlankQuestion,
     BulkShortAnswerQuestion, BulkShortAnswerQuestionList,
     BulkTrueFalseQuestion, BulkTrueFalseQuestionList,
-    BulkFillInBlankQuestion, BulkFillInBlankQuestionList
+    BulkFillInBlankQuestion, BulkFillInBlankQuestionList,
+    TimestampedQuestion, TimestampedQuestionList, DistractorSetList
 )
 from educhain.utils.loaders import PdfFileLoader, UrlLoader
+from educhain.utils.cache import ExtractionCache
+from educhain.utils.transcripts import TranscriptProvider, YouTubeTranscriptProvider
+from educhain.utils.chunking import split_text_into_chunks, allocate_quotas, dedupe_by_text, normalize_text
+from educhain.utils.math_solver import evaluate_expression
+from educhain.utils.distractors import generate_numeric_distractors
 from educhain.utils.output_formatter import OutputFormatter
+from educhain.utils.visual_renderer import render_graph, ChartAssetStore
+from educhain.utils.images import encode_image_file, DoubtResultCache
 import base64
 import os
-from PIL import Image
-import io
 import csv
-import matplotlib.pyplot as plt
-import pandas as pd
-import dataframe_image as dfi
 from IPython.display import display, HTML
 
 
+import math
 import random
 
 QuestionType = Literal["Multiple Choice", "Short Answer", "True/False", "Fill in the Blank"]
@@ -135,12 +137,21 @@
 """
 
 class QnAEngine:
-    def __init__(self, llm_config: Optional[LLMConfig] = None):
+    def __init__(
+        self,
+        llm_config: Optional[LLMConfig] = None,
+        extraction_cache: Optional[ExtractionCache] = None,
+        transcript_provider: Optional[TranscriptProvider] = None,
+        doubt_cache: Optional[DoubtResultCache] = None
+    ):
         if llm_config is None:
             llm_config = LLMConfig()
         self.llm = self._initialize_llm(llm_config)
-        self.pdf_loader = PdfFileLoader()
-        self.url_loader = UrlLoader()
+        self.extraction_cache = extraction_cache
+        self.transcript_provider = transcript_provider or YouTubeTranscriptProvider()
+        self.doubt_cache = doubt_cache if doubt_cache is not None else DoubtResultCache()
+        self.pdf_loader = PdfFileLoader(cache=extraction_cache)
+        self.url_loader = UrlLoader(cache=extraction_cache)
         self.embeddings = None
 
     def _initialize_llm(self, llm_config: LLMConfig):
@@ -246,62 +257,7 @@ def _handle_output_format(self, data: Any, output_format: Optional[OutputFormatT
 
     def _generate_and_save_visual(self, instruction, question_text, options, correct_answer):
         try:
-            plt.figure(figsize=(10, 8))
-            img_buffer = io.BytesIO()
-
-            if instruction["type"] == "bar":
-                plt.bar(instruction["x_labels"], instruction["y_values"], color="skyblue")
-                plt.xlabel("Categories", fontsize=12)
-                plt.ylabel(instruction["y_label"], fontsize=12)
-                plt.title(instruction["title"], fontsize=14)
-                plt.grid(axis="y", linestyle="--", alpha=0.7)
-                plt.tight_layout()
-                plt.savefig(img_buffer, format="png")
-
-            elif instruction["type"] == "line":
-                if isinstance(instruction["y_values"][0], list):
-                    for i, y_vals in enumerate(instruction["y_values"]):
-                        plt.plot(instruction["x_labels"], y_vals, marker="o", linestyle="-", label=instruction["labels"][i])
-                else:
-                    plt.plot(instruction["x_labels"], instruction["y_values"], marker="o", linestyle="-", color="b")
-
-                plt.xlabel("X-axis", fontsize=12)
-                plt.ylabel(instruction["y_label"], fontsize=12)
-                plt.title(instruction["title"], fontsize=14)
-                plt.grid(axis="y", linestyle="--", alpha=0.7)
-                plt.legend()
-                plt.tight_layout()
-                plt.savefig(img_buffer, format="png")
-
-            elif instruction["type"] == "pie":
-                plt.pie(
-                    instruction["sizes"],
-                    labels=instruction["labels"],
-                    autopct="%1.1f%%",
-                    startangle=90,
-                    colors=plt.cm.Paired.colors
-                )
-                plt.title(instruction["title"], fontsize=14)
-                plt.tight_layout()
-                plt.savefig(img_buffer, format="png")
-
-            elif instruction["type"] == "scatter":
-                plt.scatter(instruction["x_values"], instruction["y_values"], color="r", alpha=0.7)
-                plt.xlabel("X-axis", fontsize=12)
-                plt.ylabel(instruction["y_label"], fontsize=12)
-                plt.title(instruction["title"], fontsize=14)
-                plt.grid(axis="both", linestyle="--", alpha=0.7)
-                plt.tight_layout()
-                plt.savefig(img_buffer, format="png")
-
-            elif instruction["type"] == "table":
-                df = pd.DataFrame(instruction["data"])
-                img_buffer = io.BytesIO()
-                dfi.export(df, img_buffer, table_conversion="matplotlib")
-
-            plt.close()
-            img_buffer.seek(0)
-            img_base64 = base64.b64encode(img_buffer.read()).decode('utf-8')
+            img_base64 = base64.b64encode(render_graph(instruction)).decode('utf-8')
 
             if instruction["type"] != "table":
                 display(HTML(f'<img src="data:image/png;base64,{img_base64}" style="max-width:500px; max-height:400px;">'))
@@ -335,14 +291,37 @@ def _display_visual_questions(self, ques: VisualMCQList):
             print("Failed to generate visual questions or no questions were returned.")
 
 
+    @staticmethod
+    def _visual_export_records(questions: VisualMCQList, asset_store: ChartAssetStore) -> List[Dict[str, Any]]:
+        """Flatten visual questions for export, referencing stored chart files instead of chart data."""
+        records = []
+        for question in questions.questions:
+            record = question.dict(exclude={"graph_instruction"})
+            record["chart_file"] = str(asset_store.path_for(question.chart_id)) if question.chart_id else None
+            records.append(record)
+        return records
+
     def generate_visual_questions(
         self,
         topic: str,
         num: int = 1,
         custom_instructions: Optional[str] = None,
         output_format: Optional[OutputFormatType] = None,
+        render: bool = False,
+        asset_store: Optional[ChartAssetStore] = None,
         **kwargs
     ) -> Optional[VisualMCQList]:
+        """
+        Generate questions that each come with a chart or table (``graph_instruction``).
+
+        Args:
+            render: Also render and display every chart before returning (notebook use).
+                Off by default, so generation takes only as long as the LLM call; charts are
+                rendered on demand with ``question.render(format="png" | "svg")``.
+            asset_store: Store every chart (deduplicated) in this ChartAssetStore and set
+                each question's ``chart_id``. Exports then reference chart files instead
+                of embedding chart data.
+        """
         parser, model = self._get_parser_and_model("Multiple Choice", VisualMCQList)
         format_instructions = parser.get_format_instructions()
         template = self._get_prompt_template("Multiple Choice", "graph")
@@ -367,10 +346,16 @@ def generate_visual_questions(
         try:
             structured_output = parser.parse(results)
 
+            if asset_store is not None:
+                asset_store.store_questions(structured_output)
+
             if output_format:
-                self._handle_output_format(structured_output, output_format)
+                export_data = structured_output
+                if asset_store is not None:
+                    export_data = self._visual_export_records(structured_output, asset_store)
+                self._handle_output_format(export_data, output_format)
 
-            if isinstance(structured_output, VisualMCQList):
+            if render and isinstance(structured_output, VisualMCQList):
                 self._display_visual_questions(structured_output)
 
             return structured_output
@@ -437,9 +422,46 @@ def generate_questions_from_data(
         custom_instructions: Optional[str] = None,
         response_model: Optional[Type[Any]] = None,
         output_format: Optional[OutputFormatType] = None,
+        chunk_size: Optional[int] = None,
+        chunk_overlap: int = 200,
+        max_workers: Optional[int] = None,
+        max_topup_rounds: int = 2,
         **kwargs
     ) -> Any:
+        """
+        Generate questions from a PDF, URL or raw text source.
+
+        Args:
+            source: Path to a PDF, a URL, or the text itself
+            source_type: One of 'pdf', 'url' or 'text'
+            num: Number of questions to generate
+            chunk_size: When set, split the source into chunks of at most this many tokens,
+                give each chunk a share of ``num`` proportional to its length, generate the
+                chunks in parallel and merge the de-duplicated results. Keeps every prompt
+                bounded for long documents.
+            chunk_overlap: Token overlap between consecutive chunks (chunked mode only)
+            max_workers: Maximum number of concurrent chunk requests (chunked mode only)
+            max_topup_rounds: Extra rounds that replace duplicates and failed chunks (chunked mode
+                only); if the model keeps repeating itself, fewer than ``num`` questions are returned
+        """
         content = self._load_data(source, source_type)
+
+        if chunk_size is not None:
+            return self._generate_questions_from_chunks(
+                content=content,
+                num=num,
+                question_type=question_type,
+                prompt_template=prompt_template,
+                custom_instructions=custom_instructions,
+                response_model=response_model,
+                output_format=output_format,
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                max_workers=max_workers,
+                max_topup_rounds=max_topup_rounds,
+                **kwargs
+            )
+
         return self.generate_questions(
             topic=content,
             num=num,
@@ -451,6 +473,101 @@ def generate_questions_from_data(
             **kwargs
         )
 
+    def _generate_questions_from_chunks(
+        self,
+        content: str,
+        num: int,
+        question_type: QuestionType = "Multiple Choice",
+        prompt_template: Optional[str] = None,
+        custom_instructions: Optional[str] = None,
+        response_model: Optional[Type[Any]] = None,
+        output_format: Optional[OutputFormatType] = None,
+        chunk_size: int = 2000,
+        chunk_overlap: int = 200,
+        max_workers: Optional[int] = None,
+        max_topup_rounds: int = 2,
+        **kwargs
+    ) -> Any:
+        """
+        Map-reduce generation: one bounded request per chunk, then merge and de-duplicate.
+        Questions lost to duplicates or failed chunks are requested again, up to ``max_topup_rounds`` times.
+        """
+        _, model = self._get_parser_and_model(question_type, response_model)
+
+        chunks = split_text_into_chunks(content, chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        if len(chunks) <= 1:
+            return self.generate_questions(
+                topic=content,
+                num=num,
+                question_type=question_type,
+                prompt_template=prompt_template,
+                custom_instructions=custom_instructions,
+                response_model=response_model,
+                output_format=output_format,
+                **kwargs
+            )
+
+        weights = [len(chunk) for chunk in chunks]
+        targets = allocate_quotas(num, weights)
+        quotas = targets
+        tagged: List[Tuple[Any, int]] = []
+
+        for round_number in range(max_topup_rounds + 1):
+            chunk_results = {}
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for index, (chunk, quota) in enumerate(zip(chunks, quotas)):
+                    if quota <= 0:
+                        continue
+                    chunk_instructions = custom_instructions
+                    existing = [getattr(question, 'question', str(question)) for question, i in tagged if i == index]
+                    if existing:
+                        chunk_instructions = (
+                            f"{custom_instructions or ''}\nDo not repeat any of these existing questions:\n"
+                            + "\n".join(f"- {text}" for text in existing[-30:])
+                        )
+                    future = executor.submit(
+                        self.generate_questions,
+                        topic=chunk,
+                        num=quota,
+                        question_type=question_type,
+                        prompt_template=prompt_template,
+                        custom_instructions=chunk_instructions,
+                        response_model=response_model,
+                        **kwargs
+                    )
+                    futures[future] = index
+                for future in concurrent.futures.as_completed(futures):
+                    index = futures[future]
+                    try:
+                        chunk_results[index] = future.result()
+                    except Exception as e:
+                        print(f"Error generating questions for chunk {index + 1}/{len(chunks)}: {e}")
+
+            for index in sorted(chunk_results):
+                tagged.extend((question, index) for question in getattr(chunk_results[index], 'questions', None) or [])
+            unique_ids = {id(question) for question in dedupe_by_text([question for question, _ in tagged])}
+            tagged = [(question, index) for question, index in tagged if id(question) in unique_ids]
+
+            shortfall = num - len(tagged)
+            if shortfall <= 0 or round_number == max_topup_rounds:
+                break
+            # Ask again for what duplicates and failed chunks cost, from the chunks furthest below their share
+            counts = [sum(1 for _, i in tagged if i == index) for index in range(len(chunks))]
+            missing = [max(target - count, 0) for target, count in zip(targets, counts)]
+            quotas = allocate_quotas(shortfall, missing if sum(missing) else weights)
+
+        if len(tagged) < num:
+            print(f"Generated {len(tagged)} distinct questions out of {num} requested.")
+        # Document order: top-up questions join their chunk's earlier ones
+        merged_questions = [question for question, _ in sorted(tagged, key=lambda item: item[1])][:num]
+        structured_output = model(questions=merged_questions)
+
+        if output_format:
+            self._handle_output_format(structured_output, output_format)
+
+        return structured_output
+
     def generate_questions_with_rag(
         self,
         source: str,
@@ -530,6 +647,113 @@ def generate_similar_options(self, question, correct_answer, num_options=3):
         response_content = response.content if hasattr(response, 'content') else str(response)
         return response_content.split(';')
 
+    def generate_similar_options_batch(
+        self,
+        items: List[Tuple[str, str]],
+        num_options: int = 3,
+        batch_size: int = 20,
+        max_concurrency: int = 4,
+        max_retries: int = 2,
+        show_progress: bool = True
+    ) -> List[List[str]]:
+        """
+        Generate distractors for many (question, correct_answer) pairs with few LLM calls.
+
+        Pairs are sent ``batch_size`` at a time and answered as JSON keyed by index, with at
+        most ``max_concurrency`` requests in flight. Each item's distractors are validated
+        (``num_options`` distinct, non-empty options that differ from the correct answer);
+        only the items that fail are retried, up to ``max_retries`` more times.
+
+        Returns:
+            One list of distractors per input pair, in input order. Items that never
+            validated get an empty list.
+        """
+        results: List[List[str]] = [[] for _ in items]
+        pending = list(range(len(items)))
+        progress = tqdm(total=len(items), desc="Generating distractors", disable=not show_progress)
+
+        for attempt in range(max_retries + 1):
+            if not pending:
+                break
+            batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                futures = {
+                    executor.submit(self._generate_distractor_batch, items, batch, num_options): batch
+                    for batch in batches
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        batch_results = future.result()
+                    except Exception as e:
+                        print(f"Error generating distractor batch (attempt {attempt + 1}): {e}")
+                        continue
+                    for index, distractors in batch_results.items():
+                        if not results[index]:
+                            results[index] = distractors
+                            progress.update(1)
+
+            pending = [index for index in pending if not results[index]]
+
+        progress.close()
+        if pending:
+            print(f"Could not generate valid distractors for {len(pending)} of {len(items)} items")
+        return results
+
+    def _generate_distractor_batch(
+        self,
+        items: List[Tuple[str, str]],
+        indices: List[int],
+        num_options: int
+    ) -> Dict[int, List[str]]:
+        """Request distractors for one batch and return only the sets that pass validation."""
+        parser = PydanticOutputParser(pydantic_object=DistractorSetList)
+        prompt = PromptTemplate(
+            input_variables=["num_options", "items"],
+            template="""
+            For each numbered question below, generate {num_options} incorrect but plausible options
+            that are similar in form and length to its correct answer. Options must be distinct,
+            must not be correct, and must not start or end with any symbols.
+            Return one entry per question and copy its index exactly.
+
+            {items}
+
+            The response should be in JSON format.
+            {format_instructions}
+            """,
+            partial_variables={"format_instructions": parser.get_format_instructions()}
+        )
+        listing = "\n".join(
+            f"[{index}] Question: {items[index][0]}\n    Correct answer: {items[index][1]}"
+            for index in indices
+        )
+
+        response = (prompt | self.llm).invoke({"num_options": num_options, "items": listing})
+        response_content = response.content if hasattr(response, 'content') else str(response)
+        parsed = parser.parse(response_content)
+
+        requested = set(indices)
+        valid = {}
+        for item in parsed.items:
+            if item.index in requested and item.index not in valid:
+                distractors = self._validate_distractors(item.distractors, items[item.index][1], num_options)
+                if distractors:
+                    valid[item.index] = distractors
+        return valid
+
+    @staticmethod
+    def _validate_distractors(distractors: List[str], correct_answer: str, num_options: int) -> Optional[List[str]]:
+        answer_key = normalize_text(correct_answer)
+        seen = set()
+        cleaned = []
+        for distractor in distractors:
+            distractor = str(distractor).strip().strip(';').strip()
+            key = normalize_text(distractor)
+            if not key or key == answer_key or key in seen:
+                continue
+            seen.add(key)
+            cleaned.append(distractor)
+        return cleaned[:num_options] if len(cleaned) >= num_options else None
+
     def _process_math_result(self, math_result: Any) -> str:
         # Handle direct LLM response (has .content attribute)
         if hasattr(math_result, 'content'):
@@ -575,8 +799,16 @@ def generate_mcq_math(
         prompt_template: Optional[str] = None,
         custom_instructions: Optional[str] = None,
         response_model: Optional[Type[Any]] = None,
+        max_workers: Optional[int] = None,
         **kwargs
     ) -> Any:
+        """
+        Generate math MCQs whose correct answers are computed rather than guessed.
+
+        Each question's ``expression`` is evaluated locally with a safe arithmetic
+        evaluator. Only questions whose expression is missing or cannot be evaluated
+        fall back to an LLM solve, and those calls run concurrently (``max_workers``).
+        """
         if response_model is None:
             parser = PydanticOutputParser(pydantic_object=MCQListMath)
         else:
@@ -597,6 +829,7 @@ def generate_mcq_math(
             2. Set requires_math to true
             3. Provide clear numerical values
             4. Ensure the question has a single, unambiguous answer
+            5. Set expression to the arithmetic expression that computes the answer, e.g. "0.15 * 2400" or "sqrt(3**2 + 4**2)"
 
             Topic: {topic}
 
@@ -631,61 +864,79 @@ def generate_mcq_math(
             print("Raw output:")
             return MCQListMath()
 
-        for question in structured_output.questions:
-            if question.requires_math:
-                try:
-                    # Use direct LLM call instead of LLMMathChain for better compatibility
-                    math_prompt = f"""
-                    Solve this math problem step by step and provide ONLY the final numerical answer:
-                    
-                    {question.question}
-                    
-                    Final Answer: [numerical value only]
-                    """
-                    math_result = self.llm.invoke(math_prompt)
+        solutions = {}
+        unsolved = []
+        for index, question in enumerate(structured_output.questions):
+            if not question.requires_math:
+                continue
+            try:
+                solutions[index] = evaluate_expression(getattr(question, 'expression', None))
+            except ValueError:
+                unsolved.append(index)
 
+        if unsolved:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._solve_math_with_llm, structured_output.questions[index].question): index
+                    for index in unsolved
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    index = futures[future]
                     try:
-                        solution = self._process_math_result(math_result)
-
-                        numerical_solution = float(solution)
-                        formatted_solution = f"{numerical_solution:.2f}"
+                        solutions[index] = future.result()
+                    except Exception as e:
+                        print(f"Math calculation failed: {str(e)}")
 
-                        question.explanation += f"\n\nMath solution: {formatted_solution}"
+        # inf/nan (e.g. an LLM answering "inf") cannot be shown as options; treat them as unsolved
+        solved = sorted(
+            index for index, solution in solutions.items()
+            if isinstance(solution, (int, float)) and math.isfinite(solution)
+        )
+        option_sets = dict(zip(solved, generate_numeric_distractors([solutions[index] for index in solved])))
 
-                        correct_option = Option(text=formatted_solution, correct='true')
+        for index, question in enumerate(structured_output.questions):
+            if not question.requires_math:
+                continue
+            if index in option_sets:
+                self._apply_math_solution(question, *option_sets[index])
+            else:
+                question.explanation = (question.explanation or "") + "\n\nMath solution: Unable to compute."
+                question.options = [
+                    Option(text="Unable to compute", correct='true'),
+                    Option(text="N/A", correct='false'),
+                    Option(text="N/A", correct='false'),
+                    Option(text="N/A", correct='false')
+                ]
 
-                        variations = [0.9, 1.1, 1.2]
-                        incorrect_options = []
+        return structured_output
 
-                        for var in variations:
-                            wrong_val = numerical_solution * var
-                            incorrect_options.append(
-                                Option(
-                                    text=f"{wrong_val:.2f}",
-                                    correct='false'
-                                )
-                            )
+    def _solve_math_with_llm(self, question_text: str) -> float:
+        # Use direct LLM call instead of LLMMathChain for better compatibility
+        math_prompt = f"""
+        Solve this math problem step by step and provide ONLY the final numerical answer:
 
-                        question.options = [correct_option] + incorrect_options
-                        random.shuffle(question.options)
+        {question_text}
 
-                    except (ValueError, TypeError) as e:
-                        print(f"Error processing numerical result: {e}")
-                        raise
+        Final Answer: [numerical value only]
+        """
+        math_result = self.llm.invoke(math_prompt)
+        try:
+            return float(self._process_math_result(math_result))
+        except (ValueError, TypeError) as e:
+            print(f"Error processing numerical result: {e}")
+            raise
 
-                except Exception as e:
-                    print(f"Math calculation failed: {str(e)}")
-                    question.explanation += "\n\nMath solution: Unable to compute."
-                    question.options = [
-                        Option(text="Unable to compute", correct='true'),
-                        Option(text="N/A", correct='false'),
-                        Option(text="N/A", correct='false'),
-                        Option(text="N/A", correct='false')
-                    ]
+    def _apply_math_solution(self, question: Any, formatted_solution: str, distractors: List[str]) -> None:
+        question.explanation = (question.explanation or "") + f"\n\nMath solution: {formatted_solution}"
 
-        return structured_output
+        question.options = [Option(text=formatted_solution, correct='true')] + [
+            Option(text=distractor, correct='false') for distractor in distractors
+        ]
+        random.shuffle(question.options)
 
     def _extract_video_id(self, url: str) -> str:
+        if re.fullmatch(r'[A-Za-z0-9_-]{11}', url):
+            return url
         pattern = r'(?:https?:\/\/)?(?:www\.)?(?:youtube\.com|youtu\.be)\/(?:watch\?v=|embed\/|v\/|shorts\/|live\/|feature=player_embedded&v=|e\/)?([A-Za-z0-9_-]{11})'
         match = re.search(pattern, url)
         if match:
@@ -693,45 +944,188 @@ def _extract_video_id(self, url: str) -> str:
         raise ValueError("Invalid YouTube URL")
 
     def _get_youtube_transcript(self, video_id: str, target_language: str = 'en') -> tuple[str, str]:
+        snippets, language = self._get_youtube_snippets(video_id, target_language)
+        return "\n".join(snippet["text"] for snippet in snippets), language
+
+    def _get_youtube_snippets(self, video_id: str, target_language: str = 'en') -> tuple[List[Dict[str, Any]], str]:
+        """Return the transcript as ``[{"text", "start", "duration"}, ...]`` plus its language, via the cache when set."""
+        if self.extraction_cache is None:
+            return self._fetch_youtube_snippets(video_id, target_language)
+
+        cache_key = self.extraction_cache.make_key("youtube_snippets", video_id, target_language)
+        entry = self.extraction_cache.get(cache_key)
+        if entry is not None:
+            return entry["content"], entry["metadata"]["language"]
+
+        snippets, language = self._fetch_youtube_snippets(video_id, target_language)
+        self.extraction_cache.set(cache_key, snippets, {"language": language})
+        return snippets, language
+
+    def _fetch_youtube_snippets(self, video_id: str, target_language: str = 'en') -> tuple[List[Dict[str, Any]], str]:
+        return self.transcript_provider.fetch(video_id, target_language)
+
+    @staticmethod
+    def _segment_transcript(snippets: List[Dict[str, Any]], segment_duration: float) -> List[Dict[str, Any]]:
+        """Group transcript snippets into consecutive windows of roughly ``segment_duration`` seconds."""
+        if segment_duration <= 0:
+            raise ValueError("segment_duration must be positive")
+
+        segments = []
+        current = None
+        for snippet in snippets:
+            text = snippet.get("text", "").strip()
+            if not text:
+                continue
+            start = float(snippet.get("start", 0.0))
+            end = start + float(snippet.get("duration", 0.0))
+            if current is None or start >= current["start"] + segment_duration:
+                current = {"start": start, "end": end, "texts": []}
+                segments.append(current)
+            current["texts"].append(text)
+            current["end"] = max(current["end"], end)
+
+        return [
+            {"start": segment["start"], "end": segment["end"], "text": "\n".join(segment["texts"])}
+            for segment in segments
+        ]
+
+    def generate_questions_from_youtube(
+        self,
+        url: str,
+        num: int = 1,
+        question_type: QuestionType = "Multiple Choice",
+        prompt_template: Optional[str] = None,
+        custom_instructions: Optional[str] = None,
+        response_model: Optional[Type[Any]] = None,
+        output_format: Optional[OutputFormatType] = None,
+        target_language: str = 'en',
+        preserve_original_language: bool = False,
+        segment_duration: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Generate questions from the transcript of a YouTube video.
+
+        Args:
+            url: YouTube video URL or 11-character video id
+            num: Number of questions to generate
+            target_language: Language to fetch (or translate) the transcript into
+            preserve_original_language: Keep questions in the transcript's language
+            segment_duration: When set, split the transcript into windows of this many
+                seconds, generate each window's share of ``num`` concurrently and return a
+                TimestampedQuestionList linking every question to its start/end time.
+            max_workers: Maximum number of concurrent segment requests (segmented mode only)
+        """
         try:
-            transcript_list = YouTubeTranscriptApi().list(video_id)
+            video_id = self._extract_video_id(url)
+            snippets, detected_language = self._get_youtube_snippets(video_id, target_language)
+            return self._generate_questions_from_transcript(
+                video_id=video_id,
+                snippets=snippets,
+                detected_language=detected_language,
+                num=num,
+                question_type=question_type,
+                prompt_template=prompt_template,
+                custom_instructions=custom_instructions,
+                response_model=response_model,
+                output_format=output_format,
+                target_language=target_language,
+                preserve_original_language=preserve_original_language,
+                segment_duration=segment_duration,
+                max_workers=max_workers,
+                **kwargs
+            )
 
-            available_languages = [transcript.language_code for transcript in transcript_list]
+        except ValueError as ve:
+            raise ValueError(f"YouTube processing error: {str(ve)}")
+        except Exception as e:
+            raise Exception(f"Unexpected error processing YouTube video: {str(e)}")
 
-            if not available_languages:
-                raise ValueError("No transcripts available for this video")
+    def generate_questions_from_youtube_batch(
+        self,
+        urls: List[str],
+        num: int = 1,
+        question_type: QuestionType = "Multiple Choice",
+        target_language: str = 'en',
+        fetch_workers: int = 8,
+        generation_workers: int = 4,
+        show_progress: bool = True,
+        **kwargs
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Generate questions for many YouTube videos, e.g. every lecture in a course playlist.
 
-            try:
-                transcript = transcript_list.find_transcript([target_language])
-                return TextFormatter().format_transcript(transcript.fetch()), target_language
-            except:
-                transcript = transcript_list.find_transcript(available_languages)
-                original_language = transcript.language_code
+        Transcripts are fetched concurrently (``fetch_workers`` at a time) and each video is
+        handed to the generation pool as soon as its transcript arrives, so fetching and
+        generation overlap. Transcripts go through the extraction cache when one is configured.
 
-                if transcript.is_translatable and target_language != original_language:
-                    translated = transcript.translate(target_language)
-                    return TextFormatter().format_transcript(translated.fetch()), target_language
+        Args:
+            urls: YouTube URLs or bare 11-character video ids. Duplicates are processed once.
+            num: Number of questions per video
+            fetch_workers: Maximum concurrent transcript requests
+            generation_workers: Maximum videos being generated at once
+            show_progress: Show a progress bar over completed videos
+            **kwargs: Passed to generate_questions_from_youtube for every video
+                (e.g. custom_instructions, segment_duration, response_model)
 
-                return TextFormatter().format_transcript(transcript.fetch()), original_language
+        Returns:
+            Tuple of ({url: questions} for successful videos, {url: error message} for failures)
+        """
+        results = {}
+        failures = {}
+        video_ids = {}
+        for url in dict.fromkeys(urls):
+            try:
+                video_ids[url] = self._extract_video_id(url)
+            except ValueError as e:
+                failures[url] = f"ValueError: {e}"
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=fetch_workers) as fetch_pool, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=generation_workers) as generation_pool:
+            fetch_futures = {
+                fetch_pool.submit(self._get_youtube_snippets, video_id, target_language): url
+                for url, video_id in video_ids.items()
+            }
+            generation_futures = {}
+            progress = tqdm(total=len(video_ids), desc="Generating questions from videos", disable=not show_progress)
 
-        except Exception as e:
-            error_message = str(e).lower()
-            if "transcriptsdisabled" in error_message:
-                raise ValueError(
-                    "This video does not have subtitles/closed captions enabled. "
-                    "Available languages: " + ", ".join(available_languages)
-                )
-            elif "notranscriptfound" in error_message:
-                raise ValueError(
-                    f"No transcript found for language '{target_language}'. "
-                    f"Available languages: {', '.join(available_languages)}"
+            for future in concurrent.futures.as_completed(fetch_futures):
+                url = fetch_futures[future]
+                try:
+                    snippets, detected_language = future.result()
+                except Exception as e:
+                    failures[url] = f"{type(e).__name__}: {e}"
+                    progress.update(1)
+                    continue
+                generation_future = generation_pool.submit(
+                    self._generate_questions_from_transcript,
+                    video_id=video_ids[url],
+                    snippets=snippets,
+                    detected_language=detected_language,
+                    num=num,
+                    question_type=question_type,
+                    target_language=target_language,
+                    **kwargs
                 )
-            else:
-                raise ValueError(f"Error fetching transcript: {str(e)}")
+                generation_futures[generation_future] = url
 
-    def generate_questions_from_youtube(
+            for future in concurrent.futures.as_completed(generation_futures):
+                url = generation_futures[future]
+                try:
+                    results[url] = future.result()
+                except Exception as e:
+                    failures[url] = f"{type(e).__name__}: {e}"
+                progress.update(1)
+            progress.close()
+
+        return results, failures
+
+    def _generate_questions_from_transcript(
         self,
-        url: str,
+        video_id: str,
+        snippets: List[Dict[str, Any]],
+        detected_language: str,
         num: int = 1,
         question_type: QuestionType = "Multiple Choice",
         prompt_template: Optional[str] = None,
@@ -740,57 +1134,129 @@ def generate_questions_from_youtube(
         output_format: Optional[OutputFormatType] = None,
         target_language: str = 'en',
         preserve_original_language: bool = False,
+        segment_duration: Optional[float] = None,
+        max_workers: Optional[int] = None,
         **kwargs
     ) -> Any:
-        try:
-            video_id = self._extract_video_id(url)
-            transcript, detected_language = self._get_youtube_transcript(video_id, target_language)
+        transcript = "\n".join(snippet["text"] for snippet in snippets)
 
-            if not transcript:
-                raise ValueError("No transcript content retrieved from the video")
+        if not transcript:
+            raise ValueError("No transcript content retrieved from the video")
 
-            language_context = f"\nContent language: {detected_language}"
-            if detected_language != target_language and not preserve_original_language:
-                language_context += f"\nGenerate questions in {target_language}"
+        language_context = f"\nContent language: {detected_language}"
+        if detected_language != target_language and not preserve_original_language:
+            language_context += f"\nGenerate questions in {target_language}"
 
-            video_context = f"\nThis content is from a YouTube video (ID: {video_id}). {language_context}"
-            if custom_instructions:
-                custom_instructions = video_context + "\n" + custom_instructions
-            else:
-                custom_instructions = video_context
+        video_context = f"\nThis content is from a YouTube video (ID: {video_id}). {language_context}"
+        if custom_instructions:
+            custom_instructions = video_context + "\n" + custom_instructions
+        else:
+            custom_instructions = video_context
 
-            return self.generate_questions_from_data(
-                source=transcript,
-                source_type="text",
+        if segment_duration is not None:
+            return self._generate_questions_from_segments(
+                video_id=video_id,
+                segments=self._segment_transcript(snippets, segment_duration),
                 num=num,
                 question_type=question_type,
                 prompt_template=prompt_template,
                 custom_instructions=custom_instructions,
                 response_model=response_model,
                 output_format=output_format,
-                target_language=target_language,
+                max_workers=max_workers,
                 **kwargs
             )
 
-        except ValueError as ve:
-            raise ValueError(f"YouTube processing error: {str(ve)}")
-        except Exception as e:
-            raise Exception(f"Unexpected error processing YouTube video: {str(e)}")
+        return self.generate_questions_from_data(
+            source=transcript,
+            source_type="text",
+            num=num,
+            question_type=question_type,
+            prompt_template=prompt_template,
+            custom_instructions=custom_instructions,
+            response_model=response_model,
+            output_format=output_format,
+            target_language=target_language,
+            **kwargs
+        )
+
+    def _generate_questions_from_segments(
+        self,
+        video_id: str,
+        segments: List[Dict[str, Any]],
+        num: int,
+        question_type: QuestionType = "Multiple Choice",
+        prompt_template: Optional[str] = None,
+        custom_instructions: Optional[str] = None,
+        response_model: Optional[Type[Any]] = None,
+        output_format: Optional[OutputFormatType] = None,
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> TimestampedQuestionList:
+        """Generate each segment's share of questions concurrently and tag them with the segment's time range."""
+        quotas = allocate_quotas(num, [len(segment["text"]) for segment in segments])
+        jobs = [(i, segment, quota) for i, (segment, quota) in enumerate(zip(segments, quotas)) if quota > 0]
+
+        segment_results = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for index, segment, quota in jobs:
+                segment_instructions = (
+                    f"{custom_instructions or ''}\nThis excerpt covers "
+                    f"{int(segment['start'])}s to {int(segment['end'])}s of the video."
+                )
+                future = executor.submit(
+                    self.generate_questions,
+                    topic=segment["text"],
+                    num=quota,
+                    question_type=question_type,
+                    prompt_template=prompt_template,
+                    custom_instructions=segment_instructions,
+                    response_model=response_model,
+                    **kwargs
+                )
+                futures[future] = index
+            for future in concurrent.futures.as_completed(futures):
+                index = futures[future]
+                try:
+                    segment_results[index] = future.result()
+                except Exception as e:
+                    print(f"Error generating questions for segment {index + 1}/{len(segments)}: {e}")
+
+        tagged = []
+        for index in sorted(segment_results):
+            for question in getattr(segment_results[index], 'questions', None) or []:
+                tagged.append((question, segments[index]))
+
+        # De-duplicate on the question text, keeping the earliest segment's copy
+        unique_ids = {id(question) for question in dedupe_by_text([question for question, _ in tagged])}
+        timestamped = [
+            TimestampedQuestion(
+                question=question,
+                start_time=segment["start"],
+                end_time=segment["end"],
+                watch_url=f"https://www.youtube.com/watch?v={video_id}&t={int(segment['start'])}s"
+            )
+            for question, segment in tagged
+            if id(question) in unique_ids
+        ][:num]
 
-    def _load_image(self, source: str) -> str:
+        structured_output = TimestampedQuestionList(video_id=video_id, questions=timestamped)
+
+        if output_format:
+            self._handle_output_format(structured_output.to_flat_dicts(), output_format)
+
+        return structured_output
+
+    def _load_image(self, source: str, detail_level: str = "medium") -> str:
         try:
             if source.startswith(('http://', 'https://')):
                 return source
             elif source.startswith('data:image'):
                 return source
             else:
-                image = Image.open(source)
-                if image.mode not in ('RGB', 'L'):
-                    image = image.convert('RGB')
-                
-                buffered = io.BytesIO()
-                image.save(buffered, format="JPEG")
-                return f"data:image/jpeg;base64,{base64.b64encode(buffered.getvalue()).decode()}"
+                # Downscaled to what the model will actually look at, and cached by file hash
+                return encode_image_file(source, detail_level)
 
         except Exception as e:
             raise ValueError(f"Error loading image: {str(e)}")
@@ -822,70 +1288,182 @@ def solve_doubt(
             raise ValueError("Image source (path or URL) is required")
 
         try:
-            image_content = self._load_image(image_source)
-            
-            # Create parser for structured output
-            parser = PydanticOutputParser(pydantic_object=SolvedDoubt)
-            format_instructions = parser.get_format_instructions()
-
-            # Construct the prompt with all parameters
-            base_prompt = f"Analyze the image and {prompt}\n"
-            if focus_areas:
-                base_prompt += f"\nFocus on these aspects: {', '.join(focus_areas)}"
-            base_prompt += f"\nProvide a {detail_level}-detail explanation"
-            
-            system_message = SystemMessage(
-                content="You are a helpful assistant that responds in Markdown. Help with math homework."
+            return self._solve_doubt(image_source, prompt, custom_instructions, detail_level, focus_areas, **kwargs)
+        except Exception as e:
+            error_msg = f"Error in solve_doubt: {type(e).__name__}: {str(e)}"
+            print(error_msg)
+            return SolvedDoubt(
+                explanation=error_msg,
+                steps=[],
+                additional_notes="An error occurred during processing."
             )
 
-            human_message_content = f"""
-            {base_prompt}
-            
-            Provide:
-            1. A detailed explanation
-            2. Step-by-step solution (if applicable)
-            3. Any additional notes or tips
-            
-            {custom_instructions or ''}
-            
-            {format_instructions}
-            """
+    def _solve_doubt(
+        self,
+        image_source: str,
+        prompt: str,
+        custom_instructions: Optional[str],
+        detail_level: str,
+        focus_areas: Optional[List[str]],
+        **kwargs
+    ) -> SolvedDoubt:
+        """One vision call for solve_doubt/solve_doubts; raises instead of returning an error doubt."""
+        image_content = self._load_image(image_source, detail_level)
 
-            human_message = HumanMessage(content=[
-                {"type": "text", "text": human_message_content},
-                {
-                    "type": "image_url",
-                    "image_url": {
-                        "url": image_content,
-                        "detail": "high" if detail_level == "high" else "low"
-                    }
-                }
-            ])
+        # Create parser for structured output
+        parser = PydanticOutputParser(pydantic_object=SolvedDoubt)
+        format_instructions = parser.get_format_instructions()
 
-            response = self.llm.invoke(
-                [system_message, human_message],
-                **kwargs
-            )
+        # Construct the prompt with all parameters
+        base_prompt = f"Analyze the image and {prompt}\n"
+        if focus_areas:
+            base_prompt += f"\nFocus on these aspects: {', '.join(focus_areas)}"
+        base_prompt += f"\nProvide a {detail_level}-detail explanation"
 
-            try:
-                return parser.parse(response.content)
-            except Exception as e:
-                # Fallback if parsing fails
-                return SolvedDoubt(
-                    explanation=response.content,
-                    steps=[],
-                    additional_notes="Note: Response format was not structured as requested."
-                )
+        system_message = SystemMessage(
+            content="You are a helpful assistant that responds in Markdown. Help with math homework."
+        )
+
+        human_message_content = f"""
+        {base_prompt}
+
+        Provide:
+        1. A detailed explanation
+        2. Step-by-step solution (if applicable)
+        3. Any additional notes or tips
+
+        {custom_instructions or ''}
+
+        {format_instructions}
+        """
+
+        human_message = HumanMessage(content=[
+            {"type": "text", "text": human_message_content},
+            {
+                "type": "image_url",
+                "image_url": {
+                    "url": image_content,
+                    "detail": "high" if detail_level == "high" else "low"
+                }
+            }
+        ])
+
+        response = self.llm.invoke(
+            [system_message, human_message],
+            **kwargs
+        )
 
+        try:
+            return parser.parse(response.content)
         except Exception as e:
-            error_msg = f"Error in solve_doubt: {type(e).__name__}: {str(e)}"
-            print(error_msg)
+            # Fallback if parsing fails
             return SolvedDoubt(
-                explanation=error_msg,
+                explanation=response.content,
                 steps=[],
-                additional_notes="An error occurred during processing."
+                additional_notes="Note: Response format was not structured as requested."
             )
 
+    def solve_doubts(
+        self,
+        images: List[str],
+        prompt: str = "Explain how to solve this problem",
+        custom_instructions: Optional[str] = None,
+        detail_level: Literal["low", "medium", "high"] = "medium",
+        focus_areas: Optional[List[str]] = None,
+        max_concurrency: int = 8,
+        use_cache: bool = True,
+        show_progress: bool = True,
+        **kwargs
+    ) -> List[SolvedDoubt]:
+        """
+        Solve many images concurrently, answering near-identical images only once.
+
+        Each image is fingerprinted with a perceptual hash. Images matching an earlier answer in
+        the engine's ``doubt_cache`` (same prompt, detail level, instructions and focus areas)
+        are returned without a vision call, and near-duplicates within the batch share a single
+        call. At most ``max_concurrency`` vision calls are in flight at once.
+
+        Args:
+            images: Paths, data URLs or URLs of the images
+            prompt, custom_instructions, detail_level, focus_areas: As for solve_doubt
+            max_concurrency: Maximum concurrent vision calls
+            use_cache: Read from and write to the engine's doubt cache
+            show_progress: Show a progress bar over vision calls
+            **kwargs: Additional parameters to pass to the model
+
+        Returns:
+            SolvedDoubt per image, in input order. Failed images get an error SolvedDoubt
+            (as solve_doubt returns) and are not cached.
+        """
+        cache = self.doubt_cache if use_cache else None
+        settings = cache if cache is not None else DoubtResultCache()
+        # A private cache still collapses near-duplicates within this batch
+        batch_cache = DoubtResultCache(settings.max_distance, max(len(images), 1), settings.hash_size)
+        context = (prompt, custom_instructions, str(detail_level).lower(), tuple(focus_areas or ()))
+
+        def fingerprint(source):
+            if not source:
+                return None, "Image source (path or URL) is required"
+            try:
+                return batch_cache.fingerprint(source), None
+            except Exception as e:
+                return None, f"Error loading image: {type(e).__name__}: {e}"
+
+        results: List[Optional[SolvedDoubt]] = [None] * len(images)
+        leaders: Dict[int, List[int]] = {}  # index of the image actually sent -> indices sharing its answer
+
+        unique_sources = list(dict.fromkeys(images))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            fingerprints = dict(zip(unique_sources, executor.map(fingerprint, unique_sources)))
+
+        for i, source in enumerate(images):
+            key, error = fingerprints[source]
+            if error:
+                results[i] = self._doubt_error(error)
+                continue
+
+            cached = cache.get(key, context) if cache is not None else None
+            if cached is not None:
+                results[i] = cached.copy(deep=True)
+                continue
+
+            leader = batch_cache.get(key, context)
+            if leader is not None:
+                leaders[leader].append(i)
+            else:
+                batch_cache.set(key, context, i)
+                leaders[i] = [i]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = {
+                executor.submit(
+                    self._solve_doubt, images[i], prompt, custom_instructions, detail_level, focus_areas, **kwargs
+                ): i
+                for i in leaders
+            }
+            for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures),
+                               desc="Solving doubts", disable=not show_progress):
+                i = futures[future]
+                try:
+                    solved = future.result()
+                    if cache is not None:
+                        cache.set(fingerprints[images[i]][0], context, solved)
+                except Exception as e:
+                    solved = self._doubt_error(f"Error in solve_doubt: {type(e).__name__}: {e}")
+                for j in leaders[i]:
+                    results[j] = solved if j == i else solved.copy(deep=True)
+
+        return results
+
+    @staticmethod
+    def _doubt_error(error_msg: str) -> SolvedDoubt:
+        print(error_msg)
+        return SolvedDoubt(
+            explanation=error_msg,
+            steps=[],
+            additional_notes="An error occurred during processing."
+        )
+
     def _read_questions_from_csv(self, csv_filepath):
         """Read existing questions from a CSV file and return a set of question texts"""
         existing_questions = set()
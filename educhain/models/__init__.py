@@ -2,5 +2,6 @@
 from .qna_models import (MultipleChoiceQuestion, ShortAnswerQuestion, 
                          TrueFalseQuestion, FillInBlankQuestion, MCQList, 
                          ShortAnswerQuestionList, TrueFalseQuestionList, 
-                         FillInBlankQuestionList, Option, MCQMath, MCQListMath)
+                         FillInBlankQuestionList, Option, MCQMath, MCQListMath,
+                         TimestampedQuestion, TimestampedQuestionList)
 from .content_models import ContentElement, SubTopic, MainTopic, LessonPlan,Flashcard, FlashcardSet
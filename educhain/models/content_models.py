@@ -301,6 +301,53 @@ def _print_text_format(self):
         if self.summary:
             print(f"\nSummary:\n{self.summary}")
 
+# Sectioned generation: a short outline call, then one call per section
+class MainTopicOutline(BaseModel):
+    title: str = Field(..., description="The title of the main topic.")
+    subtopics: List[str] = Field(..., description="Titles of the subtopics under this main topic.")
+
+class LessonPlanOutline(BaseModel):
+    title: str = Field(..., description="The overall title of the lesson plan.")
+    subject: str = Field(..., description="The subject area of the lesson.")
+    learning_objectives: List[str] = Field(..., description="List of learning objectives tailored to different learning levels.")
+    lesson_introduction: str = Field(..., description="Introduction to the lesson including a hook and real-world applications.")
+    main_topics: List[MainTopicOutline] = Field(..., description="Main topics (2-3), each with 2-3 subtopic titles.")
+
+class LessonPlanClosing(BaseModel):
+    learning_adaptations: Optional[str] = Field(None, description="Learning adaptations for different grade levels.")
+    real_world_applications: Optional[str] = Field(None, description="Discussion of real-world applications, careers, and future learning paths.")
+    ethical_considerations: Optional[str] = Field(None, description="Discussion of ethical considerations and societal impact.")
+
+class StudyGuideOutline(BaseModel):
+    difficulty_level: Optional[str] = Field(None, description="Difficulty level of the study material")
+    estimated_study_time: Optional[str] = Field(None, description="Estimated time needed to cover the material")
+    prerequisites: List[str] = Field(default_factory=list, description="Required prerequisite knowledge")
+    learning_objectives: List[str] = Field(default_factory=list, description="3-5 specific, measurable learning objectives")
+    overview: str = Field(..., description="Comprehensive overview of the topic")
+    key_concepts: List[str] = Field(default_factory=list, description="Names of the key concepts to explain")
+    case_studies: List[str] = Field(default_factory=list, description="Titles of real-world case studies to develop")
+
+class KeyConceptExplanations(BaseModel):
+    key_concepts: Dict[str, str] = Field(..., description="Dictionary mapping concept names to their detailed explanations")
+
+class PracticeExercise(BaseModel):
+    title: str = Field(..., description="Exercise title")
+    problem: str = Field(..., description="Detailed problem description")
+    solution: str = Field(..., description="Step-by-step solution")
+    difficulty: str = Field(..., description="beginner, intermediate or advanced")
+
+class PracticeExerciseList(BaseModel):
+    practice_exercises: List[PracticeExercise] = Field(..., description="Practice exercises with solutions")
+
+class StudyGuideClosing(BaseModel):
+    important_dates: Optional[Dict[str, str]] = Field(None, description="Dictionary mapping dates to their significance (if applicable)")
+    study_tips: List[str] = Field(default_factory=list, description="Study strategies specific to this topic")
+    additional_resources: Dict[str, str] = Field(default_factory=dict, description="Dictionary mapping resource names to their descriptions/URLs")
+    summary: Optional[str] = Field(None, description="Brief summary of key takeaways")
+
+class FlashcardDeckOutline(BaseModel):
+    subtopics: List[str] = Field(..., description="Distinct, non-overlapping subtopics that together cover the topic")
+
 # Carrer Connection
 class Skill(BaseModel):
     name: str = Field(..., description="Name of the skill")
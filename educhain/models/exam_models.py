@@ -0,0 +1,44 @@
+import json
+from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field
+
+
+class AssembledExam(BaseModel):
+    """An exam selected from a QuestionBank, with how well it meets the blueprint."""
+    questions: List[Dict[str, Any]] = Field(default_factory=list, description="Selected question records")
+    indices: List[int] = Field(default_factory=list, description="Positions of the questions in the bank")
+    exam_number: Optional[int] = Field(None, description="Usage-history number, if the exam was recorded")
+    topic_counts: Dict[str, int] = Field(default_factory=dict, description="Questions per topic")
+    subtopic_counts: Dict[str, int] = Field(default_factory=dict, description="Questions per subtopic")
+    difficulty_counts: Dict[str, int] = Field(default_factory=dict, description="Questions per difficulty level")
+    type_counts: Dict[str, int] = Field(default_factory=dict, description="Questions per question type")
+    targets: Dict[str, Dict[str, int]] = Field(
+        default_factory=dict,
+        description="Requested questions per category for each constrained field, after reading fractions as shares"
+    )
+    unmet: List[str] = Field(default_factory=list, description="Constraints the bank could not satisfy")
+    elapsed_seconds: float = Field(0.0, description="Time spent selecting")
+
+    @property
+    def ok(self) -> bool:
+        return not self.unmet
+
+    def to_json(self, path: str) -> str:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.questions, f, indent=4)
+        return path
+
+    def show(self):
+        print(f"=== Exam: {len(self.questions)} questions ({self.elapsed_seconds * 1e3:.1f} ms) ===\n")
+        for label, counts in (("Topics", self.topic_counts), ("Subtopics", self.subtopic_counts),
+                              ("Difficulty", self.difficulty_counts), ("Types", self.type_counts)):
+            if counts:
+                print(f"{label}: " + ", ".join(f"{name} {count}" for name, count in counts.items()))
+        for field, targets in self.targets.items():
+            print(f"Target {field}: " + ", ".join(f"{name} {count}" for name, count in targets.items()))
+        for problem in self.unmet:
+            print(f"Unmet: {problem}")
+        print()
+        for i, question in enumerate(self.questions, 1):
+            print(f"{i}. {question.get('question', '')}")
+        print()
@@ -268,4 +268,43 @@ def show(self):
         for structure in self.collaboration_structures:
             print(f"  • {structure.structure_name} ({structure.group_size})")
             print(f"    {structure.process_description}")
-        print()
\ No newline at end of file
+        print()
+
+class PedagogyResult(BaseModel):
+    """Outcome of one pedagogy within a PedagogyBundle."""
+    pedagogy: str = Field(..., description="Pedagogy key")
+    content: Optional[Any] = Field(None, description="Generated content model (a fallback model, or None, if the output could not be parsed)")
+    error: Optional[str] = Field(None, description="Error message if generation or parsing failed")
+    elapsed_seconds: float = Field(0.0, description="Wall-clock time for this pedagogy")
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class PedagogyBundle(BaseModel):
+    """Content for one topic generated with several pedagogies at once."""
+    topic: str = Field(..., description="The learning topic")
+    results: Dict[str, PedagogyResult] = Field(default_factory=dict, description="Results keyed by pedagogy, in request order")
+    elapsed_seconds: float = Field(0.0, description="Wall-clock time for the whole bundle")
+
+    def __getitem__(self, pedagogy: str) -> Any:
+        return self.results[pedagogy].content
+
+    @property
+    def contents(self) -> Dict[str, Any]:
+        return {name: result.content for name, result in self.results.items() if result.ok}
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        return {name: result.error for name, result in self.results.items() if not result.ok}
+
+    def show(self):
+        print(f"=== Pedagogy Bundle: {self.topic} ({self.elapsed_seconds:.1f}s) ===\n")
+        for name, result in self.results.items():
+            status = "ok" if result.ok else f"error: {result.error}"
+            print(f"  • {name}: {status} ({result.elapsed_seconds:.1f}s)")
+        print()
+        for result in self.results.values():
+            if result.ok and hasattr(result.content, "show"):
+                result.content.show()
@@ -0,0 +1,60 @@
+from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field
+
+
+class StageResult(BaseModel):
+    """Outcome of one ContentPipeline stage."""
+    name: str = Field(..., description="Stage name")
+    output: Optional[Any] = Field(None, description="What the stage returned")
+    summary: Optional[str] = Field(None, description="Compact summary handed to downstream stages")
+    error: Optional[str] = Field(None, description="Error message if the stage failed or was skipped")
+    skipped: bool = Field(False, description="True when an upstream stage failed, so this one never ran")
+    depends_on: List[str] = Field(default_factory=list, description="Upstream stages")
+    elapsed_seconds: float = Field(0.0, description="Wall-clock time for this stage")
+    prompt_tokens: int = Field(0, description="Prompt tokens used by this stage")
+    completion_tokens: int = Field(0, description="Completion tokens used by this stage")
+    total_tokens: int = Field(0, description="Total tokens used by this stage")
+    total_cost: float = Field(0.0, description="Estimated cost in USD (models with known pricing only)")
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class PipelineResult(BaseModel):
+    """Outputs, timings and token usage of a ContentPipeline run."""
+    topic: str = Field(..., description="The learning topic")
+    stages: Dict[str, StageResult] = Field(default_factory=dict, description="Stage results in declaration order")
+    elapsed_seconds: float = Field(0.0, description="Wall-clock time for the whole run")
+
+    def __getitem__(self, name: str) -> Any:
+        return self.stages[name].output
+
+    @property
+    def outputs(self) -> Dict[str, Any]:
+        return {name: stage.output for name, stage in self.stages.items() if stage.ok}
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        return {name: stage.error for name, stage in self.stages.items() if not stage.ok}
+
+    @property
+    def total_tokens(self) -> int:
+        return sum(stage.total_tokens for stage in self.stages.values())
+
+    @property
+    def total_cost(self) -> float:
+        return sum(stage.total_cost for stage in self.stages.values())
+
+    def show(self):
+        print(f"=== Content Pipeline: {self.topic} ({self.elapsed_seconds:.1f}s, {self.total_tokens} tokens) ===\n")
+        print(f"{'Stage':<20}{'Status':<10}{'Time (s)':>10}{'Prompt':>10}{'Completion':>12}{'Total':>10}")
+        for stage in self.stages.values():
+            status = "ok" if stage.ok else ("skipped" if stage.skipped else "error")
+            print(
+                f"{stage.name:<20}{status:<10}{stage.elapsed_seconds:>10.1f}"
+                f"{stage.prompt_tokens:>10}{stage.completion_tokens:>12}{stage.total_tokens:>10}"
+            )
+        for name, error in self.errors.items():
+            print(f"\n{name}: {error}")
+        print()
@@ -1,7 +1,9 @@
 # in educhain/models/qna_models.py
 from educhain.models.base_models import BaseQuestion, QuestionList
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from pydantic.json_schema import SkipJsonSchema
+from typing import List, Optional, Dict, Any, Tuple
+from educhain.utils.visual_renderer import DEFAULT_DPI, DEFAULT_FIGSIZE, render_graph
 
 class MultipleChoiceQuestion(BaseQuestion):
     options: List[str]
@@ -30,6 +32,8 @@ class GraphInstruction(BaseModel):
 
 class VisualMCQ(MultipleChoiceQuestion):
     graph_instruction: Optional[GraphInstruction] = Field(None, description="Instructions for generating a graph")
+    # Set by ChartAssetStore.store_questions; hidden from the schema the LLM sees
+    chart_id: SkipJsonSchema[Optional[str]] = None
 
     def show(self):
         super().show()
@@ -37,6 +41,17 @@ def show(self):
             print(f"Graph Instruction: {self.graph_instruction}")
         print()
 
+    def render(
+        self,
+        format: str = "png",
+        figsize: Tuple[float, float] = DEFAULT_FIGSIZE,
+        dpi: int = DEFAULT_DPI
+    ) -> Optional[bytes]:
+        """Render the chart on demand as PNG or SVG bytes (cached by instruction content)."""
+        if self.graph_instruction is None:
+            return None
+        return render_graph(self.graph_instruction, format=format, figsize=figsize, dpi=dpi)
+
 class VisualMCQList(QuestionList):
     questions: List[VisualMCQ]
 
@@ -78,6 +93,51 @@ class TrueFalseQuestionList(QuestionList):
 class FillInBlankQuestionList(QuestionList):
     questions: List[FillInBlankQuestion]
 
+class TimestampedQuestion(BaseModel):
+    """A generated question linked to the part of a video it was generated from."""
+    question: Any
+    start_time: float = Field(description="Start of the source segment, in seconds")
+    end_time: float = Field(description="End of the source segment, in seconds")
+    watch_url: Optional[str] = Field(None, description="Link to the video at start_time")
+
+    def to_flat_dict(self) -> Dict[str, Any]:
+        item = self.question.dict() if hasattr(self.question, 'dict') else dict(self.question)
+        item.update(start_time=self.start_time, end_time=self.end_time, watch_url=self.watch_url)
+        return item
+
+    def show(self):
+        print(f"[{_format_timestamp(self.start_time)} - {_format_timestamp(self.end_time)}]"
+              + (f" {self.watch_url}" if self.watch_url else ""))
+        if hasattr(self.question, 'show'):
+            self.question.show()
+        else:
+            print(self.question)
+            print()
+
+class TimestampedQuestionList(BaseModel):
+    video_id: Optional[str] = None
+    questions: List[TimestampedQuestion]
+
+    def to_flat_dicts(self) -> List[Dict[str, Any]]:
+        return [question.to_flat_dict() for question in self.questions]
+
+    def show(self):
+        for i, question in enumerate(self.questions, 1):
+            print(f"Question {i}:")
+            question.show()
+
+def _format_timestamp(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+class DistractorSet(BaseModel):
+    index: int = Field(description="The index of the question this set belongs to, copied from the input")
+    distractors: List[str] = Field(description="Incorrect but plausible answer options for the question")
+
+class DistractorSetList(BaseModel):
+    items: List[DistractorSet]
+
 class Option(BaseModel):
     text: str = Field(description="The text of the option.")
     correct: str = Field(description="Whether the option is correct or not. Either 'true' or 'false'")
@@ -85,6 +145,7 @@ class Option(BaseModel):
 class MCQMath(BaseModel):
     question: str = Field(description="The quiz question, strictly avoid Latex formatting")
     requires_math: bool = Field(default=False, description="Whether the question requires the LLM Math Chain for accurate answers.")
+    expression: Optional[str] = Field(default=None, description="A single arithmetic expression that evaluates to the correct answer, using only numbers, + - * / ** % parentheses and functions such as sqrt, log, sin, factorial, comb. No variables, units or '=' sign.")
     options: List[Option] = Field(description="The possible answers to the question. The list should contain 4 options.")
     explanation: str =  Field(default=None, description="Explanation of the question")
 
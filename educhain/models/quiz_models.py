@@ -0,0 +1,84 @@
+from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field
+
+
+class QuizQuestion(BaseModel):
+    """A question served by the adaptive quiz, whether it came from a question bank or the LLM."""
+    question: str = Field(..., description="The question text")
+    options: List[str] = Field(default_factory=list, description="Answer options (empty for open questions)")
+    answer: str = Field(..., description="The correct answer")
+    explanation: Optional[str] = Field(None, description="Why the answer is correct")
+    difficulty: str = Field(..., description="Difficulty level the question was served at")
+    source: str = Field("generated", description="'bank' or 'generated'")
+    bank_index: Optional[int] = Field(None, description="Position in the question bank, for bank questions")
+
+    def is_correct(self, response: Any) -> bool:
+        """
+        Compare a response with the answer; option letters (A, B...) and numbers (1, 2...) are
+        accepted when the response is not itself the text of an option.
+        """
+        text = str(response).strip()
+        if self.options and text.lower() not in (option.strip().lower() for option in self.options):
+            if len(text) == 1 and text.isalpha() and ord(text.upper()) - 65 < len(self.options):
+                text = self.options[ord(text.upper()) - 65]
+            elif text.isdigit() and 1 <= int(text) <= len(self.options):
+                text = self.options[int(text) - 1]
+        return text.lower() == self.answer.strip().lower()
+
+    def show(self):
+        print(f"Question ({self.difficulty}): {self.question}")
+        for i, option in enumerate(self.options):
+            print(f"  {chr(65 + i)}. {option}")
+        print()
+
+
+class QuizResponse(BaseModel):
+    """One answered question in a quiz session."""
+    number: int = Field(..., description="Question number, starting at 1")
+    question: QuizQuestion = Field(..., description="The question that was asked")
+    response: str = Field(..., description="The learner's answer")
+    correct: bool = Field(..., description="Whether the answer was correct")
+    wait_seconds: float = Field(0.0, description="How long the learner waited for this question to appear")
+
+
+class AnswerFeedback(BaseModel):
+    """Result of submitting an answer: correctness and the next question, if any."""
+    correct: bool = Field(..., description="Whether the answer was correct")
+    correct_answer: str = Field(..., description="The correct answer")
+    explanation: Optional[str] = Field(None, description="Explanation of the correct answer")
+    score: int = Field(0, description="Correct answers so far")
+    answered: int = Field(0, description="Questions answered so far")
+    next_question: Optional[QuizQuestion] = Field(None, description="The next question, None when the quiz is over")
+    wait_seconds: float = Field(0.0, description="Time spent obtaining the next question")
+    error: Optional[str] = Field(None, description="Why no next question could be obtained, if the quiz stopped early")
+
+    @property
+    def finished(self) -> bool:
+        """Whether the quiz ran to completion (False when it stopped early on an error)."""
+        return self.next_question is None and self.error is None
+
+
+class QuizReport(BaseModel):
+    """Summary of a finished (or abandoned) quiz session."""
+    session_id: str = Field(..., description="Session id")
+    topic: str = Field(..., description="Quiz topic")
+    score: int = Field(0, description="Correct answers")
+    answered: int = Field(0, description="Questions answered")
+    final_difficulty: str = Field(..., description="Difficulty level reached")
+    history: List[QuizResponse] = Field(default_factory=list, description="Every answered question")
+    sources: Dict[str, int] = Field(default_factory=dict, description="Questions served per source")
+    average_wait_seconds: float = Field(0.0, description="Mean time the learner waited between questions")
+    max_wait_seconds: float = Field(0.0, description="Longest wait between questions")
+    elapsed_seconds: float = Field(0.0, description="Session duration")
+
+    def show(self):
+        print(f"=== Adaptive Quiz: {self.topic} ===\n")
+        print(f"Score: {self.score}/{self.answered}, final difficulty: {self.final_difficulty}")
+        print(f"Waiting between questions: {self.average_wait_seconds * 1e3:.0f} ms average, "
+              f"{self.max_wait_seconds * 1e3:.0f} ms max")
+        print("Sources: " + ", ".join(f"{source} {count}" for source, count in self.sources.items()))
+        print()
+        for entry in self.history:
+            mark = "correct" if entry.correct else f"incorrect (answer: {entry.question.answer})"
+            print(f"{entry.number}. [{entry.question.difficulty}] {entry.question.question} -> {entry.response}: {mark}")
+        print()
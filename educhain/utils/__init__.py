@@ -1 +1,12 @@
 from .loaders import PdfFileLoader, UrlLoader
+from .cache import ExtractionCache
+from .html_extractors import HtmlExtractor, FullTextExtractor, MainContentExtractor
+from .transcripts import TranscriptProvider, YouTubeTranscriptProvider, LocalTranscriptProvider
+from .math_solver import evaluate_expression
+from .distractors import generate_numeric_distractors, numeric_distractors
+from .visual_renderer import render_graph, render_graphs, instruction_hash, clear_render_cache, ChartAssetStore
+from .table_renderer import render_table_png, render_table_svg, render_table_html
+from .images import encode_image_file, prepare_image_bytes, ImagePayloadCache, perceptual_hash, DoubtResultCache
+from .content_paths import parse_section_path, resolve_section, set_section
+from .spaced_repetition import SpacedRepetitionScheduler, sm2_update
+from .exam_assembly import QuestionBank, infer_question_type
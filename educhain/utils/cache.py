@@ -0,0 +1,116 @@
+# educhain/utils/cache.py
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "educhain" / "extractions"
+DEFAULT_MAX_SIZE_BYTES = 512 * 1024 * 1024
+
+
+def hash_file(file_path: Union[str, Path], block_size: int = 1024 * 1024) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """
+    On-disk, content-addressed cache for extracted source text (PDFs, web pages, transcripts).
+
+    Each entry is a small JSON file named after the SHA-256 of its key. When the cache grows
+    past ``max_size_bytes`` the least recently used entries are evicted.
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None, max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES):
+        if cache_dir is None:
+            cache_dir = os.getenv("EDUCHAIN_CACHE_DIR") or DEFAULT_CACHE_DIR
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self._total_size = None
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a cache key from any JSON-serializable parts, e.g. ("url", url)."""
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return ``{"content": ..., "metadata": {...}, "created_at": ...}`` or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(path)  # mark as recently used for LRU eviction
+            return entry
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: Ignoring unreadable cache entry {path.name}: {e}")
+            return None
+
+    def set(self, key: str, content: Any, metadata: Optional[Dict[str, Any]] = None) -> None:
+        entry = {"content": content, "metadata": metadata or {}, "created_at": time.time()}
+        data = json.dumps(entry).encode('utf-8')
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+
+        with self._lock:
+            previous_size = path.stat().st_size if path.exists() else 0
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+            if self._total_size is None:
+                self._total_size = self._scan_size()
+            else:
+                self._total_size += len(data) - previous_size
+
+            if self._total_size > self.max_size_bytes:
+                self._evict()
+
+    def touch(self, key: str) -> None:
+        """Refresh an entry's creation time, e.g. after a successful revalidation."""
+        entry = self.get(key)
+        if entry is not None:
+            self.set(key, entry["content"], entry.get("metadata"))
+
+    def clear(self) -> None:
+        with self._lock:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+            self._total_size = 0
+
+    def _scan_size(self) -> int:
+        return sum(path.stat().st_size for path in self.cache_dir.glob("*.json"))
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until the cache is back under 90% of its budget."""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_size_bytes * 0.9)
+        for _, size, path in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._total_size = total
@@ -0,0 +1,104 @@
+# educhain/utils/chunking.py
+
+import re
+from typing import List, Sequence, Iterable, Any
+
+import numpy as np
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+# Rough characters-per-token ratio used when tiktoken is not installed
+CHARS_PER_TOKEN = 4
+GOLDEN_RATIO = 0.6180339887498949
+
+
+def split_text_into_chunks(text: str, chunk_size: int = 2000, chunk_overlap: int = 200) -> List[str]:
+    """Split text into chunks of at most ``chunk_size`` tokens (approximate without tiktoken)."""
+    if chunk_overlap >= chunk_size:
+        raise ValueError("chunk_overlap must be smaller than chunk_size")
+
+    try:
+        text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+            encoding_name="cl100k_base", chunk_size=chunk_size, chunk_overlap=chunk_overlap
+        )
+    except Exception:
+        # tiktoken missing or its encoding files unavailable (e.g. offline)
+        text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size * CHARS_PER_TOKEN,
+            chunk_overlap=chunk_overlap * CHARS_PER_TOKEN
+        )
+
+    return [chunk for chunk in text_splitter.split_text(text) if chunk.strip()]
+
+
+def allocate_quotas(total: int, weights: Sequence[float]) -> List[int]:
+    """
+    Split ``total`` into integer quotas proportional to ``weights`` (largest remainder method).
+
+    Ties between equally sized parts are broken so that leftover quota is spread
+    across the whole sequence instead of piling up at the start.
+    """
+    if total <= 0 or not weights:
+        return [0] * len(weights)
+
+    weight_sum = float(sum(weights))
+    if weight_sum <= 0:
+        weights = [1.0] * len(weights)
+        weight_sum = float(len(weights))
+
+    exact = [total * w / weight_sum for w in weights]
+    quotas = [int(x) for x in exact]
+    leftover = total - sum(quotas)
+
+    order = sorted(
+        range(len(weights)),
+        key=lambda i: (-round(exact[i] - quotas[i], 6), (i * GOLDEN_RATIO) % 1.0)
+    )
+    for i in order[:leftover]:
+        quotas[i] += 1
+
+    return quotas
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for duplicate detection: lowercase, alphanumerics only, single spaces."""
+    text = re.sub(r'[^a-z0-9]+', ' ', str(text).lower())
+    return text.strip()
+
+
+def dedupe_by_text(items: Iterable[Any], key_fields: Sequence[str] = ('question', 'question_text', 'stem', 'prompt')) -> List[Any]:
+    """Drop items whose normalized question text was already seen, keeping the first occurrence."""
+    seen = set()
+    unique_items = []
+    for item in items:
+        item_dict = item.dict() if hasattr(item, 'dict') else item
+        text = None
+        if isinstance(item_dict, dict):
+            for field in key_fields:
+                if item_dict.get(field):
+                    text = item_dict[field]
+                    break
+        key = normalize_text(text if text is not None else item_dict)
+        if key in seen:
+            continue
+        seen.add(key)
+        unique_items.append(item)
+    return unique_items
+
+
+def dedupe_by_embedding(vectors: Sequence[Sequence[float]], threshold: float = 0.92) -> List[int]:
+    """
+    Indices of items to keep, in order: an item is dropped when its cosine similarity to an
+    earlier kept item is at least ``threshold``.
+    """
+    matrix = np.asarray(vectors, dtype=float)
+    if matrix.size == 0:
+        return []
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix = matrix / np.where(norms == 0, 1.0, norms)
+    similarity = matrix @ matrix.T
+
+    kept = []
+    for i in range(len(matrix)):
+        if not kept or similarity[i, kept].max() < threshold:
+            kept.append(i)
+    return kept
@@ -0,0 +1,135 @@
+# educhain/utils/content_paths.py
+
+import json
+import re
+import typing
+from typing import Any, List, Tuple, Union
+
+from pydantic import BaseModel
+
+PathStep = Union[str, int]
+
+_STEP_PATTERN = re.compile(r"""\.?([A-Za-z_]\w*)|\[\s*(-?\d+)\s*\]|\[\s*(['"])(.*?)\3\s*\]""")
+_LABEL_FIELDS = ("title", "front", "name", "question", "level_name", "structure_name")
+
+
+def parse_section_path(path: str) -> List[PathStep]:
+    """
+    Split a section path such as ``main_topics[1].subtopics[0]`` or ``key_concepts['Osmosis']``
+    into steps: field names and dict keys as strings, list indices as ints.
+    """
+    steps = []
+    position = 0
+    path = path.strip()
+    while position < len(path):
+        match = _STEP_PATTERN.match(path, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Invalid section path '{path}' at position {position}")
+        field, index, _, key = match.groups()
+        steps.append(field if field is not None else int(index) if index is not None else key)
+        position = match.end()
+    if not steps:
+        raise ValueError("Section path is empty")
+    return steps
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if typing.get_origin(annotation) is Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def resolve_section(content: BaseModel, steps: List[PathStep]) -> Tuple[Any, Any, Any]:
+    """
+    Walk ``steps`` from ``content``.
+
+    Returns:
+        Tuple of (current value, its declared type, parent container)
+    """
+    value, annotation, parent = content, type(content), None
+    for step in steps:
+        annotation = _unwrap_optional(annotation)
+        parent = value
+        if isinstance(value, BaseModel):
+            if not isinstance(step, str) or step not in type(value).model_fields:
+                raise ValueError(f"{type(value).__name__} has no field '{step}'")
+            annotation = type(value).model_fields[step].annotation
+            value = getattr(value, step)
+        elif isinstance(value, list):
+            if not isinstance(step, int) or not -len(value) <= step < len(value):
+                raise ValueError(f"Index {step} is out of range for a list of {len(value)}")
+            args = typing.get_args(annotation)
+            annotation = args[0] if args else Any
+            value = value[step]
+        elif isinstance(value, dict):
+            if step not in value:
+                raise ValueError(f"Key '{step}' not found; available keys: {list(value)}")
+            args = typing.get_args(annotation)
+            annotation = args[1] if len(args) == 2 else Any
+            value = value[step]
+        else:
+            raise ValueError(f"Cannot address '{step}' inside a {type(value).__name__}")
+    return value, _unwrap_optional(annotation), parent
+
+
+def set_section(content: BaseModel, steps: List[PathStep], new_value: Any) -> None:
+    """Replace the value addressed by ``steps`` inside ``content`` (in place)."""
+    _, _, parent = resolve_section(content, steps)
+    step = steps[-1]
+    if isinstance(parent, BaseModel):
+        setattr(parent, step, new_value)
+    else:
+        parent[step] = new_value
+
+
+def section_label(value: Any, limit: int = 80) -> str:
+    """Short human-readable label for a section, e.g. its title."""
+    if isinstance(value, BaseModel):
+        for field in _LABEL_FIELDS:
+            label = getattr(value, field, None)
+            if isinstance(label, str):
+                return _truncate(label, limit)
+        value = value.dict()
+    if isinstance(value, dict):
+        for field in _LABEL_FIELDS + ("problem",):
+            if isinstance(value.get(field), str):
+                return _truncate(value[field], limit)
+    return _truncate(value if isinstance(value, str) else json.dumps(value, default=str), limit)
+
+
+def _truncate(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+def section_context(content: BaseModel, steps: List[PathStep], text_limit: int = 300) -> str:
+    """
+    Compact description of the document around a section: the top-level text fields
+    (truncated) and the labels of the sibling sections at each level of the path.
+    """
+    lines = []
+    for name, value in content:
+        if isinstance(value, str) and value:
+            lines.append(f"{name}: {_truncate(value, text_limit)}")
+        elif isinstance(value, list) and value and all(isinstance(item, str) for item in value):
+            lines.append(f"{name}: {_truncate('; '.join(value), text_limit)}")
+
+    value = content
+    prefix = ""
+    for step in steps[:-1] + [None]:
+        if isinstance(value, list):
+            labels = " | ".join(f"[{i}] {section_label(item, 60)}" for i, item in enumerate(value))
+            lines.append(f"{prefix or 'items'}: {labels}")
+        elif isinstance(value, dict):
+            lines.append(f"{prefix}: keys {', '.join(map(str, value))}")
+        if step is None:
+            break
+        if isinstance(value, BaseModel):
+            value = getattr(value, step)
+            prefix = f"{prefix}.{step}" if prefix else step
+        else:
+            value = value[step]
+            prefix = f"{prefix}[{step!r}]"
+    return "\n".join(lines)
@@ -0,0 +1,249 @@
+# educhain/utils/distractors.py
+
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+
+# Error models, in rough order of how often students make them. Each maps the
+# correct answers (and their place-value step) to one wrong candidate per answer.
+ERROR_MODELS = (
+    ("off_by_one_up", lambda a, step: a + 1),
+    ("off_by_one_down", lambda a, step: a - 1),
+    ("place_value_up", lambda a, step: a + step),
+    ("place_value_down", lambda a, step: a - step),
+    ("times_ten", lambda a, step: a * 10),
+    ("divided_by_ten", lambda a, step: a / 10),
+    ("doubled", lambda a, step: a * 2),
+    ("halved", lambda a, step: a / 2),
+    ("percent_slip", lambda a, step: a / 100),
+    ("round_down", lambda a, step: np.floor(a)),
+    ("round_up", lambda a, step: np.ceil(a)),
+    ("sign_flip", lambda a, step: -a),
+)
+
+# Used only when the error models leave a row short of unique candidates
+FALLBACK_MULTIPLES = (2, -2, 3, -3, 4, -4, 5, -5, 6, -6)
+MAX_FILL_ATTEMPTS = 1000
+# Answers closer than this to a whole number are float noise (e.g. 2.9999999999) and shown whole
+WHOLE_NUMBER_TOLERANCE = 1e-9
+# Scaled values below this are formatted from int64 digits; the float product that scales
+# them is precise to about 1/1000 here, so only near-exact ties can round unlike str.format
+EXACT_DIGITS_LIMIT = 2.0 ** 43
+_POWERS_OF_TEN = 10 ** np.arange(1, 19, dtype=np.int64)
+
+
+def _place_value_step(answers: np.ndarray) -> np.ndarray:
+    magnitude = np.abs(answers)
+    with np.errstate(divide='ignore'):
+        exponent = np.floor(np.log10(np.where(magnitude > 0, magnitude, 1.0)))
+    return np.power(10.0, exponent)
+
+
+def numeric_distractors(
+    answers: Sequence[float],
+    num_distractors: int = 3,
+    decimals: int = 2,
+    seed: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build wrong-but-plausible numeric options for a whole batch of answers at once.
+
+    Every answer is run through the common-error models in ``ERROR_MODELS``; candidates
+    are rounded the way the answer would be shown (whole numbers stay whole), invalid
+    or duplicate candidates are dropped per row, and ``num_distractors`` survivors are
+    picked at random.
+
+    Non-finite answers (inf, nan) are skipped: their rows stay NaN.
+
+    Returns:
+        Tuple of (distractors with shape ``(len(answers), num_distractors)``,
+        boolean array marking which answers are displayed as whole numbers)
+    """
+    answers = np.asarray(answers, dtype=float).reshape(-1)
+    finite = np.isfinite(answers)
+    if not finite.all():
+        distractors = np.full((answers.shape[0], num_distractors), np.nan)
+        is_integer = np.zeros(answers.shape[0], dtype=bool)
+        distractors[finite], is_integer[finite] = numeric_distractors(answers[finite], num_distractors, decimals, seed)
+        return distractors, is_integer
+
+    n = answers.shape[0]
+    if n == 0:
+        return np.empty((0, num_distractors)), np.empty(0, dtype=bool)
+
+    rng = np.random.default_rng(seed)
+    # An absolute test: a relative one would show 123456.7 or 2500.02 as whole numbers
+    is_integer = np.abs(answers - np.round(answers)) <= WHOLE_NUMBER_TOLERANCE
+    shown_answers = np.where(is_integer, np.round(answers), np.round(answers, decimals))
+    step = _place_value_step(answers)
+
+    model_candidates = np.stack([model(answers, step) for _, model in ERROR_MODELS], axis=1)
+    model_priority = rng.random((n, model_candidates.shape[1]))
+    distractors, counts = _pick_distractors(
+        model_candidates, model_priority, answers, shown_answers, is_integer, num_distractors, decimals
+    )
+
+    # Rows the error models leave short (rare) are picked again with the fallbacks appended
+    short = np.nonzero(counts < num_distractors)[0]
+    if short.size:
+        fallback_candidates = answers[short, None] + step[short, None] * np.asarray(FALLBACK_MULTIPLES, dtype=float)
+        distractors[short], counts[short] = _pick_distractors(
+            np.concatenate([model_candidates[short], fallback_candidates], axis=1), model_priority[short],
+            answers[short], shown_answers[short], is_integer[short], num_distractors, decimals
+        )
+
+    for row in np.nonzero(counts < num_distractors)[0]:
+        distractors[row] = _fill_row(distractors[row], shown_answers[row], step[row], is_integer[row], decimals)
+
+    return distractors, is_integer
+
+
+def _pick_distractors(
+    candidates: np.ndarray,
+    model_priority: np.ndarray,
+    answers: np.ndarray,
+    shown_answers: np.ndarray,
+    is_integer: np.ndarray,
+    num_distractors: int,
+    decimals: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    First ``num_distractors`` valid, distinct candidates of each row, and how many were found.
+
+    The leading ``model_priority.shape[1]`` columns (error models) are taken in priority
+    order; any further columns (fallbacks) follow in their own order.
+    """
+    n, k_total = candidates.shape
+    k_models = model_priority.shape[1]
+
+    # Round like the answer is shown; whole-number answers only get whole-number distractors
+    rounded = np.where(is_integer[:, None], np.round(candidates), np.round(candidates, decimals))
+    valid = np.isfinite(candidates) & (rounded != shown_answers[:, None])
+    valid &= ~is_integer[:, None] | (np.abs(candidates - np.round(candidates)) <= WHOLE_NUMBER_TOLERANCE)
+    # Non-negative answers (lengths, counts, prices) keep non-negative distractors
+    valid &= (answers[:, None] < 0) | (rounded >= 0)
+
+    # Error models are picked in random order (invalid ones last); fallbacks always come last
+    priority = np.where(valid[:, :k_models], model_priority, np.inf)
+    order = np.argsort(priority, axis=1)
+    rounded = np.concatenate([np.take_along_axis(rounded[:, :k_models], order, axis=1), rounded[:, k_models:]], axis=1)
+    valid = np.concatenate([np.take_along_axis(valid[:, :k_models], order, axis=1), valid[:, k_models:]], axis=1)
+
+    # Drop candidates equal to an earlier one in the same row. Most rows fill up within the
+    # first few candidates, which are compared pairwise; the remaining rows are sorted by
+    # value, and the stable sort keeps equal values in priority order (invalid ones are NaN,
+    # which never match).
+    window = min(2 * num_distractors, k_total)
+    head = rounded[:, :window]
+    earlier = np.tril(np.ones((window, window), dtype=bool), -1)
+    duplicate = np.zeros_like(valid)
+    duplicate[:, :window] = ((head[:, :, None] == head[:, None, :]) & earlier & valid[:, None, :window]).any(axis=2)
+    unfilled = np.nonzero((valid[:, :window] & ~duplicate[:, :window]).sum(axis=1) < num_distractors)[0]
+    if unfilled.size:
+        values = np.where(valid[unfilled], rounded[unfilled], np.nan)
+        by_value = np.argsort(values, axis=1, kind='stable')
+        sorted_values = np.take_along_axis(values, by_value, axis=1)
+        short_duplicate = np.zeros((unfilled.size, k_total), dtype=bool)
+        np.put_along_axis(short_duplicate, by_value[:, 1:], sorted_values[:, 1:] == sorted_values[:, :-1], axis=1)
+        duplicate[unfilled] = short_duplicate
+    keep = valid & ~duplicate
+
+    # Take the first num_distractors kept candidates of each row
+    picked = keep & (np.cumsum(keep, axis=1) <= num_distractors)
+    counts = picked.sum(axis=1)
+    distractors = np.full((n, num_distractors), np.nan)
+    rows, cols = np.nonzero(picked)
+    slots = np.cumsum(picked, axis=1)[rows, cols] - 1
+    distractors[rows, slots] = rounded[rows, cols]
+
+    return distractors, counts
+
+
+def _fill_row(row: np.ndarray, answer: float, step: float, is_integer: bool, decimals: int) -> np.ndarray:
+    """Top up a row the vectorized pass could not fill (e.g. answer 0 with whole numbers only)."""
+    taken = {answer} | {value for value in row if not np.isnan(value)}
+    increment = 1.0 if is_integer else max(step, 10.0 ** -decimals)
+    # Very large answers cannot move by less than their float spacing
+    increment = max(increment, 2 * float(np.spacing(abs(answer))))
+    multiple = 1
+    for slot in np.nonzero(np.isnan(row))[0]:
+        for _ in range(MAX_FILL_ATTEMPTS):
+            value = round(answer + multiple * increment, decimals)
+            multiple = -multiple if multiple > 0 else -multiple + 1
+            # Same rule as the vectorized pass: non-negative answers keep non-negative distractors
+            if value not in taken and (answer < 0 or value >= 0):
+                break
+        else:
+            raise ValueError(f"Could not find {len(row)} distinct distractors for {answer}")
+        row[slot] = value
+        taken.add(value)
+    return row
+
+
+def format_numbers(values: np.ndarray, is_integer: np.ndarray, decimals: int = 2) -> List[List[str]]:
+    """Format a 2-D array of option values, one row per question: whole numbers without decimals."""
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    texts = _format_flat(values, is_integer, decimals)
+    cols = values.shape[1]
+    return list(map(list, zip(*(texts[col::cols] for col in range(cols)))))
+
+
+def _format_flat(values: np.ndarray, is_integer: np.ndarray, decimals: int) -> List[str]:
+    """
+    Row-major strings for a 2-D array, without formatting each value in Python.
+
+    Digits are written into one fixed-width ASCII buffer with array arithmetic and split into
+    strings in a single pass. Values are rounded like ``np.round`` (the rounding used to
+    compare distractors with the answer) and values that round to zero are shown unsigned;
+    only values too large for exact scaled digits, or non-finite ones, use ``str.format``.
+    """
+    rows, cols = values.shape
+    flat = values.reshape(-1)
+    places = np.where(np.repeat(np.asarray(is_integer, dtype=bool).reshape(-1), cols), 0, decimals)
+    scaled = np.round(np.abs(flat) * 10.0 ** places)
+    exact = scaled < EXACT_DIGITS_LIMIT
+    scaled = np.where(exact, scaled, 0).astype(np.int64)
+    negative = (flat < 0) & (scaled > 0)
+    has_point = places > 0
+    num_digits = np.maximum(np.searchsorted(_POWERS_OF_TEN, scaled, side="right") + 1, places + 1)
+
+    # Right-aligned fields separated by at least one space
+    width = int((num_digits + has_point + negative).max(initial=0)) + 1
+    ends = np.arange(flat.size) * width + width - 1
+    buffer = np.full(flat.size * width, ord(" "), dtype=np.uint8)
+    for position in range(int(num_digits.max(initial=0))):
+        live = position < num_digits
+        at = ends - position - (has_point & (position >= places))
+        buffer[at[live]] = ord("0") + scaled[live] % 10
+        scaled //= 10
+    buffer[(ends - places)[has_point]] = ord(".")
+    buffer[(ends - num_digits - has_point)[negative]] = ord("-")
+
+    texts = buffer.tobytes().decode("ascii").split()
+    for i in np.flatnonzero(~exact).tolist():
+        texts[i] = f"{flat[i]:.{places[i]}f}"
+    return texts
+
+
+def generate_numeric_distractors(
+    answers: Sequence[float],
+    num_distractors: int = 3,
+    decimals: int = 2,
+    seed: Optional[int] = None
+) -> List[Tuple[str, List[str]]]:
+    """
+    Return ``(formatted_answer, [formatted_distractors])`` for each answer, without any LLM calls.
+
+    Raises ValueError for non-finite answers.
+
+    Example:
+        >>> generate_numeric_distractors([360, 2.5], seed=0)
+        [('360', ['260', '460', '359']), ('2.50', ['0.02', '1.50', '2.00'])]
+    """
+    answers = np.asarray(answers, dtype=float).reshape(-1)
+    if not np.isfinite(answers).all():
+        raise ValueError("Cannot build distractors for non-finite answers (inf or nan)")
+    distractors, is_integer = numeric_distractors(answers, num_distractors, decimals, seed)
+    texts = _format_flat(np.hstack([answers[:, None], distractors]), is_integer, decimals)
+    cols = num_distractors + 1
+    rows = zip(*(texts[col::cols] for col in range(1, cols))) if num_distractors else ((),) * len(answers)
+    return list(zip(texts[::cols], map(list, rows)))
@@ -0,0 +1,370 @@
+# educhain/utils/exam_assembly.py
+
+import csv
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from educhain.models.exam_models import AssembledExam
+
+QUESTION_TYPES = ("Multiple Choice", "Short Answer", "True/False", "Fill in the Blank")
+FIELDS = ("topic", "subtopic", "difficulty", "type")
+_TYPE_NAMES = {name.lower(): name for name in QUESTION_TYPES}
+_JSON_FIELDS = ("options", "metadata", "keywords")
+
+CountSpec = Dict[str, Union[int, float]]
+
+
+def _parse_record(record: Any) -> Dict[str, Any]:
+    """Plain dict for a question model or a CSV/JSON row (JSON-encoded cells are decoded)."""
+    record = record.dict() if hasattr(record, "dict") else dict(record)
+    for field in _JSON_FIELDS:
+        value = record.get(field)
+        if isinstance(value, str) and value[:1] in ("[", "{"):
+            try:
+                record[field] = json.loads(value)
+            except ValueError:
+                pass
+    return record
+
+
+def infer_question_type(record: Dict[str, Any]) -> str:
+    """Question type of a bulk-generated record, from an explicit field or the fields it has."""
+    explicit = record.get("question_type") or record.get("type")
+    if explicit:
+        return _TYPE_NAMES.get(str(explicit).strip().lower(), str(explicit).strip())
+    if record.get("options"):
+        return "Multiple Choice"
+    answer = record.get("answer")
+    if isinstance(answer, bool) or str(answer).strip().lower() in ("true", "false"):
+        return "True/False"
+    if "keywords" in record:
+        return "Short Answer"
+    if "___" in str(record.get("question", "")):
+        return "Fill in the Blank"
+    return "Short Answer"
+
+
+class QuestionBank:
+    """
+    Previously generated questions, indexed for exam assembly without LLM calls.
+
+    Topic, subtopic, difficulty and question type are stored as integer-coded NumPy columns,
+    together with each question's usage history for no-repeat windows. Records come from
+    ``bulk_generate_questions`` output (CSV or JSON), question lists, or any iterable of dicts.
+
+    Example:
+        bank = QuestionBank.from_csv("questions_20250101_120000.csv")
+        exam = bank.assemble(
+            30,
+            topic_counts={"Algebra": 10, "Geometry": 10},
+            difficulty_mix={"easy": 0.3, "medium": 0.5, "hard": 0.2},
+            no_repeat_exams=3
+        )
+        exam.show()
+    """
+
+    def __init__(self, records: Iterable[Any] = (), question_type: Optional[str] = None):
+        self.records: List[Dict[str, Any]] = []
+        self._vocab: Dict[str, Dict[str, int]] = {field: {} for field in FIELDS}
+        self._names: Dict[str, List[str]] = {field: [] for field in FIELDS}
+        self._codes = {field: np.zeros(0, dtype=np.int32) for field in FIELDS}
+        self.last_exam = np.zeros(0, dtype=np.int64)
+        self.last_used_at = np.zeros(0, dtype=np.float64)
+        self.exams_recorded = 0
+        self.add(records, question_type)
+
+    @classmethod
+    def from_csv(cls, path: str, question_type: Optional[str] = None) -> "QuestionBank":
+        """Load a CSV written by ``bulk_generate_questions``."""
+        with open(path, newline="", encoding="utf-8") as f:
+            return cls(csv.DictReader(f), question_type)
+
+    @classmethod
+    def from_json(cls, path: str, question_type: Optional[str] = None) -> "QuestionBank":
+        """Load a JSON list of questions (or an object with a ``questions`` list)."""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["questions"] if isinstance(data, dict) else data, question_type)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def add(self, records: Iterable[Any], question_type: Optional[str] = None) -> int:
+        """
+        Add questions; returns how many were added.
+
+        Args:
+            records: Dicts, question models or a question list (anything with ``.questions``)
+            question_type: Type for every record; inferred per record when omitted
+        """
+        if hasattr(records, "questions"):
+            records = records.questions
+        codes = {field: [] for field in FIELDS}
+        added = 0
+        for record in records:
+            record = _parse_record(record)
+            metadata = record.get("metadata") if isinstance(record.get("metadata"), dict) else {}
+            values = {
+                "topic": record.get("topic") or metadata.get("topic") or "",
+                "subtopic": record.get("subtopic") or metadata.get("subtopic") or "",
+                "difficulty": str(record.get("difficulty") or metadata.get("difficulty") or "unspecified").strip().lower(),
+                "type": _TYPE_NAMES.get(question_type.lower(), question_type) if question_type else infer_question_type(record)
+            }
+            for field, value in values.items():
+                codes[field].append(self._code(field, str(value)))
+            self.records.append(record)
+            added += 1
+
+        for field in FIELDS:
+            self._codes[field] = np.concatenate([self._codes[field], np.asarray(codes[field], dtype=np.int32)])
+        self.last_exam = np.concatenate([self.last_exam, np.zeros(added, dtype=np.int64)])
+        self.last_used_at = np.concatenate([self.last_used_at, np.full(added, -np.inf)])
+        return added
+
+    def _code(self, field: str, name: str) -> int:
+        vocab = self._vocab[field]
+        code = vocab.get(name)
+        if code is None:
+            code = vocab[name] = len(vocab)
+            self._names[field].append(name)
+        return code
+
+    def counts(self, field: str, indices: Optional[np.ndarray] = None) -> Dict[str, int]:
+        """Questions per topic, subtopic, difficulty or type (optionally among ``indices``)."""
+        if field not in FIELDS:
+            raise ValueError(f"Unknown field '{field}'. Available fields: {list(FIELDS)}")
+        codes = self._codes[field] if indices is None else self._codes[field][indices]
+        values, counts = np.unique(codes, return_counts=True)
+        return {self._names[field][value]: int(count) for value, count in zip(values, counts)}
+
+    def record_usage(self, indices: Sequence[int], used_at: Optional[float] = None) -> int:
+        """Mark questions as used in a new exam (e.g. replaying history); returns the exam number."""
+        self.exams_recorded += 1
+        indices = np.asarray(indices, dtype=np.int64)
+        self.last_exam[indices] = self.exams_recorded
+        self.last_used_at[indices] = time.time() if used_at is None else used_at
+        return self.exams_recorded
+
+    def sample(
+        self,
+        k: int = 1,
+        topics: Optional[Sequence[str]] = None,
+        difficulty: Optional[str] = None,
+        question_types: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[int]] = None,
+        rng: Optional[np.random.Generator] = None
+    ) -> List[int]:
+        """Up to ``k`` random bank indices matching the filters (a vectorized pass, no usage recorded)."""
+        eligible = np.ones(len(self), dtype=bool)
+        if topics is not None:
+            eligible &= np.isin(self._codes["topic"], [self._vocab["topic"].get(name, -1) for name in topics])
+        if difficulty is not None:
+            eligible &= self._codes["difficulty"] == self._vocab["difficulty"].get(str(difficulty).strip().lower(), -1)
+        if question_types is not None:
+            allowed = [self._vocab["type"].get(_TYPE_NAMES.get(name.lower(), name), -1) for name in question_types]
+            eligible &= np.isin(self._codes["type"], allowed)
+        if exclude is not None and len(exclude):
+            eligible[np.asarray(exclude, dtype=np.int64)] = False
+        candidates = np.flatnonzero(eligible)
+        rng = rng or np.random.default_rng()
+        return rng.choice(candidates, size=min(k, len(candidates)), replace=False).tolist()
+
+    def topics(self) -> List[str]:
+        return list(self._names["topic"])
+
+    def assemble(
+        self,
+        num_questions: int,
+        topic_counts: Optional[CountSpec] = None,
+        subtopic_counts: Optional[CountSpec] = None,
+        difficulty_mix: Optional[CountSpec] = None,
+        question_types: Optional[Union[Sequence[str], CountSpec]] = None,
+        no_repeat_exams: int = 0,
+        no_repeat_seconds: Optional[float] = None,
+        exclude: Optional[Sequence[int]] = None,
+        seed: Optional[int] = None,
+        record: bool = True,
+        max_repair_steps: int = 500
+    ) -> AssembledExam:
+        """
+        Select an exam from the bank under blueprint constraints.
+
+        Eligible questions are grouped into cells by the constrained attributes. A greedy pass
+        fills ``num_questions`` from the cells that reduce the most constraint deficits, then a
+        repair pass swaps questions between cells while that lowers the total violation. Picks
+        within a cell are random, so repeated calls give different exams.
+
+        Args:
+            num_questions: Exam length
+            topic_counts: Questions per topic: integer counts, or float fractions summing to 1
+                (the resolved counts are in ``AssembledExam.targets``)
+            subtopic_counts: Questions per subtopic name (counts or fractions)
+            difficulty_mix: Questions per difficulty level (counts or fractions)
+            question_types: Allowed types (list) or questions per type (counts or fractions)
+            no_repeat_exams: Skip questions used in any of the last N recorded exams
+            no_repeat_seconds: Skip questions used within this many seconds
+            exclude: Bank indices to skip
+            seed: Random seed for reproducible selection
+            record: Record the exam in the usage history
+            max_repair_steps: Upper bound on repair swaps
+
+        Returns:
+            AssembledExam; constraints the bank cannot satisfy are listed in ``unmet``.
+            Unlisted categories share whatever the listed counts leave over.
+        """
+        start = time.perf_counter()
+        if num_questions <= 0:
+            raise ValueError("num_questions must be positive")
+        rng = np.random.default_rng(seed)
+
+        eligible = np.ones(len(self), dtype=bool)
+        if question_types is not None and not isinstance(question_types, dict):
+            allowed = [self._vocab["type"].get(_TYPE_NAMES.get(name.lower(), name), -1) for name in question_types]
+            eligible &= np.isin(self._codes["type"], allowed)
+            question_types = None
+        if no_repeat_exams > 0:
+            eligible &= (self.last_exam == 0) | (self.last_exam <= self.exams_recorded - no_repeat_exams)
+        if no_repeat_seconds is not None:
+            eligible &= self.last_used_at < time.time() - no_repeat_seconds
+        if exclude is not None:
+            eligible[np.asarray(exclude, dtype=np.int64)] = False
+        candidates = np.flatnonzero(eligible)
+
+        families = []
+        for field, spec, normalize in (
+            ("topic", topic_counts, str),
+            ("subtopic", subtopic_counts, str),
+            ("difficulty", difficulty_mix, lambda name: str(name).strip().lower()),
+            ("type", question_types, lambda name: _TYPE_NAMES.get(str(name).lower(), name))
+        ):
+            if spec:
+                targets = _target_counts({normalize(name): value for name, value in spec.items()}, num_questions, field)
+                families.append((field, list(targets), np.array(list(targets.values()) + [0], dtype=np.int64)))
+
+        # Group candidates into cells by the constrained fields; each family maps a cell to the
+        # bucket of its listed category, or to a trailing "other" bucket
+        key = np.zeros(len(candidates), dtype=np.int64)
+        for field, _, _ in families:
+            key = key * len(self._names[field]) + self._codes[field][candidates]
+        cell_keys, cell_of, available = np.unique(key, return_inverse=True, return_counts=True)
+        buckets = []
+        remainder = cell_keys
+        for field, names, targets in reversed(families):
+            size = len(self._names[field])
+            lookup = np.full(size, len(names), dtype=np.int64)
+            for bucket, name in enumerate(names):
+                if name in self._vocab[field]:
+                    lookup[self._vocab[field][name]] = bucket
+            buckets.insert(0, lookup[remainder % size])
+            remainder = remainder // size
+        for (_, _, targets) in families:
+            targets[-1] = num_questions - targets[:-1].sum()
+
+        chosen = self._allocate(available, buckets, [targets for _, _, targets in families], num_questions, rng,
+                                max_repair_steps)
+
+        # Random members of each cell, in bank order
+        order = np.lexsort((rng.random(len(candidates)), cell_of))
+        cell_start = np.cumsum(available) - available
+        picked_cells = np.repeat(np.arange(len(chosen)), chosen)
+        offsets = np.arange(chosen.sum()) - np.repeat(np.cumsum(chosen) - chosen, chosen)
+        indices = np.sort(candidates[order[cell_start[picked_cells] + offsets]])
+
+        exam = AssembledExam(
+            questions=[self.records[i] for i in indices],
+            indices=indices.tolist(),
+            targets={field: dict(zip(names, targets[:-1].tolist())) for field, names, targets in families},
+            topic_counts=self.counts("topic", indices),
+            subtopic_counts=self.counts("subtopic", indices),
+            difficulty_counts=self.counts("difficulty", indices),
+            type_counts=self.counts("type", indices)
+        )
+        if len(indices) < num_questions:
+            exam.unmet.append(f"only {len(indices)} of {num_questions} eligible questions")
+        for field, names, targets in families:
+            selected = getattr(exam, f"{field}_counts")
+            exam.unmet += [
+                f"{field} '{name}': {selected.get(name, 0)} of {target}"
+                for name, target in zip(names, targets) if selected.get(name, 0) < target
+            ]
+        if record and len(indices):
+            exam.exam_number = self.record_usage(indices)
+        exam.elapsed_seconds = time.perf_counter() - start
+        return exam
+
+    @staticmethod
+    def _allocate(
+        available: np.ndarray,
+        buckets: List[np.ndarray],
+        targets: List[np.ndarray],
+        num_questions: int,
+        rng: np.random.Generator,
+        max_repair_steps: int
+    ) -> np.ndarray:
+        """Questions to take from each cell: greedy fill, then improving swaps."""
+        chosen = np.zeros(len(available), dtype=np.int64)
+        counts = [np.zeros(len(target), dtype=np.int64) for target in targets]
+
+        for _ in range(min(num_questions, int(available.sum()))):
+            room = available - chosen
+            gain = np.zeros(len(available))
+            for bucket, count, target in zip(buckets, counts, targets):
+                gain += np.where(count[bucket] < target[bucket], 1, -1)
+            # Ties go to a random cell, weighted by how many questions it still has
+            tie_break = rng.random(len(available)) ** (1 / np.maximum(room, 1))
+            cell = int(np.argmax(np.where(room > 0, gain + tie_break, -np.inf)))
+            chosen[cell] += 1
+            for bucket, count in zip(buckets, counts):
+                count[bucket[cell]] += 1
+
+        for _ in range(max_repair_steps):
+            if all((count == target).all() for count, target in zip(counts, targets)):
+                break
+            out_cells = np.flatnonzero(chosen > 0)
+            in_cells = np.flatnonzero(available > chosen)
+            if not len(out_cells) or not len(in_cells):
+                break
+            delta = np.zeros((len(out_cells), len(in_cells)))
+            for bucket, count, target in zip(buckets, counts, targets):
+                out_bucket, in_bucket = bucket[out_cells], bucket[in_cells]
+                removed = np.abs(count[out_bucket] - 1 - target[out_bucket]) - np.abs(count[out_bucket] - target[out_bucket])
+                added = np.abs(count[in_bucket] + 1 - target[in_bucket]) - np.abs(count[in_bucket] - target[in_bucket])
+                delta += np.where(out_bucket[:, None] == in_bucket[None, :], 0, removed[:, None] + added[None, :])
+            best = int(np.argmin(delta))
+            if delta.flat[best] >= 0:
+                break
+            out_cell, in_cell = out_cells[best // len(in_cells)], in_cells[best % len(in_cells)]
+            chosen[out_cell] -= 1
+            chosen[in_cell] += 1
+            for bucket, count in zip(buckets, counts):
+                count[bucket[out_cell]] -= 1
+                count[bucket[in_cell]] += 1
+        return chosen
+
+
+def _target_counts(spec: CountSpec, num_questions: int, label: str) -> Dict[str, int]:
+    """
+    Integer counts from counts or fractions (largest remainder rounding).
+
+    Integers are always counts, so ``{"hard": 1}`` asks for one hard question. The values are
+    read as fractions when at least one is a float and they sum to 1, so ``{"hard": 1.0}``
+    means every question.
+    """
+    values = np.array(list(spec.values()), dtype=np.float64)
+    if (values < 0).any():
+        raise ValueError(f"{label} counts must not be negative")
+    has_float = any(not isinstance(value, (int, np.integer)) for value in spec.values())
+    if has_float and np.isclose(values.sum(), 1.0):
+        exact = values * num_questions
+        counts = np.floor(exact).astype(np.int64)
+        counts[np.argsort(counts - exact)[:num_questions - counts.sum()]] += 1
+    elif np.allclose(values, np.round(values)):
+        counts = np.round(values).astype(np.int64)
+    else:
+        raise ValueError(f"{label} values must be whole counts or fractions summing to 1, got {spec}")
+    if counts.sum() > num_questions:
+        raise ValueError(f"{label} counts add up to {counts.sum()}, more than {num_questions} questions")
+    return dict(zip(spec, counts.tolist()))
@@ -0,0 +1,222 @@
+# educhain/utils/html_extractors.py
+
+import re
+from typing import Optional, Union
+from bs4 import BeautifulSoup, Comment
+
+try:
+    from lxml import etree, html as lxml_html
+    DEFAULT_PARSER = "lxml"
+except ImportError:
+    etree = lxml_html = None
+    DEFAULT_PARSER = "html.parser"
+
+
+def _clean_string(text):
+    text = re.sub(r'\s+', ' ', text or '')
+    return text.strip()
+
+
+class HtmlExtractor:
+    """Base class for turning raw HTML into the plain text sent to the LLM."""
+
+    def extract(self, html: Union[str, bytes]) -> str:
+        raise NotImplementedError
+
+
+class FullTextExtractor(HtmlExtractor):
+    """Every text node on the page, including navigation and scripts (the original behaviour)."""
+
+    def __init__(self, parser: str = "html.parser"):
+        self.parser = parser
+
+    def extract(self, html: Union[str, bytes]) -> str:
+        soup = BeautifulSoup(html, self.parser)
+        return _clean_string(soup.get_text())
+
+
+class MainContentExtractor(HtmlExtractor):
+    """
+    Extract only the main content of a page.
+
+    Drops scripts, styles, navigation, headers, footers, sidebars, forms and
+    cookie/newsletter/share widgets, then picks the main block: an <article> or
+    <main> element when one exists, otherwise the element whose paragraphs score
+    highest after penalising link-heavy blocks. Falls back to all remaining text
+    when no block has at least ``min_text_length`` characters.
+
+    With ``parser="lxml"`` (the default when lxml is installed) the page is
+    processed directly on an lxml tree; any other value runs the same steps on
+    BeautifulSoup with that parser.
+    """
+
+    BOILERPLATE_TAGS = (
+        "script", "style", "noscript", "template", "svg", "canvas", "iframe",
+        "nav", "header", "footer", "aside", "form", "button", "select", "input"
+    )
+    BOILERPLATE_TOKENS = {
+        "nav", "navbar", "menu", "header", "footer", "sidebar", "breadcrumb", "breadcrumbs",
+        "share", "social", "subscribe", "newsletter", "advert", "ad", "ads", "promo",
+        "related", "comments", "comment", "popup", "modal", "banner", "masthead", "widget"
+    }
+    BOILERPLATE_SUBSTRINGS = ("cookie", "consent", "gdpr")
+    BOILERPLATE_ROLES = {"navigation", "banner", "contentinfo", "complementary", "search", "dialog"}
+    CONTENT_TAGS = ("p", "pre", "blockquote", "li", "td")
+    MIN_PARAGRAPH_LENGTH = 25
+
+    def __init__(self, parser: Optional[str] = None, min_text_length: int = 200):
+        self.parser = parser or DEFAULT_PARSER
+        self.min_text_length = min_text_length
+
+    def extract(self, html: Union[str, bytes]) -> str:
+        if self.parser == "lxml" and lxml_html is not None:
+            return self._extract_lxml(html)
+        return self._extract_soup(html)
+
+    def _is_boilerplate_markers(self, role, classes, element_id, hidden) -> bool:
+        if role in self.BOILERPLATE_ROLES or hidden:
+            return True
+        markers = f"{classes or ''} {element_id or ''}".lower()
+        if not markers.strip():
+            return False
+        if any(sub in markers for sub in self.BOILERPLATE_SUBSTRINGS):
+            return True
+        return bool(self.BOILERPLATE_TOKENS.intersection(re.split(r'[\s_\-]+', markers)))
+
+    def _paragraph_score(self, text) -> float:
+        return 1 + text.count(",") + min(len(text) // 100, 3)
+
+    # lxml backend
+
+    def _extract_lxml(self, html: Union[str, bytes]) -> str:
+        if not html or not html.strip():
+            return ""
+        try:
+            root = lxml_html.fromstring(html)
+        except (etree.ParserError, ValueError):
+            return self._extract_soup(html)
+
+        etree.strip_elements(root, etree.Comment, *self.BOILERPLATE_TAGS, with_tail=False)
+        for element in list(root.iter(etree.Element)):
+            if element.tag in ("html", "body", "main", "article") or element.getparent() is None:
+                continue
+            attrib = element.attrib
+            if self._is_boilerplate_markers(
+                attrib.get("role"), attrib.get("class"), attrib.get("id"),
+                attrib.get("aria-hidden") == "true" or "hidden" in attrib
+            ):
+                element.drop_tree()
+
+        containers = list(root.iter("article", "main")) or root.xpath('//*[@role="main"]')
+        if containers:
+            candidate = max(containers, key=lambda el: len(el.text_content()))
+        else:
+            candidate = self._best_scoring_element(root)
+
+        if candidate is not None:
+            text = _clean_string(" ".join(candidate.itertext()))
+            if len(text) >= self.min_text_length:
+                return text
+
+        return _clean_string(" ".join(root.itertext()))
+
+    def _best_scoring_element(self, root):
+        scores = {}
+        for paragraph in root.iter(*self.CONTENT_TAGS):
+            text = paragraph.text_content().strip()
+            if len(text) < self.MIN_PARAGRAPH_LENGTH:
+                continue
+            score = self._paragraph_score(text)
+            parent = paragraph.getparent()
+            if parent is None:
+                continue
+            scores[parent] = scores.get(parent, 0) + score
+            grandparent = parent.getparent()
+            if grandparent is not None:
+                scores[grandparent] = scores.get(grandparent, 0) + score / 2
+
+        if not scores:
+            return None
+        return max(scores, key=lambda el: scores[el] * (1 - self._lxml_link_density(el)))
+
+    @staticmethod
+    def _lxml_link_density(element) -> float:
+        text_length = len(element.text_content().strip())
+        if text_length == 0:
+            return 1.0
+        link_length = sum(len(a.text_content().strip()) for a in element.iter("a"))
+        return min(link_length / text_length, 1.0)
+
+    # BeautifulSoup backend
+
+    def _extract_soup(self, html: Union[str, bytes]) -> str:
+        soup = BeautifulSoup(html, "html.parser" if self.parser == "lxml" else self.parser)
+        self._strip_boilerplate(soup)
+
+        candidate = self._semantic_container(soup) or self._best_scoring_block(soup)
+        if candidate is not None:
+            text = _clean_string(candidate.get_text(" "))
+            if len(text) >= self.min_text_length:
+                return text
+
+        root = soup.body or soup
+        return _clean_string(root.get_text(" "))
+
+    def _strip_boilerplate(self, soup) -> None:
+        for comment in soup.find_all(string=lambda s: isinstance(s, Comment)):
+            comment.extract()
+        for tag in soup.find_all(self.BOILERPLATE_TAGS):
+            if not tag.decomposed:
+                tag.decompose()
+        for tag in soup.find_all(self._is_boilerplate_container):
+            if not tag.decomposed:
+                tag.decompose()
+
+    def _is_boilerplate_container(self, tag) -> bool:
+        if tag.name in ("html", "body", "main", "article") or tag.attrs is None:
+            return False
+        classes = tag.get("class") or []
+        if not isinstance(classes, str):
+            classes = " ".join(classes)
+        return self._is_boilerplate_markers(
+            tag.get("role"), classes, tag.get("id"),
+            tag.get("aria-hidden") == "true" or tag.get("hidden") is not None
+        )
+
+    def _semantic_container(self, soup):
+        containers = soup.find_all(["article", "main"]) or soup.find_all(attrs={"role": "main"})
+        if not containers:
+            return None
+        return max(containers, key=lambda tag: len(tag.get_text(" ", strip=True)))
+
+    def _best_scoring_block(self, soup):
+        # Keyed by id(): bs4 tags compare by content, so equal-looking blocks would collide
+        scores = {}
+        tags = {}
+        for paragraph in soup.find_all(self.CONTENT_TAGS):
+            text = paragraph.get_text(" ", strip=True)
+            if len(text) < self.MIN_PARAGRAPH_LENGTH:
+                continue
+            score = self._paragraph_score(text)
+
+            parent = paragraph.parent
+            if parent is None:
+                continue
+            for ancestor, weight in ((parent, 1.0), (parent.parent, 0.5)):
+                if ancestor is None:
+                    continue
+                tags[id(ancestor)] = ancestor
+                scores[id(ancestor)] = scores.get(id(ancestor), 0) + score * weight
+
+        if not scores:
+            return None
+        best = max(scores, key=lambda key: scores[key] * (1 - self._link_density(tags[key])))
+        return tags[best]
+
+    @staticmethod
+    def _link_density(tag) -> float:
+        text_length = len(tag.get_text(" ", strip=True))
+        if text_length == 0:
+            return 1.0
+        link_length = sum(len(a.get_text(" ", strip=True)) for a in tag.find_all("a"))
+        return min(link_length / text_length, 1.0)
@@ -0,0 +1,235 @@
+# educhain/utils/images.py
+
+import base64
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Literal, Optional, Tuple, Union
+
+import numpy as np
+
+from PIL import Image, ImageOps
+
+DetailLevel = Literal["low", "medium", "high"]
+
+# Vision models bill by resolution. "low" detail images are processed at 512px, and
+# "high" detail images are fitted inside 2048x2048 and then to 768px on the short side,
+# so anything larger is uploaded only to be downscaled by the provider.
+LOW_DETAIL_MAX_SIDE = 512
+HIGH_DETAIL_MAX_SIDE = 2048
+HIGH_DETAIL_SHORT_SIDE = 768
+JPEG_QUALITY = 85
+PERCEPTUAL_HASH_SIZE = 16
+
+
+def target_size(width: int, height: int, detail_level: DetailLevel = "medium") -> Tuple[int, int]:
+    """Largest size worth sending for ``detail_level``; never upscales."""
+    if str(detail_level).lower() == "high":
+        scale = min(1.0, HIGH_DETAIL_MAX_SIDE / max(width, height))
+        short_side = min(width, height) * scale
+        if short_side > HIGH_DETAIL_SHORT_SIDE:
+            scale *= HIGH_DETAIL_SHORT_SIDE / short_side
+    else:
+        scale = min(1.0, LOW_DETAIL_MAX_SIDE / max(width, height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _to_rgb(image: Image.Image) -> Image.Image:
+    if image.mode in ("RGB", "L"):
+        return image
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+def prepare_image_bytes(data: bytes, detail_level: DetailLevel = "medium") -> Tuple[bytes, str]:
+    """
+    Downscale image bytes to the resolution tier for ``detail_level``.
+
+    JPEGs that are already small enough (and need no EXIF rotation) are passed through
+    untouched; everything else is decoded once, rotated upright, resized and encoded as JPEG.
+
+    Returns:
+        Tuple of (encoded bytes, mime type)
+    """
+    image = Image.open(io.BytesIO(data))
+    width, height = image.size
+    size = target_size(width, height, detail_level)
+    orientation = image.getexif().get(0x0112, 1)
+
+    if image.format == "JPEG" and size == (width, height) and orientation == 1 and image.mode in ("RGB", "L"):
+        return data, "image/jpeg"
+
+    if image.format == "JPEG":
+        # Let the decoder skip detail we are about to throw away (DCT scaling)
+        image.draft("RGB", size)
+    image = ImageOps.exif_transpose(image)
+    image = _to_rgb(image)
+    size = target_size(*image.size, detail_level)
+    if image.size != size:
+        image = image.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+    return buffer.getvalue(), "image/jpeg"
+
+
+class ImagePayloadCache:
+    """
+    In-memory LRU of encoded image payloads, keyed by the file's content hash and detail level.
+
+    Re-sending the same worksheet photo costs one file read and a hash instead of a
+    decode/resize/encode cycle.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[str]:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        return None
+
+    def set(self, key: Tuple[str, str], value: str) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_default_cache = ImagePayloadCache()
+
+
+def encode_image_file(
+    path: Union[str, Path],
+    detail_level: DetailLevel = "medium",
+    cache: Optional[ImagePayloadCache] = _default_cache
+) -> str:
+    """Return a ``data:`` URL for a local image, prepared for ``detail_level`` and cached by content hash."""
+    data = Path(path).read_bytes()
+    detail_level = str(detail_level).lower()
+    key = (hashlib.sha256(data).hexdigest(), detail_level)
+
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    encoded, mime_type = prepare_image_bytes(data, detail_level)
+    payload = f"data:{mime_type};base64,{base64.b64encode(encoded).decode()}"
+
+    if cache is not None:
+        cache.set(key, payload)
+    return payload
+
+
+def read_image_source(source: str) -> Optional[bytes]:
+    """Raw bytes of a local path or ``data:`` URL; None for remote URLs, which are not downloaded."""
+    if source.startswith(('http://', 'https://')):
+        return None
+    if source.startswith('data:'):
+        return base64.b64decode(source.split(',', 1)[1])
+    return Path(source).read_bytes()
+
+
+def perceptual_hash(data: bytes, hash_size: int = PERCEPTUAL_HASH_SIZE) -> int:
+    """
+    Difference hash (dHash) of an image: a ``hash_size``**2-bit fingerprint that stays
+    nearly the same when a photo is re-compressed, resized or slightly re-exposed.
+
+    Compare fingerprints with ``hamming_distance``; small distances mean the same picture.
+    """
+    image = Image.open(io.BytesIO(data))
+    if image.format == "JPEG":
+        image.draft("L", (hash_size * 8, hash_size * 8))
+    image = ImageOps.exif_transpose(image)
+    image = _to_rgb(image).convert("L").resize((hash_size + 1, hash_size), Image.Resampling.BOX)
+    pixels = np.asarray(image, dtype=np.int16)
+    bits = pixels[:, 1:] > pixels[:, :-1]
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class DoubtResultCache:
+    """
+    In-memory cache of solved doubts keyed by a perceptual hash of the image plus the request
+    context (prompt, detail level, instructions...).
+
+    A lookup matches any stored image whose hash is within ``max_distance`` bits, so the same
+    worksheet photographed or compressed slightly differently is answered from the cache.
+    Remote image URLs are matched by exact URL only. Lower ``max_distance`` (0 for
+    near-exact matches) if distinct pages from the same template are being conflated.
+
+    Args:
+        max_distance: Largest Hamming distance (out of ``hash_size``**2 bits) treated as the same image
+        max_entries: Entries kept before the least recently used are evicted
+        hash_size: Side of the dHash grid; 16 gives 256-bit fingerprints
+    """
+
+    def __init__(self, max_distance: int = 6, max_entries: int = 1024, hash_size: int = PERCEPTUAL_HASH_SIZE):
+        self.max_distance = max_distance
+        self.max_entries = max_entries
+        self.hash_size = hash_size
+        self._entries: "OrderedDict[Tuple[Any, Any], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def fingerprint(self, source: str) -> Union[int, str]:
+        """Perceptual hash for local files and data URLs; the URL itself for remote images."""
+        data = read_image_source(source)
+        return source if data is None else perceptual_hash(data, self.hash_size)
+
+    def _find(self, fingerprint: Union[int, str], context: Any) -> Optional[Tuple[Any, Any]]:
+        if (fingerprint, context) in self._entries:
+            return (fingerprint, context)
+        if isinstance(fingerprint, int) and self.max_distance > 0:
+            for key in reversed(self._entries):
+                stored, stored_context = key
+                if stored_context == context and isinstance(stored, int) \
+                        and hamming_distance(stored, fingerprint) <= self.max_distance:
+                    return key
+        return None
+
+    def get(self, fingerprint: Union[int, str], context: Any) -> Optional[Any]:
+        with self._lock:
+            key = self._find(fingerprint, context)
+            if key is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, fingerprint: Union[int, str], context: Any, value: Any) -> None:
+        with self._lock:
+            key = (fingerprint, context)
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,31 +1,286 @@
 from PyPDF2 import PdfReader
-from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from educhain.utils.cache import ExtractionCache, hash_file
+from educhain.utils.html_extractors import HtmlExtractor, FullTextExtractor
+import math
 import re
+import threading
+import time
 import requests
 
+
+def _clean_string(text):
+    text = re.sub(r'\s+', ' ', text or '')
+    return text.strip()
+
+
+# Set in each PDF worker process by _open_worker_reader, so the file is parsed once per process
+_worker_reader: Optional[PdfReader] = None
+
+
+def _open_worker_reader(file_path):
+    """Process pool initializer: parse the PDF once for all batches this worker extracts."""
+    global _worker_reader
+    _worker_reader = PdfReader(file_path)
+
+
+def _extract_page_batch(start, stop):
+    """Extract and clean pages [start, stop) with the worker's reader. Runs inside worker processes."""
+    return [_clean_string(_worker_reader.pages[i].extract_text()) for i in range(start, stop)]
+
+
 class PdfFileLoader:
-    def load_data(self, file_path):
+    def __init__(self, cache: Optional[ExtractionCache] = None):
+        self.cache = cache
+
+    def load_data(self, file_path, page_range: Optional[Tuple[int, int]] = None, max_workers: Optional[int] = None):
+        """
+        Load the text of a PDF as a single string.
+
+        Args:
+            file_path: Path to the PDF file (or a binary file object)
+            page_range: (first_page, last_page), 1-based and inclusive. Defaults to all pages.
+            max_workers: Extract pages in parallel across this many processes
+
+        When the loader has a cache, results are keyed by the file's content hash,
+        so renamed or copied files still hit and edited files never do.
+        """
+        cache_key = None
+        if self.cache is not None and isinstance(file_path, (str, Path)):
+            cache_key = self.cache.make_key("pdf", hash_file(file_path), page_range)
+            entry = self.cache.get(cache_key)
+            if entry is not None:
+                return entry["content"]
+
+        content = " ".join(self.iter_pages(file_path, page_range=page_range, max_workers=max_workers))
+
+        if cache_key is not None:
+            self.cache.set(cache_key, content)
+        return content
+
+    def iter_pages(
+        self,
+        file_path,
+        page_range: Optional[Tuple[int, int]] = None,
+        window: int = 1,
+        max_workers: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Lazily yield cleaned page text, in page order.
+
+        Args:
+            file_path: Path to the PDF file (or a binary file object)
+            page_range: (first_page, last_page), 1-based and inclusive. Defaults to all pages.
+            window: Number of consecutive pages joined into each yielded string
+            max_workers: When greater than 1, extract pages in a process pool. Pages are
+                still yielded in order as soon as their batch is done.
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
         reader = PdfReader(file_path)
-        all_content = []
+        start, stop = self._resolve_page_range(len(reader.pages), page_range)
+
+        if max_workers and max_workers > 1 and isinstance(file_path, (str, Path)) and stop - start > 1:
+            pages = self._iter_pages_parallel(file_path, start, stop, max_workers)
+        else:
+            pages = (self.clean_string(reader.pages[i].extract_text()) for i in range(start, stop))
+
+        buffer = []
+        for content in pages:
+            buffer.append(content)
+            if len(buffer) == window:
+                yield " ".join(buffer)
+                buffer = []
+        if buffer:
+            yield " ".join(buffer)
+
+    def _iter_pages_parallel(self, file_path, start, stop, max_workers) -> Iterator[str]:
+        # Each worker parses the file once (pool initializer) and then extracts several small
+        # batches, which keeps the pool busy when pages vary in cost
+        max_workers = min(max_workers, stop - start)
+        batch_size = max(1, math.ceil((stop - start) / (max_workers * 4)))
+        batches = [(b, min(b + batch_size, stop)) for b in range(start, stop, batch_size)]
 
-        for page in reader.pages:
-            content = page.extract_text()
-            content = self.clean_string(content)
-            all_content.append(content)
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_open_worker_reader, initargs=(str(file_path),)
+        ) as executor:
+            results = executor.map(_extract_page_batch, [b[0] for b in batches], [b[1] for b in batches])
+            for batch in results:
+                yield from batch
 
-        return " ".join(all_content)
+    @staticmethod
+    def _resolve_page_range(num_pages: int, page_range: Optional[Tuple[int, int]]) -> Tuple[int, int]:
+        if page_range is None:
+            return 0, num_pages
+        first_page, last_page = page_range
+        if first_page < 1 or last_page < first_page:
+            raise ValueError(f"Invalid page range: {page_range}")
+        return first_page - 1, min(last_page, num_pages)
 
     def clean_string(self, text):
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        return _clean_string(text)
 
 class UrlLoader:
-    def load_data(self, url):
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, 'html.parser')
-        content = soup.get_text()
-        return self.clean_string(content)
+    def __init__(
+        self,
+        cache: Optional[ExtractionCache] = None,
+        revalidate_after: float = 300,
+        timeout: Union[float, Tuple[float, float]] = (5, 30),
+        max_retries: int = 3,
+        max_bytes: int = 10 * 1024 * 1024,
+        pool_size: int = 32,
+        per_host_limit: int = 4,
+        extractor: Optional[HtmlExtractor] = None,
+        raise_for_status: bool = False
+    ):
+        """
+        Args:
+            cache: Optional extraction cache for page text
+            revalidate_after: Seconds a cached page is served without contacting the server.
+                Older entries are revalidated with a conditional request (ETag / Last-Modified).
+            timeout: Request timeout in seconds, or a (connect, read) tuple
+            max_retries: Retries for connection errors and 429/5xx responses, with exponential backoff
+            max_bytes: Bodies are streamed and truncated after this many bytes
+            pool_size: Number of pooled keep-alive connections per host
+            per_host_limit: Maximum concurrent requests to a single host in load_many
+            extractor: How page text is extracted from HTML. Defaults to FullTextExtractor (every
+                text node); pass MainContentExtractor() to drop navigation, scripts and other
+                boilerplate.
+            raise_for_status: Raise requests.HTTPError for 4xx/5xx responses in load_data.
+                By default the error page's text is returned (and not cached), as before.
+                load_many always reports such responses as failures.
+        """
+        self.cache = cache
+        self.extractor = extractor if extractor is not None else FullTextExtractor()
+        self.raise_for_status = raise_for_status
+        self.revalidate_after = revalidate_after
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.per_host_limit = per_host_limit
+        self._host_semaphores = {}
+        self._host_lock = threading.Lock()
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            # Hand the last response back once retries run out; raise_for_status decides
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def load_data(self, url, raise_for_status: Optional[bool] = None):
+        """
+        Fetch a page and return its extracted text.
+
+        Args:
+            url: Page address
+            raise_for_status: Overrides the loader's ``raise_for_status`` for this call
+        """
+        if raise_for_status is None:
+            raise_for_status = self.raise_for_status
+        if self.cache is None:
+            response, body = self._fetch(url)
+            if raise_for_status:
+                response.raise_for_status()
+            return self._extract_text(body)
+
+        cache_key = self.cache.make_key("url", url, type(self.extractor).__name__)
+        entry = self.cache.get(cache_key)
+        headers = {}
+        if entry is not None:
+            if time.time() - entry.get("created_at", 0) < self.revalidate_after:
+                return entry["content"]
+            metadata = entry.get("metadata", {})
+            if metadata.get("etag"):
+                headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified"):
+                headers["If-Modified-Since"] = metadata["last_modified"]
+
+        try:
+            response, body = self._fetch(url, headers=headers)
+        except requests.RequestException as e:
+            if entry is None:
+                raise
+            print(f"Warning: Could not revalidate {url}, using cached copy: {e}")
+            return entry["content"]
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.touch(cache_key)
+            return entry["content"]
+
+        if not response.ok:
+            if raise_for_status:
+                response.raise_for_status()
+            return self._extract_text(body)
+        content = self._extract_text(body)
+        self.cache.set(cache_key, content, {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified")
+        })
+        return content
+
+    def load_many(self, urls: List[str], max_workers: int = 16) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Fetch and extract many URLs concurrently over the pooled session.
+
+        Requests to the same host are limited to ``per_host_limit`` at a time.
+
+        Returns:
+            Tuple of ({url: text} for successful loads, {url: error message} for failures)
+        """
+        results = {}
+        failures = {}
+        unique_urls = list(dict.fromkeys(urls))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.load_data, url, True): url for url in unique_urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    results[url] = future.result()
+                except Exception as e:
+                    failures[url] = f"{type(e).__name__}: {e}"
+
+        return results, failures
+
+    def _host_semaphore(self, url) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc
+        with self._host_lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.BoundedSemaphore(self.per_host_limit)
+            return self._host_semaphores[host]
+
+    def _fetch(self, url, headers=None) -> Tuple[requests.Response, bytes]:
+        """GET a URL, streaming the body and truncating it at ``max_bytes``."""
+        with self._host_semaphore(url):
+            response = self.session.get(url, headers=headers, timeout=self.timeout, stream=True)
+            try:
+                body = bytearray()
+                for block in response.iter_content(chunk_size=64 * 1024):
+                    body.extend(block)
+                    if len(body) >= self.max_bytes:
+                        print(f"Warning: Response from {url} exceeded {self.max_bytes} bytes and was truncated")
+                        del body[self.max_bytes:]
+                        break
+            finally:
+                response.close()
+
+        return response, bytes(body)
+
+    def _extract_text(self, html):
+        return self.clean_string(self.extractor.extract(html))
 
     def clean_string(self, text):
         text = re.sub(r'\s+', ' ', text)
-        return text.strip()
\ No newline at end of file
+        return text.strip()
@@ -0,0 +1,129 @@
+# educhain/utils/math_solver.py
+
+import ast
+import math
+import operator
+from typing import Union
+
+MAX_EXPRESSION_LENGTH = 500
+MAX_EXPONENT = 1000
+MAX_FACTORIAL = 1000
+MAX_MAGNITUDE = 1e300
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+
+_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+def _factorial(n):
+    if n != int(n) or n < 0 or n > MAX_FACTORIAL:
+        raise ValueError(f"factorial() needs an integer between 0 and {MAX_FACTORIAL}")
+    return math.factorial(int(n))
+
+
+def _combinatoric(function):
+    def wrapper(n, k):
+        if n != int(n) or k != int(k) or not 0 <= n <= MAX_FACTORIAL:
+            raise ValueError(f"{function.__name__}() needs integers between 0 and {MAX_FACTORIAL}")
+        return function(int(n), int(k))
+    return wrapper
+
+
+def _log(x, base=math.e):
+    return math.log(x, base)
+
+
+_FUNCTIONS = {
+    "sqrt": math.sqrt, "cbrt": lambda x: math.copysign(abs(x) ** (1 / 3), x),
+    "exp": math.exp, "log": _log, "ln": math.log, "log10": math.log10, "log2": math.log2,
+    "sin": math.sin, "cos": math.cos, "tan": math.tan,
+    "asin": math.asin, "acos": math.acos, "atan": math.atan, "atan2": math.atan2,
+    "sinh": math.sinh, "cosh": math.cosh, "tanh": math.tanh,
+    "radians": math.radians, "degrees": math.degrees,
+    "abs": abs, "round": round, "floor": math.floor, "ceil": math.ceil,
+    "min": min, "max": max, "factorial": _factorial,
+    "comb": _combinatoric(math.comb), "perm": _combinatoric(math.perm),
+    "gcd": lambda a, b: math.gcd(int(a), int(b)), "lcm": lambda a, b: math.lcm(int(a), int(b)),
+    "hypot": math.hypot,
+}
+
+_CONSTANTS = {"pi": math.pi, "e": math.e, "tau": math.tau}
+
+
+def _normalize(expression: str) -> str:
+    expression = expression.strip().rstrip("=").strip()
+    for symbol, replacement in (("^", "**"), ("×", "*"), ("÷", "/"), ("−", "-"), ("π", "pi"), ("√", "sqrt")):
+        expression = expression.replace(symbol, replacement)
+    return expression
+
+
+def _evaluate_node(node) -> Union[int, float]:
+    if isinstance(node, ast.Expression):
+        return _evaluate_node(node.body)
+
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+
+    if isinstance(node, ast.Name) and node.id in _CONSTANTS:
+        return _CONSTANTS[node.id]
+
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        return _UNARY_OPERATORS[type(node.op)](_evaluate_node(node.operand))
+
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        left = _evaluate_node(node.left)
+        right = _evaluate_node(node.right)
+        if isinstance(node.op, ast.Pow) and abs(right) > MAX_EXPONENT:
+            raise ValueError(f"Exponent {right} exceeds the limit of {MAX_EXPONENT}")
+        result = _BINARY_OPERATORS[type(node.op)](left, right)
+        if isinstance(result, complex):
+            raise ValueError("Expression has no real value")
+        if abs(result) > MAX_MAGNITUDE:
+            raise ValueError("Expression result is too large")
+        return result
+
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+            and node.func.id in _FUNCTIONS and not node.keywords):
+        args = [_evaluate_node(arg) for arg in node.args]
+        return _FUNCTIONS[node.func.id](*args)
+
+    raise ValueError(f"Unsupported element in expression: {ast.dump(node)[:60]}")
+
+
+def evaluate_expression(expression: str) -> float:
+    """
+    Safely evaluate an arithmetic expression such as ``"(3 + 4) * sqrt(16) / 2"``.
+
+    Only numbers, the constants pi/e/tau, arithmetic operators and a whitelist of
+    math functions are allowed; exponents and factorials are capped so a hostile
+    expression cannot exhaust memory. Raises ValueError for anything else.
+    """
+    if not expression or not isinstance(expression, str):
+        raise ValueError("Empty expression")
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise ValueError("Expression is too long")
+
+    try:
+        tree = ast.parse(_normalize(expression), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid expression: {e.msg}")
+
+    try:
+        result = float(_evaluate_node(tree))
+    except (ArithmeticError, TypeError) as e:
+        raise ValueError(f"Could not evaluate expression: {e}")
+
+    if not math.isfinite(result):
+        raise ValueError("Expression does not evaluate to a finite number")
+    return result
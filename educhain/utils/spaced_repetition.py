@@ -0,0 +1,400 @@
+# educhain/utils/spaced_repetition.py
+
+import heapq
+import json
+import time
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+DAY_SECONDS = 86400
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+
+
+def sm2_update(
+    ease: np.ndarray,
+    interval: np.ndarray,
+    repetitions: np.ndarray,
+    quality: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized SM-2 step.
+
+    Args:
+        ease, interval (days), repetitions: Current card states
+        quality: Recall quality 0-5 (below 3 is a lapse)
+
+    Returns:
+        Tuple of (ease, interval in days, repetitions, lapsed mask)
+    """
+    quality = np.clip(np.asarray(quality, dtype=np.float32), 0, 5)
+    lapsed = quality < 3
+    repetitions = np.where(lapsed, 0, repetitions + 1)
+    interval = np.where(
+        lapsed | (repetitions == 1), 1.0,
+        np.where(repetitions == 2, 6.0, np.round(interval * ease))
+    ).astype(np.float32)
+    penalty = 5 - quality
+    ease = np.maximum(MIN_EASE, ease + 0.1 - penalty * (0.08 + penalty * 0.02)).astype(np.float32)
+    return ease, interval, repetitions, lapsed
+
+
+class SpacedRepetitionScheduler:
+    """
+    SM-2 review scheduler for many learners studying FlashcardSets.
+
+    Card state lives in compact NumPy arrays (about 28 bytes per learner-card). Enrolling a
+    learner in a deck reserves a contiguous block of slots, one per card, and the same block
+    of the ``heap`` array holds an indexed min-heap of those cards keyed by due time. So:
+
+    - next_cards is O(k log k) for the k cards returned, without scanning the deck
+    - review is O(log n) for a deck of n cards
+    - review_many updates states vectorized and re-sorts each touched block once
+
+    Times are Unix timestamps in seconds.
+
+    Example:
+        scheduler = SpacedRepetitionScheduler()
+        scheduler.enroll("alice", flashcard_set)
+        for card in scheduler.next_cards("alice", flashcard_set.title, k=5):
+            show(flashcard_set.flashcards[card])
+            scheduler.review("alice", flashcard_set.title, card, quality=4)
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._size = 0
+        self._allocate_states(capacity)
+        self._enrollments: Dict[Tuple[Hashable, Hashable], int] = {}
+        self._enrollment_keys: List[Tuple[Hashable, Hashable]] = []
+        self._base = np.zeros(64, dtype=np.int64)
+        self._count = np.zeros(64, dtype=np.int32)
+
+    def _allocate_states(self, capacity: int) -> None:
+        self.due = np.zeros(capacity, dtype=np.int64)
+        self.interval = np.zeros(capacity, dtype=np.float32)
+        self.ease = np.full(capacity, INITIAL_EASE, dtype=np.float32)
+        self.repetitions = np.zeros(capacity, dtype=np.uint16)
+        self.lapses = np.zeros(capacity, dtype=np.uint16)
+        # heap[base + i] = card at heap position i; position[base + card] = its heap position
+        self.heap = np.zeros(capacity, dtype=np.int32)
+        self.position = np.zeros(capacity, dtype=np.int32)
+
+    def _reserve(self, extra: int) -> int:
+        """Grow the state arrays (doubling) to fit ``extra`` more slots; returns the first new slot."""
+        needed = self._size + extra
+        if needed > len(self.due):
+            capacity = max(needed, 2 * len(self.due))
+            for name in ("due", "interval", "ease", "repetitions", "lapses", "heap", "position"):
+                old = getattr(self, name)
+                new = np.zeros(capacity, dtype=old.dtype)
+                if name == "ease":
+                    new[:] = INITIAL_EASE
+                new[:self._size] = old[:self._size]
+                setattr(self, name, new)
+        start = self._size
+        self._size = needed
+        return start
+
+    @property
+    def num_states(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (self.due, self.interval, self.ease, self.repetitions, self.lapses, self.heap, self.position)
+        return sum(array[:self._size].nbytes for array in arrays) + self._base.nbytes + self._count.nbytes
+
+    # Enrollment
+    def enroll(self, learner_id: Hashable, deck: Any, deck_id: Optional[Hashable] = None, start: Optional[float] = None) -> int:
+        """
+        Start a learner on a deck: every card becomes due at ``start`` (now by default), in deck order.
+
+        Args:
+            learner_id: Any hashable learner id
+            deck: A FlashcardSet or the number of cards
+            deck_id: Deck id; defaults to the FlashcardSet title
+
+        Returns:
+            Enrollment id (also accepted wherever a learner/deck pair is)
+        """
+        return self.enroll_many([learner_id], deck, deck_id, start)[0]
+
+    def enroll_many(
+        self,
+        learner_ids: Sequence[Hashable],
+        deck: Any,
+        deck_id: Optional[Hashable] = None,
+        start: Optional[float] = None
+    ) -> List[int]:
+        """Enroll many learners in the same deck with one allocation. Already enrolled learners are kept as they are."""
+        num_cards = len(deck.flashcards) if hasattr(deck, "flashcards") else int(deck)
+        if deck_id is None:
+            if not hasattr(deck, "title"):
+                raise ValueError("deck_id is required when deck is a card count")
+            deck_id = deck.title
+        start = int(time.time() if start is None else start)
+
+        ids = []
+        new_learners = []
+        for learner_id in learner_ids:
+            key = (learner_id, deck_id)
+            if key in self._enrollments:
+                ids.append(self._enrollments[key])
+                continue
+            if num_cards == 0:
+                raise ValueError("Cannot enroll in an empty deck")
+            enrollment = len(self._enrollment_keys)
+            self._enrollments[key] = enrollment
+            self._enrollment_keys.append(key)
+            new_learners.append(enrollment)
+            ids.append(enrollment)
+
+        if not new_learners:
+            return ids
+
+        first_slot = self._reserve(len(new_learners) * num_cards)
+        if len(self._enrollment_keys) > len(self._base):
+            capacity = max(len(self._enrollment_keys), 2 * len(self._base))
+            self._base = np.resize(self._base, capacity)
+            self._count = np.resize(self._count, capacity)
+        new_learners = np.asarray(new_learners)
+        self._base[new_learners] = first_slot + np.arange(len(new_learners), dtype=np.int64) * num_cards
+        self._count[new_learners] = num_cards
+
+        slots = slice(first_slot, self._size)
+        cards = np.tile(np.arange(num_cards, dtype=np.int32), len(new_learners))
+        # Stagger new cards by a second (all due by ``start``) so they come up in deck order;
+        # sorted order is a valid heap
+        self.due[slots] = start - num_cards + cards
+        self.heap[slots] = cards
+        self.position[slots] = cards
+        return ids
+
+    def enrollment_id(self, learner_id: Hashable, deck_id: Hashable) -> int:
+        try:
+            return self._enrollments[(learner_id, deck_id)]
+        except KeyError:
+            raise ValueError(f"Learner {learner_id!r} is not enrolled in deck {deck_id!r}") from None
+
+    def _resolve(self, learner_or_enrollment: Union[Hashable, int], deck_id: Optional[Hashable]) -> int:
+        return learner_or_enrollment if deck_id is None else self.enrollment_id(learner_or_enrollment, deck_id)
+
+    # Selection
+    def next_cards(
+        self,
+        learner_id: Hashable,
+        deck_id: Optional[Hashable] = None,
+        k: int = 1,
+        now: Optional[float] = None
+    ) -> List[int]:
+        """
+        Up to ``k`` cards (deck indices) that are due at ``now``, most overdue first.
+        Pass an enrollment id and no deck_id to skip the id lookup.
+        """
+        enrollment = self._resolve(learner_id, deck_id)
+        base, count = int(self._base[enrollment]), int(self._count[enrollment])
+        now = int(time.time() if now is None else now)
+        heap, due = self.heap, self.due
+
+        result = []
+        frontier = [(int(due[base + heap[base]]), 0)]
+        while frontier and len(result) < k:
+            card_due, index = heapq.heappop(frontier)
+            if card_due > now:
+                break
+            result.append(int(heap[base + index]))
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < count:
+                    heapq.heappush(frontier, (int(due[base + heap[base + child]]), child))
+        return result
+
+    def next_due_at(self, learner_id: Hashable, deck_id: Optional[Hashable] = None) -> int:
+        """Timestamp at which the learner's next card becomes due."""
+        enrollment = self._resolve(learner_id, deck_id)
+        base = int(self._base[enrollment])
+        return int(self.due[base + self.heap[base]])
+
+    def due_count(self, learner_id: Hashable, deck_id: Optional[Hashable] = None, now: Optional[float] = None) -> int:
+        """Number of due cards (a vectorized pass over this learner's block only)."""
+        enrollment = self._resolve(learner_id, deck_id)
+        base, count = int(self._base[enrollment]), int(self._count[enrollment])
+        now = int(time.time() if now is None else now)
+        return int(np.count_nonzero(self.due[base:base + count] <= now))
+
+    def card_state(self, learner_id: Hashable, deck_id: Optional[Hashable], card: int) -> Dict[str, Any]:
+        slot = self._slot(self._resolve(learner_id, deck_id), card)
+        return {
+            "due": int(self.due[slot]),
+            "interval_days": float(self.interval[slot]),
+            "ease": float(self.ease[slot]),
+            "repetitions": int(self.repetitions[slot]),
+            "lapses": int(self.lapses[slot])
+        }
+
+    def _slot(self, enrollment: int, card: int) -> int:
+        if not 0 <= card < self._count[enrollment]:
+            raise ValueError(f"Card {card} is out of range for a deck of {self._count[enrollment]}")
+        return int(self._base[enrollment]) + card
+
+    # Reviews
+    def review(
+        self,
+        learner_id: Hashable,
+        deck_id: Optional[Hashable],
+        card: int,
+        quality: int,
+        reviewed_at: Optional[float] = None
+    ) -> int:
+        """Record one review (quality 0-5) and return the card's next due time. O(log n)."""
+        enrollment = self._resolve(learner_id, deck_id)
+        slot = self._slot(enrollment, card)
+        reviewed_at = int(time.time() if reviewed_at is None else reviewed_at)
+
+        ease, interval, repetitions, lapsed = sm2_update(
+            self.ease[slot:slot + 1], self.interval[slot:slot + 1], self.repetitions[slot:slot + 1], [quality]
+        )
+        self.ease[slot], self.interval[slot], self.repetitions[slot] = ease[0], interval[0], repetitions[0]
+        self.lapses[slot] += int(lapsed[0])
+        self.due[slot] = reviewed_at + int(interval[0] * DAY_SECONDS)
+
+        self._sift(int(self._base[enrollment]), int(self._count[enrollment]), int(self.position[slot]))
+        return int(self.due[slot])
+
+    def _sift(self, base: int, count: int, index: int) -> None:
+        """Restore the heap property around ``index`` after its key changed."""
+        heap, position, due = self.heap, self.position, self.due
+        card = int(heap[base + index])
+        key = (int(due[base + card]), card)
+
+        while index > 0:  # up
+            parent = (index - 1) // 2
+            parent_card = int(heap[base + parent])
+            if (int(due[base + parent_card]), parent_card) <= key:
+                break
+            heap[base + index] = parent_card
+            position[base + parent_card] = index
+            index = parent
+
+        while True:  # down
+            child = 2 * index + 1
+            if child >= count:
+                break
+            child_card = int(heap[base + child])
+            child_key = (int(due[base + child_card]), child_card)
+            if child + 1 < count:
+                right_card = int(heap[base + child + 1])
+                right_key = (int(due[base + right_card]), right_card)
+                if right_key < child_key:
+                    child, child_card, child_key = child + 1, right_card, right_key
+            if key <= child_key:
+                break
+            heap[base + index] = child_card
+            position[base + child_card] = index
+            index = child
+
+        heap[base + index] = card
+        position[base + card] = index
+
+    def review_many(
+        self,
+        learner_ids: Sequence[Hashable],
+        deck_ids: Optional[Sequence[Hashable]],
+        cards: Sequence[int],
+        qualities: Sequence[int],
+        reviewed_at: Optional[Sequence[float]] = None
+    ) -> None:
+        """
+        Ingest a batch of reviews.
+
+        States are updated with vectorized SM-2 (repeat reviews of one card are applied in
+        time order), then the heap of every touched enrollment is rebuilt with one sort.
+
+        Args:
+            learner_ids: Learner per review, or enrollment ids when ``deck_ids`` is None
+            deck_ids: Deck per review (or None, see above)
+            cards: Card index per review
+            qualities: Recall quality 0-5 per review
+            reviewed_at: Timestamp per review; defaults to now
+        """
+        if deck_ids is None:
+            enrollments = np.asarray(learner_ids, dtype=np.int64)
+        else:
+            lookup = self._enrollments
+            try:
+                enrollments = np.fromiter(
+                    (lookup[key] for key in zip(learner_ids, deck_ids)), dtype=np.int64, count=len(learner_ids)
+                )
+            except KeyError as e:
+                raise ValueError(f"Not enrolled: {e.args[0]!r}") from None
+        if len(enrollments) == 0:
+            return
+
+        cards = np.asarray(cards, dtype=np.int64)
+        if ((cards < 0) | (cards >= self._count[enrollments])).any():
+            raise ValueError("Card index out of range for its deck")
+        slots = self._base[enrollments] + cards
+        qualities = np.asarray(qualities)
+        times = (np.full(len(slots), int(time.time()), dtype=np.int64) if reviewed_at is None
+                 else np.asarray(reviewed_at, dtype=np.int64))
+
+        # Apply repeat reviews of the same card in order, one vectorized wave at a time
+        order = np.lexsort((times, slots))
+        slots, qualities, times = slots[order], qualities[order], times[order]
+        first = np.r_[True, slots[1:] != slots[:-1]]
+        group_start = np.maximum.accumulate(np.where(first, np.arange(len(slots)), 0))
+        wave = np.arange(len(slots)) - group_start
+
+        for w in range(int(wave.max()) + 1):
+            mask = wave == w
+            wave_slots = slots[mask]
+            ease, interval, repetitions, lapsed = sm2_update(
+                self.ease[wave_slots], self.interval[wave_slots], self.repetitions[wave_slots], qualities[mask]
+            )
+            self.ease[wave_slots] = ease
+            self.interval[wave_slots] = interval
+            self.repetitions[wave_slots] = repetitions
+            self.lapses[wave_slots] += lapsed.astype(np.uint16)
+            self.due[wave_slots] = times[mask] + (interval * DAY_SECONDS).astype(np.int64)
+
+        self._rebuild_heaps(np.unique(enrollments))
+
+    def _rebuild_heaps(self, enrollments: np.ndarray) -> None:
+        """Re-sort the blocks of ``enrollments`` by (due, card); a sorted block is a valid heap."""
+        counts = self._count[enrollments].astype(np.int64)
+        bases = self._base[enrollments]
+        segment = np.repeat(np.arange(len(enrollments)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        slots = bases[segment] + offsets
+
+        order = np.lexsort((offsets, self.due[slots], segment))
+        sorted_cards = offsets[order].astype(np.int32)
+        self.heap[slots] = sorted_cards
+        self.position[bases[segment] + sorted_cards] = offsets.astype(np.int32)
+
+    # Persistence
+    def save(self, path: str) -> None:
+        """Write all states and enrollments to a compressed .npz file (ids must be JSON-serializable)."""
+        n = self._size
+        m = len(self._enrollment_keys)
+        np.savez_compressed(
+            path,
+            due=self.due[:n], interval=self.interval[:n], ease=self.ease[:n],
+            repetitions=self.repetitions[:n], lapses=self.lapses[:n],
+            heap=self.heap[:n], position=self.position[:n],
+            base=self._base[:m], count=self._count[:m],
+            enrollment_keys=np.array(json.dumps([list(key) for key in self._enrollment_keys]))
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "SpacedRepetitionScheduler":
+        data = np.load(path)
+        scheduler = cls(capacity=max(1, len(data["due"])))
+        scheduler._size = len(data["due"])
+        for name in ("due", "interval", "ease", "repetitions", "lapses", "heap", "position"):
+            getattr(scheduler, name)[:scheduler._size] = data[name]
+        scheduler._base = data["base"].copy()
+        scheduler._count = data["count"].copy()
+        scheduler._enrollment_keys = [tuple(key) for key in json.loads(str(data["enrollment_keys"]))]
+        scheduler._enrollments = {key: i for i, key in enumerate(scheduler._enrollment_keys)}
+        return scheduler
@@ -0,0 +1,121 @@
+# educhain/utils/table_renderer.py
+
+import html
+import io
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+HEADER_FILL = "#f2f2f2"
+STRIPE_FILL = "#fafafa"
+BORDER_COLOR = "#d0d0d0"
+FONT_FAMILY = "DejaVu Sans, Arial, sans-serif"
+FONT_SIZE = 13
+CHAR_WIDTH = 7.5  # average glyph width at FONT_SIZE, in px
+ROW_HEIGHT = 26
+CELL_PADDING = 10
+
+
+def table_rows(data: Sequence[Dict[str, Any]]) -> Tuple[List[str], List[List[str]]]:
+    """Return (column names in first-seen order, rows of cell strings) for a list of row dicts."""
+    columns = []
+    for row in data or []:
+        for key in row:
+            if key not in columns:
+                columns.append(key)
+    if not columns:
+        raise ValueError("Table visual has no data")
+    rows = [["" if row.get(column) is None else str(row.get(column)) for column in columns] for row in data]
+    return [str(column) for column in columns], rows
+
+
+def _column_widths(columns: List[str], rows: List[List[str]]) -> List[float]:
+    return [
+        max(len(cell) for cell in [column] + [row[i] for row in rows]) * CHAR_WIDTH + 2 * CELL_PADDING
+        for i, column in enumerate(columns)
+    ]
+
+
+def render_table_svg(data: Sequence[Dict[str, Any]], title: Optional[str] = None) -> bytes:
+    """Emit an SVG table directly as markup, without any plotting library."""
+    columns, rows = table_rows(data)
+    widths = _column_widths(columns, rows)
+    title_height = ROW_HEIGHT + 8 if title else 0
+    width = max(sum(widths), len(title or "") * CHAR_WIDTH * 1.2) + 2
+    height = title_height + ROW_HEIGHT * (len(rows) + 1) + 2
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" height="{height:.0f}" '
+        f'viewBox="0 0 {width:.0f} {height:.0f}" font-family="{FONT_FAMILY}" font-size="{FONT_SIZE}">',
+        f'<rect width="100%" height="100%" fill="white"/>'
+    ]
+    if title:
+        parts.append(
+            f'<text x="{width / 2:.1f}" y="{ROW_HEIGHT - 4}" text-anchor="middle" '
+            f'font-size="{FONT_SIZE + 3}" font-weight="bold">{html.escape(title)}</text>'
+        )
+
+    for row_index, cells in enumerate([columns] + rows):
+        y = title_height + 1 + row_index * ROW_HEIGHT
+        fill = HEADER_FILL if row_index == 0 else (STRIPE_FILL if row_index % 2 == 0 else "white")
+        weight = ' font-weight="bold"' if row_index == 0 else ""
+        x = 1.0
+        for cell, cell_width in zip(cells, widths):
+            parts.append(
+                f'<rect x="{x:.1f}" y="{y}" width="{cell_width:.1f}" height="{ROW_HEIGHT}" '
+                f'fill="{fill}" stroke="{BORDER_COLOR}"/>'
+                f'<text x="{x + CELL_PADDING:.1f}" y="{y + ROW_HEIGHT * 0.68:.1f}"{weight}>{html.escape(cell)}</text>'
+            )
+            x += cell_width
+
+    parts.append('</svg>')
+    return "".join(parts).encode('utf-8')
+
+
+def render_table_png(data: Sequence[Dict[str, Any]], title: Optional[str] = None, dpi: int = 100) -> bytes:
+    """Draw a table with matplotlib's object-oriented API, sized to its content."""
+    columns, rows = table_rows(data)
+    widths = _column_widths(columns, rows)
+    title_height = ROW_HEIGHT + 8 if title else 0
+    width_px = max(sum(widths), len(title or "") * CHAR_WIDTH * 1.2) + 2
+    height_px = title_height + ROW_HEIGHT * (len(rows) + 1) + 2
+
+    figure = Figure(figsize=(width_px / 100, height_px / 100), dpi=dpi)
+    FigureCanvasAgg(figure)
+    ax = figure.add_axes((0, 0, 1, 1 - title_height / height_px))
+    ax.axis("off")
+
+    table = ax.table(
+        cellText=rows,
+        colLabels=columns,
+        colWidths=[w / width_px for w in widths],
+        cellLoc="left",
+        loc="upper left",
+        bbox=(0, 0, sum(widths) / width_px, 1)
+    )
+    table.auto_set_font_size(False)
+    table.set_fontsize(FONT_SIZE * 72 / 100)  # px at 100 dpi -> points
+    for (row_index, _), cell in table.get_celld().items():
+        cell.set_edgecolor(BORDER_COLOR)
+        if row_index == 0:
+            cell.set_facecolor(HEADER_FILL)
+            cell.get_text().set_fontweight("bold")
+        elif row_index % 2 == 0:
+            cell.set_facecolor(STRIPE_FILL)
+
+    if title:
+        figure.suptitle(title, y=1 - 4 / height_px, va="top", fontsize=(FONT_SIZE + 3) * 72 / 100, fontweight="bold")
+
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png")
+    return buffer.getvalue()
+
+
+def render_table_html(data: Sequence[Dict[str, Any]], title: Optional[str] = None) -> str:
+    """Emit an HTML table, e.g. for notebooks or web front ends that style tables themselves."""
+    columns, rows = table_rows(data)
+    caption = f"<caption>{html.escape(title)}</caption>" if title else ""
+    header = "".join(f"<th>{html.escape(column)}</th>" for column in columns)
+    body = "".join("<tr>" + "".join(f"<td>{html.escape(cell)}</td>" for cell in row) + "</tr>" for row in rows)
+    return f"<table>{caption}<thead><tr>{header}</tr></thead><tbody>{body}</tbody></table>"
@@ -0,0 +1,105 @@
+# educhain/utils/transcripts.py
+
+from typing import Any, Dict, List, Tuple, Union
+import requests
+from requests.adapters import HTTPAdapter
+from youtube_transcript_api import YouTubeTranscriptApi
+
+Snippets = List[Dict[str, Any]]
+
+
+class TranscriptProvider:
+    """
+    Source of timed video transcripts.
+
+    ``fetch`` returns ``([{"text": ..., "start": ..., "duration": ...}, ...], language_code)``
+    and raises ValueError when no transcript can be found. Implementations must be safe to
+    call from several threads at once.
+    """
+
+    def fetch(self, video_id: str, target_language: str = 'en') -> Tuple[Snippets, str]:
+        raise NotImplementedError
+
+
+class YouTubeTranscriptProvider(TranscriptProvider):
+    """Fetch transcripts from YouTube over one shared, pooled HTTP session."""
+
+    def __init__(self, pool_size: int = 16, proxy_config=None):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        self.api = YouTubeTranscriptApi(proxy_config=proxy_config, http_client=session)
+
+    def fetch(self, video_id: str, target_language: str = 'en') -> Tuple[Snippets, str]:
+        available_languages = []
+        try:
+            transcript_list = self.api.list(video_id)
+
+            available_languages = [transcript.language_code for transcript in transcript_list]
+
+            if not available_languages:
+                raise ValueError("No transcripts available for this video")
+
+            try:
+                transcript = transcript_list.find_transcript([target_language])
+                return transcript.fetch().to_raw_data(), target_language
+            except:
+                transcript = transcript_list.find_transcript(available_languages)
+                original_language = transcript.language_code
+
+                if transcript.is_translatable and target_language != original_language:
+                    translated = transcript.translate(target_language)
+                    return translated.fetch().to_raw_data(), target_language
+
+                return transcript.fetch().to_raw_data(), original_language
+
+        except Exception as e:
+            error_message = str(e).lower()
+            if "transcriptsdisabled" in error_message:
+                raise ValueError(
+                    "This video does not have subtitles/closed captions enabled. "
+                    "Available languages: " + ", ".join(available_languages)
+                )
+            elif "notranscriptfound" in error_message:
+                raise ValueError(
+                    f"No transcript found for language '{target_language}'. "
+                    f"Available languages: {', '.join(available_languages)}"
+                )
+            else:
+                raise ValueError(f"Error fetching transcript: {str(e)}")
+
+
+class LocalTranscriptProvider(TranscriptProvider):
+    """
+    Serve transcripts from memory, e.g. in tests or offline runs.
+
+    Args:
+        transcripts: Maps video ids to either a list of snippet dicts or plain text.
+            Plain text is split into lines spaced ``seconds_per_line`` apart.
+        language: Language code reported for every transcript
+        seconds_per_line: Synthetic duration of each line of plain-text transcripts
+    """
+
+    def __init__(
+        self,
+        transcripts: Dict[str, Union[str, Snippets]],
+        language: str = 'en',
+        seconds_per_line: float = 5.0
+    ):
+        self.transcripts = transcripts
+        self.language = language
+        self.seconds_per_line = seconds_per_line
+
+    def fetch(self, video_id: str, target_language: str = 'en') -> Tuple[Snippets, str]:
+        if video_id not in self.transcripts:
+            raise ValueError(f"No transcript found for video '{video_id}'")
+
+        transcript = self.transcripts[video_id]
+        if isinstance(transcript, str):
+            lines = [line for line in transcript.splitlines() if line.strip()]
+            transcript = [
+                {"text": line, "start": i * self.seconds_per_line, "duration": self.seconds_per_line}
+                for i, line in enumerate(lines)
+            ]
+        return [dict(snippet) for snippet in transcript], self.language
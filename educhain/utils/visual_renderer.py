@@ -0,0 +1,299 @@
+# educhain/utils/visual_renderer.py
+
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from educhain.utils.table_renderer import render_table_png, render_table_svg
+
+DEFAULT_FIGSIZE = (10, 8)
+DEFAULT_DPI = 100
+FORMATS = ("png", "svg")
+# Below this many charts, render_graphs renders in-process by default (a chart takes ~50-100 ms,
+# while starting a process pool takes longer than rendering a few charts)
+MIN_CHARTS_FOR_POOL = 8
+RENDER_CACHE_SIZE = 256
+
+_render_cache: "OrderedDict[Tuple, bytes]" = OrderedDict()
+_render_cache_lock = threading.Lock()
+
+
+def _as_dict(instruction: Any) -> Dict[str, Any]:
+    return instruction.dict() if hasattr(instruction, 'dict') else dict(instruction)
+
+
+def instruction_hash(instruction: Any) -> str:
+    """Content hash of a GraphInstruction: identical charts get identical hashes."""
+    canonical = json.dumps(_as_dict(instruction), sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def render_graph(
+    instruction: Any,
+    format: str = "png",
+    figsize: Tuple[float, float] = DEFAULT_FIGSIZE,
+    dpi: int = DEFAULT_DPI,
+    use_cache: bool = True
+) -> bytes:
+    """
+    Render a GraphInstruction (or its dict) to PNG or SVG bytes without touching pyplot.
+
+    Uses a standalone Figure on the Agg canvas, so it is safe to call from worker
+    threads or processes and never opens a window or notebook display. Results are
+    kept in a small in-memory LRU cache keyed by the instruction's content hash, so
+    re-rendering an unchanged chart is free.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unsupported image format: {format}. Use one of {FORMATS}")
+
+    instruction = _as_dict(instruction)
+    if not use_cache:
+        return _render(instruction, format, figsize, dpi)
+
+    key = (instruction_hash(instruction), format, tuple(figsize), dpi)
+    with _render_cache_lock:
+        if key in _render_cache:
+            _render_cache.move_to_end(key)
+            return _render_cache[key]
+
+    data = _render(instruction, format, figsize, dpi)
+
+    with _render_cache_lock:
+        _render_cache[key] = data
+        while len(_render_cache) > RENDER_CACHE_SIZE:
+            _render_cache.popitem(last=False)
+    return data
+
+
+def clear_render_cache() -> None:
+    with _render_cache_lock:
+        _render_cache.clear()
+
+
+def _render(instruction: Dict[str, Any], format: str, figsize: Tuple[float, float], dpi: int) -> bytes:
+    chart_type = instruction.get("type")
+
+    if chart_type == "table":
+        if format == "svg":
+            return render_table_svg(instruction.get("data"), title=instruction.get("title"))
+        return render_table_png(instruction.get("data"), title=instruction.get("title"), dpi=dpi)
+
+    figure = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+
+    if chart_type == "bar":
+        ax.bar(instruction["x_labels"], instruction["y_values"], color="skyblue")
+        ax.set_xlabel("Categories", fontsize=12)
+        ax.set_ylabel(instruction.get("y_label") or "", fontsize=12)
+        ax.grid(axis="y", linestyle="--", alpha=0.7)
+
+    elif chart_type == "line":
+        y_values = instruction["y_values"]
+        if y_values and isinstance(y_values[0], list):
+            labels = instruction.get("labels") or [None] * len(y_values)
+            for label, y_vals in zip(labels, y_values):
+                ax.plot(instruction["x_labels"], y_vals, marker="o", linestyle="-", label=label)
+            ax.legend()
+        else:
+            ax.plot(instruction["x_labels"], y_values, marker="o", linestyle="-", color="b")
+        ax.set_xlabel("X-axis", fontsize=12)
+        ax.set_ylabel(instruction.get("y_label") or "", fontsize=12)
+        ax.grid(axis="y", linestyle="--", alpha=0.7)
+
+    elif chart_type == "pie":
+        ax.pie(
+            instruction["sizes"],
+            labels=instruction.get("labels"),
+            autopct="%1.1f%%",
+            startangle=90,
+            colors=matplotlib.colormaps["Paired"].colors
+        )
+
+    elif chart_type == "scatter":
+        ax.scatter(instruction["x_values"], instruction["y_values"], color="r", alpha=0.7)
+        ax.set_xlabel("X-axis", fontsize=12)
+        ax.set_ylabel(instruction.get("y_label") or "", fontsize=12)
+        ax.grid(axis="both", linestyle="--", alpha=0.7)
+
+    else:
+        raise ValueError(f"Unsupported visualization type: {chart_type}")
+
+    ax.set_title(instruction.get("title") or "", fontsize=14)
+    figure.tight_layout()
+
+    buffer = io.BytesIO()
+    if format == "svg":
+        # Keep text as <text> elements (much smaller than glyph paths) and make the
+        # output byte-for-byte reproducible for identical instructions
+        with matplotlib.rc_context({"svg.fonttype": "none", "svg.hashsalt": "educhain"}):
+            figure.savefig(buffer, format="svg", metadata={"Date": None})
+    else:
+        figure.savefig(buffer, format="png")
+    return buffer.getvalue()
+
+
+def _render_job(job) -> Union[bytes, str, None]:
+    """Worker for render_graphs: render one chart, optionally writing it to ``path``."""
+    instruction, format, figsize, dpi, path = job
+    if instruction is None:
+        return None
+    try:
+        data = render_graph(instruction, format=format, figsize=figsize, dpi=dpi, use_cache=False)
+    except Exception as e:
+        print(f"Error generating visualization: {e}")
+        return None
+    if path is None:
+        return data
+    with open(path, 'wb') as f:
+        f.write(data)
+    return path
+
+
+def render_graphs(
+    instructions: Sequence[Any],
+    format: str = "png",
+    output_dir: Optional[Union[str, Path]] = None,
+    max_workers: Optional[int] = None,
+    figsize: Tuple[float, float] = DEFAULT_FIGSIZE,
+    dpi: int = DEFAULT_DPI
+) -> List[Union[bytes, str, None]]:
+    """
+    Render many GraphInstructions in a process pool.
+
+    Args:
+        instructions: GraphInstruction models or dicts
+        format: "png" or "svg"
+        output_dir: When set, charts are written here as chart_<n>.<format> and paths are
+            returned instead of bytes (avoids shipping image bytes between processes)
+        max_workers: Worker processes. By default batches smaller than MIN_CHARTS_FOR_POOL
+            render in-process and larger ones use the CPU count. 1 renders in-process.
+
+    Returns:
+        Image bytes or file paths in input order; None for charts that failed to render.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unsupported image format: {format}. Use one of {FORMATS}")
+
+    paths = [None] * len(instructions)
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+        paths = [str(Path(output_dir) / f"chart_{i}.{format}") for i in range(len(instructions))]
+
+    jobs = [
+        (_as_dict(instruction) if instruction is not None else None, format, figsize, dpi, path)
+        for instruction, path in zip(instructions, paths)
+    ]
+
+    if max_workers is None:
+        max_workers = 1 if len(jobs) < MIN_CHARTS_FOR_POOL else min(os.cpu_count() or 1, len(jobs))
+    if max_workers == 1 or len(jobs) <= 1:
+        return [_render_job(job) for job in jobs]
+
+    chunksize = max(1, len(jobs) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_render_job, jobs, chunksize=chunksize))
+
+
+class ChartAssetStore:
+    """
+    Content-addressed directory of rendered charts.
+
+    Each chart is stored once under ``<root>/<id[:2]>/<id>.<format>``, where the id is
+    derived from the GraphInstruction plus the render settings. Identical instructions
+    map to the same file, so a question bank can reference charts by id instead of
+    carrying inline base64 images.
+
+    Args:
+        root_dir: Directory holding the chart files
+        format: "svg" (default, small and resolution independent) or "png"
+        figsize: Figure size in inches
+        dpi: Resolution for png output (also scales svg dimensions)
+    """
+
+    def __init__(
+        self,
+        root_dir: Union[str, Path],
+        format: str = "svg",
+        figsize: Tuple[float, float] = (6, 4.5),
+        dpi: int = DEFAULT_DPI
+    ):
+        if format not in FORMATS:
+            raise ValueError(f"Unsupported image format: {format}. Use one of {FORMATS}")
+        self.root_dir = Path(root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self.format = format
+        self.figsize = tuple(figsize)
+        self.dpi = dpi
+
+    def asset_id(self, instruction: Any) -> str:
+        settings = f"{self.format}:{self.figsize[0]}x{self.figsize[1]}@{self.dpi}"
+        return hashlib.sha256(f"{instruction_hash(instruction)}:{settings}".encode('utf-8')).hexdigest()[:32]
+
+    def path_for(self, asset_id: str) -> Path:
+        return self.root_dir / asset_id[:2] / f"{asset_id}.{self.format}"
+
+    def __contains__(self, asset_id: str) -> bool:
+        return self.path_for(asset_id).exists()
+
+    def get(self, asset_id: str) -> bytes:
+        return self.path_for(asset_id).read_bytes()
+
+    def put(self, instruction: Any) -> str:
+        """Render and store one chart unless it is already stored. Returns its asset id."""
+        return self.put_many([instruction], max_workers=1)[0]
+
+    def put_many(self, instructions: Sequence[Any], max_workers: Optional[int] = None) -> List[Optional[str]]:
+        """
+        Store many charts, rendering each distinct missing chart once (in a process pool for large batches).
+
+        Returns:
+            Asset ids in input order; None for missing instructions or charts that failed to render.
+        """
+        ids = [self.asset_id(instruction) if instruction is not None else None for instruction in instructions]
+
+        missing = {}
+        for asset_id, instruction in zip(ids, instructions):
+            if asset_id is not None and asset_id not in missing and asset_id not in self:
+                missing[asset_id] = instruction
+
+        if missing:
+            rendered = render_graphs(
+                list(missing.values()), format=self.format,
+                max_workers=max_workers, figsize=self.figsize, dpi=self.dpi
+            )
+            failed = set()
+            for asset_id, data in zip(missing, rendered):
+                if data is None:
+                    failed.add(asset_id)
+                else:
+                    self._write(asset_id, data)
+            ids = [None if asset_id in failed else asset_id for asset_id in ids]
+
+        return ids
+
+    def store_questions(self, questions: Any, max_workers: Optional[int] = None) -> Any:
+        """Store the charts of a VisualMCQList (or list of VisualMCQ) and set each question's ``chart_id``."""
+        items = questions.questions if hasattr(questions, 'questions') else questions
+        ids = self.put_many([question.graph_instruction for question in items], max_workers=max_workers)
+        for question, asset_id in zip(items, ids):
+            question.chart_id = asset_id
+        return questions
+
+    def _write(self, asset_id: str, data: bytes) -> None:
+        path = self.path_for(asset_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
@@ -23,7 +23,6 @@
         "chromadb",
         "protobuf",
         "pillow",
-        "dataframe-image",
         "pandas",
         "ipython",
         "matplotlib",
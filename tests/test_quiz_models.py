@@ -0,0 +1,34 @@
+from educhain.models.quiz_models import QuizQuestion
+
+
+def make_question(options, answer):
+    return QuizQuestion(question="Q", options=options, answer=answer, difficulty="medium")
+
+
+def test_numeric_option_text_wins_over_option_number():
+    question = make_question(["3", "5", "7", "9"], "3")
+    assert question.is_correct("3")
+    assert question.is_correct(" 3 ")
+    assert not question.is_correct("7")
+    assert not question.is_correct("2")
+
+
+def test_option_number_when_no_option_matches():
+    question = make_question(["10", "20", "30"], "30")
+    assert question.is_correct("3")
+    assert question.is_correct("30")
+    assert not question.is_correct("1")
+
+
+def test_single_letter_option_text_wins_over_option_letter():
+    question = make_question(["b", "a", "c"], "a")
+    assert question.is_correct("a")
+    assert question.is_correct("A")
+    assert not question.is_correct("b")
+
+
+def test_option_letter_when_no_option_matches():
+    question = make_question(["Paris", "Rome"], "Rome")
+    assert question.is_correct("b")
+    assert question.is_correct("rome")
+    assert not question.is_correct("A")